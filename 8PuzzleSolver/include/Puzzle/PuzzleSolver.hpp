@@ -2,6 +2,7 @@
 #include "PuzzleState.hpp"
 #include "Heuristics.hpp"
 #include "SearchStats.hpp"
+#include "SearchLimits.hpp"
 #include <queue>
 #include <unordered_set>
 
@@ -20,7 +21,12 @@ namespace Puzzle {
             }
         };
 
-        std::vector<State> solve(const State& initial);
+        /**
+         * @brief       Solves the puzzle with A* and the Manhattan distance.
+         * @details     When a limit of `limits` is hit, returns the path to the expanded state closest
+         *              to the goal; `getStats().status()` tells why the search stopped.
+         */
+        std::vector<State> solve(const State& initial, const SearchLimits& limits = {});
         
     private:
         SearchStats stats;
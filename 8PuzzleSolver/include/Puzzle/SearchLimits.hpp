@@ -0,0 +1,86 @@
+#pragma once
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <optional>
+
+namespace Puzzle {
+    /**
+     * @brief       Tells why a solver returned.
+     */
+    enum class SearchStatus {
+        Solved,         ///< A goal state was found
+        Exhausted,      ///< The frontier emptied without reaching a goal
+        Timeout,        ///< The deadline passed
+        NodeLimit,      ///< The maximum number of expansions was reached
+        MemoryLimit,    ///< The frontier outgrew its memory limit
+        Cancelled       ///< The cancellation flag was set
+    };
+
+    inline const char* toString(SearchStatus status) {
+        switch (status) {
+            case SearchStatus::Solved:      return "solved";
+            case SearchStatus::Exhausted:   return "exhausted";
+            case SearchStatus::Timeout:     return "timeout";
+            case SearchStatus::NodeLimit:   return "node_limit";
+            case SearchStatus::MemoryLimit: return "memory_limit";
+            case SearchStatus::Cancelled:   return "cancelled";
+        }
+        return "unknown";
+    }
+
+    /**
+     * @brief       Time, node and memory budget with cooperative cancellation for the solvers.
+     * @details     A default-constructed `SearchLimits` is unbounded. Solvers only call `check()` every
+     *              `check_every` expansions, so the clock and the cancellation flag are read rarely.
+     */
+    struct SearchLimits {
+        using Clock = std::chrono::steady_clock;
+
+        std::optional<Clock::time_point> deadline;          ///< Wall-clock deadline
+        size_t max_expansions = 0;                          ///< Maximum expanded nodes, 0 for unbounded
+        size_t max_frontier_bytes = 0;                      ///< Maximum frontier size in bytes, 0 for unbounded
+        const std::atomic<bool>* cancelled = nullptr;       ///< Cancels the search when set
+        size_t check_every = 1024;                          ///< Expansions between two checks
+
+        /**
+         * @brief       Creates limits whose deadline is `timeout` from now.
+         */
+        static SearchLimits withTimeout(std::chrono::duration<double> timeout) {
+            SearchLimits limits;
+            limits.deadline = Clock::now() + std::chrono::duration_cast<Clock::duration>(timeout);
+            return limits;
+        }
+
+        /**
+         * @brief       Whether the solver should call `check()` after `expansions` expansions.
+         */
+        bool due(size_t expansions) const {
+            return expansions % check_every == 0;
+        }
+
+        /**
+         * @brief       Returns the status the solver must stop with, if any limit is exceeded.
+         * 
+         * @param       expansions
+         *              The number of nodes expanded so far.
+         * @param       frontier_bytes
+         *              The size of the frontier in bytes.
+         */
+        std::optional<SearchStatus> check(size_t expansions, size_t frontier_bytes) const {
+            if (cancelled != nullptr && cancelled->load(std::memory_order_relaxed)) {
+                return SearchStatus::Cancelled;
+            }
+            if (deadline && Clock::now() >= *deadline) {
+                return SearchStatus::Timeout;
+            }
+            if (max_expansions != 0 && expansions >= max_expansions) {
+                return SearchStatus::NodeLimit;
+            }
+            if (max_frontier_bytes != 0 && frontier_bytes > max_frontier_bytes) {
+                return SearchStatus::MemoryLimit;
+            }
+            return std::nullopt;
+        }
+    };
+} // namespace Puzzle
@@ -5,6 +5,7 @@
 #include <vector>
 
 #include "PuzzleState.hpp"
+#include "SearchLimits.hpp"
 
 
 namespace Puzzle {
@@ -19,6 +20,7 @@ namespace Puzzle {
         // Metrics updates
         void nodeExpanded(double heuristic_value);
         void updateMaxQueueSize(size_t current_size);
+        void setStatus(SearchStatus s) { search_status = s; }
         
         // Reporting
         void print() const;
@@ -31,6 +33,7 @@ namespace Puzzle {
         double initialHeuristic() const { return initial_h; }
         double averageHeuristic() const { return total_heuristic / expanded_nodes; }
         size_t maxQueueSize() const { return max_queue_size; }
+        SearchStatus status() const { return search_status; }
 
         void setInitialHeuristic(double h) { initial_h = h; }
 
@@ -55,6 +58,7 @@ namespace Puzzle {
         double total_heuristic = 0.0;
         double initial_h = 0.0;
         size_t max_queue_size = 0;
+        SearchStatus search_status = SearchStatus::Exhausted;
         
         // Timing
         TimePoint start_time;
@@ -1,10 +1,11 @@
 #pragma once
 #include "PuzzleState.hpp"
 #include "SearchStats.hpp"
+#include "SearchLimits.hpp"
 
 namespace Puzzle {
     class BFSSolver {
     public:
-        SearchStats solve(const State& initialState);
+        SearchStats solve(const State& initialState, const SearchLimits& limits = {});
     };
 } // namespace Puzzle
\ No newline at end of file
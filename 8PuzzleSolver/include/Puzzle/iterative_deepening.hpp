@@ -1,11 +1,12 @@
 #pragma once
 #include "PuzzleState.hpp"
 #include "SearchStats.hpp"
+#include "SearchLimits.hpp"
 
 namespace Puzzle {
     class IDSolver {
     public:
-        SearchStats solve(const State& initialState);
+        SearchStats solve(const State& initialState, const SearchLimits& limits = {});
     
 
     private:
@@ -4,29 +4,54 @@
 #include <algorithm>
 
 namespace Puzzle {
-    std::vector<State> Solver::solve(const State& initial) {
+    std::vector<State> Solver::solve(const State& initial, const SearchLimits& limits) {
         PriorityQueue open;
         std::unordered_map<State, int, StateHash> costSoFar;
         std::unordered_map<State, State, StateHash> cameFrom;
 
+        // Reconstructs the path from the initial state to `target`
+        auto reconstruct = [&](const State& target) {
+            std::vector<State> path;
+            State currentState = target;
+            while (cameFrom.find(currentState) != cameFrom.end()) {
+                path.push_back(currentState);
+                currentState = cameFrom[currentState];
+            }
+            path.push_back(initial);
+            std::reverse(path.begin(), path.end());
+            return path;
+        };
+
+        stats = SearchStats();
+        stats.startTimer();
+        stats.setInitialHeuristic(Heuristics::manhattanDistance(initial));
+
         open.push({initial, 0, Heuristics::manhattanDistance(initial)});
         costSoFar[initial] = 0;
+        Node best = open.top();
 
         while (!open.empty()) {
             const Node current = open.top();
             open.pop();
 
             if (current.state.isGoal()) {
-                // Reconstruct path
-                std::vector<State> path;
-                State currentState = current.state;
-                while (cameFrom.find(currentState) != cameFrom.end()) {
-                    path.push_back(currentState);
-                    currentState = cameFrom[currentState];
+                stats.setStatus(SearchStatus::Solved);
+                stats.stopTimer();
+                return reconstruct(current.state);
+            }
+
+            stats.nodeExpanded(current.heuristic);
+            stats.updateMaxQueueSize(open.size());
+            if (current.heuristic < best.heuristic) {
+                best = current;
+            }
+
+            if (limits.due(stats.expandedNodes())) {
+                if (auto stop = limits.check(stats.expandedNodes(), open.size() * sizeof(Node))) {
+                    stats.setStatus(*stop);
+                    stats.stopTimer();
+                    return reconstruct(best.state);
                 }
-                path.push_back(initial);
-                std::reverse(path.begin(), path.end());
-                return path;
             }
 
             for (const auto& neighbor : current.state.getNeighbors()) {
@@ -40,6 +65,7 @@ namespace Puzzle {
             }
         }
         
+        stats.stopTimer();
         return {}; // No solution
     }
 }
\ No newline at end of file
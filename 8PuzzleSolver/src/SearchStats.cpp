@@ -32,7 +32,8 @@ namespace Puzzle {
                 << "Search time:     " << search_time.count() << "s\n"
                 << "Initial heuristic: " << initial_h << "\n"
                 << "Average heuristic: " << averageHeuristic() << "\n"
-                << "Max queue size:  " << max_queue_size << "\n";
+                << "Max queue size:  " << max_queue_size << "\n"
+                << "Status:          " << toString(search_status) << "\n";
     }
 
     std::string SearchStats::csvHeader() const {
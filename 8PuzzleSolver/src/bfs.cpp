@@ -5,12 +5,13 @@
 #include <iostream>
 
 namespace Puzzle {
-    SearchStats BFSSolver::solve(const State& initialState) {
+    SearchStats BFSSolver::solve(const State& initialState, const SearchLimits& limits) {
         SearchStats stats;
         stats.startTimer();
         stats.setInitialHeuristic(Heuristics::manhattanDistance(initialState));
 
         if (initialState.isGoal()) {
+            stats.setStatus(SearchStatus::Solved);
             stats.stopTimer();
             return stats;
         }
@@ -30,9 +31,18 @@ namespace Puzzle {
             
             // Update statistics
             stats.nodeExpanded(Heuristics::manhattanDistance(current));
+
+            if (limits.due(stats.expandedNodes())) {
+                if (auto stop = limits.check(stats.expandedNodes(), open.size() * sizeof(State))) {
+                    stats.setStatus(*stop);
+                    stats.stopTimer();
+                    return stats;
+                }
+            }
             
             for (const auto& neighbor : current.getNeighbors()) {
                 if (neighbor.isGoal()) {
+                    stats.setStatus(SearchStatus::Solved);
                     stats.stopTimer();
                     return stats;
                 }
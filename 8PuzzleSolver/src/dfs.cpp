@@ -5,12 +5,13 @@
 #include <iostream>
 
 namespace Puzzle {
-    SearchStats DFSSolver::solve(const State& initialState) {
+    SearchStats DFSSolver::solve(const State& initialState, const SearchLimits& limits) {
         SearchStats stats;
         stats.startTimer();
         stats.setInitialHeuristic(Heuristics::manhattanDistance(initialState));
 
         if (initialState.isGoal()) {
+            stats.setStatus(SearchStatus::Solved);
             stats.stopTimer();
             return stats;
         };
@@ -31,8 +32,17 @@ namespace Puzzle {
             // Update statistics
             stats.nodeExpanded(Heuristics::manhattanDistance(current));
 
+            if (limits.due(stats.expandedNodes())) {
+                if (auto stop = limits.check(stats.expandedNodes(), open.size() * sizeof(State))) {
+                    stats.setStatus(*stop);
+                    stats.stopTimer();
+                    return stats;
+                }
+            }
+
             for (const auto& neighbor : current.getNeighbors()) {
                 if (neighbor.isGoal()) {
+                    stats.setStatus(SearchStatus::Solved);
                     stats.stopTimer();
                     return stats;
                 };
@@ -44,6 +54,7 @@ namespace Puzzle {
             };
         };
 
+        stats.stopTimer();
         return stats;
     };
 };
\ No newline at end of file
@@ -7,12 +7,13 @@
 
 namespace Puzzle {
 
-SearchStats IDSolver::solve(const State& initialState) {
+SearchStats IDSolver::solve(const State& initialState, const SearchLimits& limits) {
     SearchStats stats;
     stats.startTimer();
     stats.setInitialHeuristic(Heuristics::manhattanDistance(initialState));
 
     if (initialState.isGoal()) {
+        stats.setStatus(SearchStatus::Solved);
         stats.stopTimer();
         return stats;
     };
@@ -31,8 +32,17 @@ SearchStats IDSolver::solve(const State& initialState) {
         // Update statistics
         stats.nodeExpanded(Heuristics::manhattanDistance(current));
 
+        if (limits.due(stats.expandedNodes())) {
+            if (auto stop = limits.check(stats.expandedNodes(), open.size() * sizeof(State))) {
+                stats.setStatus(*stop);
+                stats.stopTimer();
+                return stats;
+            }
+        }
+
         for (const auto& neighbor : current.getNeighbors()) {
             if (neighbor.isGoal()) {
+                stats.setStatus(SearchStatus::Solved);
                 stats.stopTimer();
                 return stats;
             }
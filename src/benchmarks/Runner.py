@@ -0,0 +1,236 @@
+"""
+    src/benchmarks/Runner.py
+    Runs benchmark cases and reports their throughput, latency and memory as JSON.
+
+    Usage, from `src/`:
+        python -m benchmarks [--suite adjacency|sudoku|puzzle|bfs ...] [--quick] [--repeat N] [--output results.json]
+        python -m benchmarks --compare old.json new.json
+
+    Each case is run `warmup` times untimed, `repeat` times timed, then once more under `tracemalloc` for
+    its peak memory, so the allocation tracing does not distort the timings. A case reports the work it did
+    as `nodes` (expanded nodes for searches, edges for adjacency builds, boards for batches); `nodes_per_sec`
+    is the total of the timed runs over their total time.
+"""
+
+import  argparse;
+import  gc;
+import  json;
+import  math;
+import  os;
+import  platform;
+import  subprocess;
+import  time;
+import  tracemalloc;
+from    typing      import Any, Callable;
+
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)));
+
+__all__ = ["Case", "measure", "run", "compare", "main"];
+
+SUITES : tuple[str, ...] = ("adjacency", "sudoku", "puzzle", "bfs");
+
+
+class Case:
+    """
+    `Case` is one benchmark: `setup()` builds a list of inputs, untimed, and `run(input)` does the timed
+    work on one of them and returns the number of nodes it processed. Every input is timed separately, so
+    the latencies of a case are those of single inputs, e.g. single puzzles of a corpus.
+
+    Attributes:
+        suite (str): The suite of the case.
+        name (str): The name of the case, unique within its suite.
+        params (dict): The parameters of the case, reported with its results.
+    """
+    def __init__(self,  suite: str,
+                        name: str,
+                        run: Callable[[Any], int],
+                        setup: Callable[[], list[Any]] = lambda: [None],
+                        params: dict[str, Any] | None = None):
+        self.suite = suite;
+        self.name = name;
+        self.run = run;
+        self.setup = setup;
+        self.params = params or {};
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    """
+    Returns the `q`-th percentile (0 to 100, nearest rank) of `samples`, as `SearchStats.percentile`.
+    """
+    samples = sorted(samples);
+    return samples[max(1, math.ceil(q / 100 * len(samples))) - 1];
+
+
+def measure(case: Case, repeat: int = 5, warmup: int = 1) -> dict[str, Any]:
+    """
+    Runs a case and returns its results.
+
+    Parameters:
+        case (Case): The case to run.
+        repeat (int): The number of timed runs.
+        warmup (int): The number of untimed runs before them.
+
+    Returns:
+        dict: The suite, name and parameters of the case, its number of `inputs`, the `nodes` of all
+            its inputs, `nodes_per_sec`, the `p50_ms`, `p99_ms`, `min_ms` and `mean_ms` latencies of one
+            input, and `peak_bytes`, the peak memory traced while running the inputs.
+    """
+    inputs = case.setup();
+    for _ in range(warmup):
+        for data in inputs:
+            case.run(data);
+
+    latencies, nodes = [], 0;
+    gc.collect();
+    for _ in range(repeat):
+        nodes = 0;
+        for data in inputs:
+            start = time.perf_counter();
+            nodes += case.run(data);
+            latencies.append(time.perf_counter() - start);
+
+    gc.collect();
+    tracemalloc.start();
+    try:
+        for data in inputs:
+            case.run(data);
+        peak = tracemalloc.get_traced_memory()[1];
+    finally:
+        tracemalloc.stop();
+
+    total = sum(latencies);
+    return {
+        "suite": case.suite,
+        "name": case.name,
+        "params": case.params,
+        "inputs": len(inputs),
+        "repeat": repeat,
+        "nodes": nodes,
+        "nodes_per_sec": nodes * repeat / total if total > 0 else None,
+        "p50_ms": 1e3 * _percentile(latencies, 50),
+        "p99_ms": 1e3 * _percentile(latencies, 99),
+        "min_ms": 1e3 * min(latencies),
+        "mean_ms": 1e3 * total / len(latencies),
+        "peak_bytes": peak,
+    };
+
+
+def _metadata() -> dict[str, Any]:
+    """
+    Returns the environment of a run: interpreter, NumPy, machine and commit.
+    """
+    import numpy;
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=_SRC, capture_output=True, text=True,
+                                timeout=10).stdout.strip() or None;
+    except (OSError, subprocess.SubprocessError):
+        commit = None;
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    };
+
+
+def run(suites: list[str] | None = None,
+        quick: bool = False,
+        repeat: int = 5,
+        warmup: int = 1,
+        match: str | None = None,
+        progress: Callable[[dict[str, Any]], None] | None = None) -> dict[str, Any]:
+    """
+    Runs benchmark suites.
+
+    Parameters:
+        suites (list[str] | None): The suites to run, all of `SUITES` by default.
+        quick (bool): Use the small sizes and instances of every suite, for smoke runs.
+        repeat (int): The number of timed runs per case.
+        warmup (int): The number of untimed runs per case.
+        match (str | None): Only run the cases whose `suite/name` contains this string.
+        progress (Callable | None): Receives the results of every case as it completes.
+
+    Returns:
+        dict: `{"meta": ..., "results": [...]}`, the results being those of `measure`.
+
+    Raises:
+        ValueError: If a suite is unknown.
+    """
+    from benchmarks import Suites;
+    suites = list(SUITES) if not suites else suites;
+    unknown = set(suites) - set(SUITES);
+    if unknown:
+        raise ValueError(f"unknown suites {sorted(unknown)}, expected some of {SUITES}");
+    results = [];
+    for suite in suites:
+        for case in Suites.cases(suite, quick):
+            if match is not None and match not in f"{case.suite}/{case.name}":
+                continue;
+            result = measure(case, repeat, warmup);
+            results.append(result);
+            if progress is not None:
+                progress(result);
+    return {"meta": _metadata() | {"quick": quick, "repeat": repeat, "warmup": warmup}, "results": results};
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Compares two runs case by case.
+
+    Returns:
+        list[dict]: For every case in both runs, its `suite/name`, and the ratios new / old of its
+            `p50_ms` and `peak_bytes`, and of `nodes_per_sec` (above 1 is faster).
+    """
+    def ratio(a, b):
+        return b / a if a and b is not None else None;
+
+    before = {(r["suite"], r["name"]): r for r in old["results"]};
+    rows = [];
+    for r in new["results"]:
+        o = before.get((r["suite"], r["name"]));
+        if o is None:
+            continue;
+        rows.append({
+            "case": f"{r['suite']}/{r['name']}",
+            "p50": ratio(o["p50_ms"], r["p50_ms"]),
+            "nodes_per_sec": ratio(o["nodes_per_sec"], r["nodes_per_sec"]),
+            "peak_bytes": ratio(o["peak_bytes"], r["peak_bytes"]),
+        });
+    return rows;
+
+
+def _line(result: dict[str, Any]) -> str:
+    rate = result["nodes_per_sec"];
+    return (f"{result['suite'] + '/' + result['name']:<40} p50 {result['p50_ms']:10.3f}ms  p99 {result['p99_ms']:10.3f}ms  "
+            f"{rate if rate is not None else 0:14.0f} nodes/s  peak {result['peak_bytes'] / 2**20:8.2f}MiB");
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Runs the benchmark suites.");
+    parser.add_argument("--suite", action="append", choices=SUITES, help="a suite to run (repeatable, all by default)");
+    parser.add_argument("--quick", action="store_true", help="small sizes and instances only");
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case");
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per case");
+    parser.add_argument("--match", help="only cases whose suite/name contains this string");
+    parser.add_argument("--output", help="write the results to this JSON file");
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files");
+    args = parser.parse_args(argv);
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f);
+        with open(args.compare[1]) as f:
+            new = json.load(f);
+        for row in compare(old, new):
+            cells = "  ".join(f"{k} {v:6.2f}x" if v is not None else f"{k}    n/a" for k, v in row.items() if k != "case");
+            print(f"{row['case']:<40} {cells}");
+        return 0;
+
+    results = run(args.suite, args.quick, args.repeat, args.warmup, args.match, lambda r: print(_line(r), flush=True));
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2);
+    return 0;
@@ -0,0 +1,156 @@
+"""
+    src/benchmarks/Suites.py
+    The benchmark cases, by suite:
+        -   adjacency: `getAdjacencyList` and `getAdjacencyMatrix` on G(n, m) graphs of growing size, with
+            an average degree of 8. `nodes` counts edges;
+        -   sudoku: solvers over the graded puzzles of `data/sudoku_corpus.txt`, one case per solver and
+            grade, timed per puzzle, plus one batched propagation of the whole corpus. `nodes` counts
+            search nodes (boards for the batch);
+        -   puzzle: IDA* and RBFS on standard 8-puzzle instances, and IDA* on a 15-puzzle instance of
+            Korf's set cut off by an expansion budget. `nodes` counts expanded nodes;
+        -   bfs: `parallel_bfs` on a G(n, m) graph of average degree 16, with 1, 2 and 4 workers, to
+            measure its scaling (compare with the `cpus` of the run). The pools are started by the warmup
+            run, so only the levels are timed. `nodes` counts the edges of the graph.
+    Inputs are built from fixed seeds and bundled files, so runs at different commits are comparable.
+"""
+
+import  os;
+import  numpy as np;
+from    benchmarks.Runner   import Case;
+
+__all__ = ["cases", "load_sudoku_corpus"];
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data");
+
+SEED : int = 2026;
+
+
+def load_sudoku_corpus(path: str | None = None) -> list[tuple[str, str]]:
+    """
+    Returns the `(grade, puzzle)` pairs of a corpus file: one `grade puzzle` line per puzzle, the puzzle
+    as 81 digits with 0 for empty cells, and `#` comments.
+    """
+    with open(path or os.path.join(DATA, "sudoku_corpus.txt")) as f:
+        return [tuple(line.split()) for line in f if line.strip() and not line.startswith("#")];
+
+
+def cases(suite: str, quick: bool = False) -> list[Case]:
+    """
+    Returns the cases of a suite, the small ones only when `quick`.
+    """
+    return {"adjacency": _adjacency, "sudoku": _sudoku, "puzzle": _puzzle, "bfs": _bfs}[suite](quick);
+
+
+def _adjacency(quick: bool) -> list[Case]:
+    from model.GraphGenerators                  import gnm, to_graph;
+    from model.primitives.datatypes.TNode       import getAdjacencyList, getAdjacencyMatrix;
+
+    def graph(n: int):
+        return lambda: [to_graph(n, gnm(n, 4 * n, seed=SEED)).edges];
+
+    def build(function):
+        def run(edges) -> int:
+            function(edges);
+            return len(edges);
+        return run;
+
+    result = [];
+    for n in ((250, 500) if quick else (250, 500, 1000, 2000, 4000)):
+        result.append(Case("adjacency", f"list/{n}", build(getAdjacencyList),
+                           graph(n), {"nodes": n, "edges": 4 * n}));
+    for n in ((50, 100) if quick else (50, 100, 200, 400)):
+        result.append(Case("adjacency", f"matrix/{n}", build(getAdjacencyMatrix),
+                           graph(n), {"nodes": n, "edges": 4 * n}));
+    return result;
+
+
+def _sudoku(quick: bool) -> list[Case]:
+    from searching.sudoku.Board     import SudokuBoard;
+    from searching.sudoku           import Propagation;
+    from searching.CSP              import SudokuCSP, backtracking_search;
+
+    corpus = load_sudoku_corpus();
+    grades = list(dict.fromkeys(grade for grade, _ in corpus));
+
+    def boards(grade: str):
+        puzzles = [p for g, p in corpus if g == grade][:5 if quick else None];
+        return lambda: [SudokuBoard.from_string(p) for p in puzzles];
+
+    def propagation(board: SudokuBoard) -> int:
+        return Propagation.search(Propagation.candidate_masks(board.grid, board.n)[0], board.n)[1];
+
+    def csp(inference: str):
+        def solve(board: SudokuBoard) -> int:
+            return backtracking_search(SudokuCSP(board), inference=inference).iterations;
+        return solve;
+
+    def batch(grids: np.ndarray) -> int:
+        Propagation.solve_batch(grids);
+        return len(grids);
+
+    result = [];
+    for grade in grades:
+        result.append(Case("sudoku", f"propagation/{grade}", propagation, boards(grade), {"grade": grade}));
+        result.append(Case("sudoku", f"csp_mac/{grade}", csp("mac"), boards(grade), {"grade": grade}));
+        result.append(Case("sudoku", f"csp_forward/{grade}", csp("forward"), boards(grade), {"grade": grade}));
+    result.append(Case("sudoku", "propagation_batch", batch,
+                       lambda: [np.array([[int(c) for c in p] for _, p in corpus], dtype=np.uint8)],
+                       {"puzzles": len(corpus)}));
+    return result;
+
+
+def _puzzle(quick: bool) -> list[Case]:
+    from searching.puzzle.SlidingPuzzle     import SlidingPuzzle, p8_1, p8_hard, p15_korf_1;
+    from searching.PuzzleSearch             import ida_star, rbfs;
+    from searching.SearchStats              import SearchStats;
+    from searching.Budget                   import SearchBudget;
+    from searching.TranspositionTable       import TranspositionTable;
+
+    def search(algorithm, table: bool = False, max_expansions: int | None = None):
+        def solve(puzzle: SlidingPuzzle) -> int:
+            stats = SearchStats(algorithm.__name__);
+            kwargs = {"table": TranspositionTable(1 << 16)} if table else {};
+            budget = SearchBudget(max_expansions=max_expansions) if max_expansions is not None else None;
+            algorithm(puzzle, stats=stats, budget=budget, **kwargs);
+            return stats.expanded_nodes;
+        return solve;
+
+    def instance(*tiles: str):
+        return lambda: [SlidingPuzzle.from_string(t) for t in tiles];
+
+    limit = 20000 if quick else 500000;
+    result = [
+        Case("puzzle", "ida_star/8-puzzle", search(ida_star), instance(p8_1, p8_hard), {"instances": ["p8_1", "p8_hard"]}),
+        Case("puzzle", "ida_star_tt/8-puzzle", search(ida_star, table=True), instance(p8_1, p8_hard),
+             {"instances": ["p8_1", "p8_hard"], "table": 1 << 16}),
+        Case("puzzle", "ida_star/15-puzzle", search(ida_star, max_expansions=limit), instance(p15_korf_1),
+             {"instances": ["p15_korf_1"], "max_expansions": limit}),
+    ];
+    if not quick:
+        result.append(Case("puzzle", "rbfs/8-puzzle", search(rbfs), instance(p8_1, p8_hard),
+                           {"instances": ["p8_1", "p8_hard"]}));
+    return result;
+
+
+def _bfs(quick: bool) -> list[Case]:
+    from concurrent.futures         import ProcessPoolExecutor;
+    from model.GraphGenerators      import gnm, edge_array;
+    from model.GraphIO              import CSRGraph, csr_from_edges;
+    from model.ParallelBFS          import parallel_bfs;
+
+    n = 10**5 if quick else 10**6;
+
+    def graph(workers: int):
+        def setup():
+            csr = CSRGraph(*csr_from_edges(n, edge_array(gnm(n, 8 * n, seed=SEED))));
+            #   Shut down at exit; the pool of a finished case is idle meanwhile
+            return [(csr, ProcessPoolExecutor(max_workers=workers) if workers > 1 else None, workers)];
+        return setup;
+
+    def search(data) -> int:
+        csr, executor, workers = data;
+        parallel_bfs(csr, 0, max_workers=workers, executor=executor);
+        return len(csr.indices);
+
+    return [Case("bfs", f"parallel/{workers}", search, graph(workers), {"nodes": n, "edges": 8 * n, "workers": workers})
+            for workers in (1, 2, 4)];
@@ -0,0 +1,4 @@
+import  sys;
+from    benchmarks.Runner   import main;
+
+sys.exit(main());
@@ -1,7 +1,6 @@
-from    primitives.TGraphBuilder    import build_graph, create_node, create_edge;
-from    primitives.datatypes.TGraph import TGraph, TNode, TEdge;
-from    GraphUtils                  import ascii_nodes;
-from    functionals.GraphProtocols  import Sizeable, Parentable, UnionAssociative;
+from    .primitives.TGraphBuilder    import build_graph, create_node, create_edge;
+from    .primitives.datatypes.TGraph import TGraph, TNode, TEdge;
+from    .functionals.GraphProtocols  import Sizeable, Parentable, UnionAssociative;
 from    typing import Any, TypeVar
 
 __version__ = "1.0.0";
@@ -13,6 +12,9 @@ __import__ = "src.ConcreteDataTypes";
 class UAGraph(TGraph):
     """
     `UAGraph` is a `TGraph` graph that implements the `UnionAssociative` protocol.
+    
+    The operators work over NumPy arrays (see `GraphAlgebra`), imported on their first use, so that
+    importing the graph types does not import NumPy.
     """
     def __init__(self, nodes: set[TNode] = set(), edges: set[TEdge] = set()) -> None:
         super().__init__(nodes, edges);
@@ -20,9 +22,9 @@ class UAGraph(TGraph):
     
     def __add__(self, other: "UAGraph") -> "UAGraph":
         """
-        The `+` operator between two `UAGraph` graphs implements the
-        `UnionAssociative` protocol, which means that given two graphs, G1 and G2,
-        we have that G3 = G1 + G2 = G2 + G1.
+        The `+` operator between two `UAGraph` graphs is their disjoint union (see `GraphAlgebra.disjoint_union`):
+        the nodes are relabeled `0..V-1`, the nodes of `other` after those of `self`, and the original values
+        are kept in the `values` table of the result.
         
         Parameters
         ----------
@@ -36,33 +38,64 @@ class UAGraph(TGraph):
         
         Notes
         -----
-        The `+` operator is associative, meaning that G1 + (G2 + G3) = (G1 + G2) + G3 = G1 + (G3 + G2),
-        for all G1, G2, G3 of type `UAGraph`.
+        The `+` operator is associative up to relabeling, meaning that G1 + (G2 + G3) and (G1 + G2) + G3 are
+        the same graph, for all G1, G2, G3 of type `UAGraph`. To compose many graphs, `disjoint_union(*graphs)`
+        relabels all of them in a single pass.
         """
-        ascii_letters = ascii_nodes(len(self.nodes) + len(other.nodes));
-        nodes : set[TNode] = self.nodes + other.nodes;
-        edges : set[TEdge] = self.edges + other.edges;
-        
-        for i in range(1, len(nodes) + 1):
-            nodes[i-1].value = ascii_letters[i - 1].value;
-            nodes[i-1].id = i;
-        
-        return UAGraph(nodes, edges);
+        from .GraphAlgebra import disjoint_union;
+        return disjoint_union(self, other);
+    
+    def __radd__(self, other: Any) -> "UAGraph":
+        """
+        Lets `sum(graphs)` start from `0`.
+        """
+        from .GraphAlgebra import disjoint_union;
+        return disjoint_union(self) if other == 0 else disjoint_union(other, self);
     
     def __or__(self, other: "UAGraph") -> "UAGraph":
-        return self.__add__(other);
+        """
+        The `|` operator is the union of the graphs, nodes being identified by value (see `GraphAlgebra.union`).
+        """
+        from .GraphAlgebra import union;
+        return union(self, other);
+    
+    def __and__(self, other: "UAGraph") -> "UAGraph":
+        """
+        The `&` operator is the intersection of the graphs (see `GraphAlgebra.intersection`).
+        """
+        from .GraphAlgebra import intersection;
+        return intersection(self, other);
+    
+    def __sub__(self, other: "UAGraph") -> "UAGraph":
+        """
+        The `-` operator removes the edges of `other` from this graph (see `GraphAlgebra.difference`).
+        """
+        from .GraphAlgebra import difference;
+        return difference(self, other);
 #   Identifiers for interesting graphs
 ##  Empty Graph
-EmptyGraph  :   TGraph = build_graph(
+def __getattr__(name: str) -> Any:
+    """
+    Builds `EmptyGraph` on first access rather than on import, and keeps it as a module attribute.
+    """
+    if name == "EmptyGraph":
+        graph : TGraph = build_graph(
                     nodes = [],
                     edges = []
                 );
+        globals()[name] = graph;
+        return graph;
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}");
 
 ##  Complete Graphs Kn
 def Kn(n: int) -> TGraph:
     """
     Returns a complete graph of size n, Kn.
     
+    The nodes are `TNode(i, i)` for `i` in `0..n-1`, whatever `n`, so the values of `Kn(n)` have the same
+    type for every size; `GraphUtils.ascii_nodes` names small graphs by letters for display. The edges are
+    generated as an array by `GraphGenerators.complete`.
+    
     Parameters
     ----------
     n : int
@@ -72,9 +105,6 @@ def Kn(n: int) -> TGraph:
     ------
     ValueError
         If n < 0
-        
-    NotImplemented
-        If n > 26
     
     Returns
     -------
@@ -82,18 +112,12 @@ def Kn(n: int) -> TGraph:
         The complete graph of size n.
     """
     if n < 0:
-        raise ValueError("n must be greater than 0");
-    if n > 26:
-        raise NotImplemented("n must be less than 26");
-    
-    nodes : list[TNode] = ascii_nodes(n);
-    edges : list[TEdge] = [];
-    
-    for i in range(n):
-        for j in range(i + 1, n):
-            edges.append((nodes[i], nodes[j]));
+        raise ValueError("n must be non-negative");
     
-    return build_graph(nodes, edges);
+    from .GraphAlgebra    import from_arrays;
+    from .GraphGenerators import complete, edge_array;
+    nodes : list[TNode] = [TNode(i, i) for i in range(n)];
+    return from_arrays(nodes, edge_array(complete(n)));
 
 
 
@@ -170,8 +194,9 @@ def cast(graph: TGraph) -> UAGraph:
 if __name__ == "__main__":
     K3, K4 = Kn(3), Kn(4);
     K3, K4 = cast(K3), cast(K4);
-    K7 = K3 + K4;
+    G = K3 + K4;
     
-    print(K7.nodes);
-    print(K7.edges);
+    print(G.nodes, G.values, G.offsets);
+    print(G.edges);
+    print((K3 | K4).edges, (K4 & K3).edges, (K4 - K3).edges);
     
\ No newline at end of file
@@ -0,0 +1,226 @@
+""" src/model/GraphAlgebra.py
+Implements set operations between `TGraph` graphs over integer node and edge arrays.
+
+A graph is converted once to a list of nodes and an (E, 2) array of node ids (`to_arrays`). The operations
+then work on whole arrays: shifting the ids of each operand by an offset (disjoint union), or mapping them
+to the ids of a combined node table (union, intersection, difference), and comparing edges by their packed
+int64 keys (see `EdgeKeys`). Node values are never overwritten.
+
+Functions
+---------
+to_arrays(graph: TGraph) -> tuple[list[TNode], np.ndarray]
+    Returns the nodes of a graph and its edges as an array of node ids.
+
+from_arrays(nodes: list[TNode], edges: np.ndarray, cls: type = TGraph) -> TGraph
+    Builds a graph from a list of nodes and an array of node ids.
+
+disjoint_union(*graphs: TGraph) -> TGraph
+    Places the graphs side by side: nodes are relabeled `0..V-1`, and the original values are kept in a mapping table.
+
+union(*graphs: TGraph) -> TGraph
+    The graph of the nodes and edges of any of the graphs, nodes being identified by value.
+
+intersection(G: TGraph, H: TGraph) -> TGraph
+    The graph of the nodes and edges common to `G` and `H`.
+
+difference(G: TGraph, H: TGraph) -> TGraph
+    The nodes of `G` with the edges of `G` that are not in `H`.
+"""
+
+import numpy as np;
+
+from .primitives.datatypes.TGraph import TGraph, TNode;
+from .EdgeKeys                   import edge_set, edge_union, edge_intersection, edge_difference, unpack_edges;
+
+__all__ = ["to_arrays", "from_arrays", "disjoint_union", "union", "intersection", "difference"];
+
+
+def to_arrays(graph: TGraph) -> tuple[list[TNode], np.ndarray]:
+    """
+    Returns the nodes of `graph` and its edges as an (E, 2) int64 array of indices into the node list.
+    Endpoints of edges missing from `graph.nodes` are appended to the node list.
+
+    Parameters
+    ----------
+    graph : TGraph
+        The graph to convert.
+
+    Returns
+    -------
+    tuple[list[TNode], np.ndarray]
+        The nodes and the edges of the graph.
+    """
+    nodes : list[TNode] = list(graph.nodes);
+    index : dict = {node.value: i for i, node in enumerate(nodes)};
+
+    #   Fast path: every edge is a pair of known nodes
+    try:
+        pairs = [(index[u.value], index[v.value]) for u, v in graph.edges];
+        return nodes, np.array(pairs, dtype=np.int64).reshape(-1, 2);
+    except (KeyError, ValueError):
+        pass;
+
+    def node_id(node: TNode) -> int:
+        i = index.get(node.value);
+        if i is None:
+            i = index[node.value] = len(nodes);
+            nodes.append(node);
+        return i;
+
+    ids = np.fromiter((node_id(node) for u, v in graph.edges for node in (u, v)), dtype=np.int64);
+    return nodes, ids.reshape(-1, 2);
+
+def from_arrays(nodes: list[TNode], edges: np.ndarray, cls: type = TGraph) -> TGraph:
+    """
+    Builds a graph of type `cls` from a list of nodes and an (E, 2) array of indices into it.
+
+    Parameters
+    ----------
+    nodes : list[TNode]
+        The nodes of the graph.
+    edges : np.ndarray
+        The edges of the graph, as pairs of node indices.
+    cls : type, optional
+        The class of the graph. Defaults to `TGraph`.
+
+    Returns
+    -------
+    TGraph
+        The graph, with edges as tuples of nodes.
+    """
+    return cls(nodes, [(nodes[u], nodes[v]) for u, v in np.asarray(edges).tolist()]);
+
+def _merge(graphs: tuple[TGraph, ...]) -> tuple[list[TNode], list[np.ndarray], list[np.ndarray]]:
+    """
+    Maps the nodes of `graphs` to a combined node table, identifying nodes by value.
+
+    Returns
+    -------
+    tuple[list[TNode], list[np.ndarray], list[np.ndarray]]
+        The combined nodes (the first node met for each value), and for each graph, the combined ids of its
+        nodes and its edges.
+    """
+    nodes : list[TNode] = [];
+    index : dict = {};
+    ids, edges = [], [];
+    for graph in graphs:
+        own, own_edges = to_arrays(graph);
+        table = np.empty(len(own), dtype=np.int64);
+        for i, node in enumerate(own):
+            j = index.get(node.value);
+            if j is None:
+                j = index[node.value] = len(nodes);
+                nodes.append(node);
+            table[i] = j;
+        ids.append(table);
+        edges.append(table[own_edges]);
+    return nodes, ids, edges;
+
+def disjoint_union(*graphs: TGraph) -> TGraph:
+    """
+    Returns the disjoint union of `graphs`: the nodes of the i-th graph are relabeled by shifting their
+    ids by the number of nodes of the graphs before it, so nodes with equal values in different graphs
+    stay distinct. Runs in O(V + E).
+
+    The nodes of the result have their ids as values. The result also has
+        -   `values`: the list of the original node values, by id;
+        -   `offsets`: the (len(graphs) + 1,) array of the first id of each graph, so the nodes of the
+            i-th graph are `offsets[i]..offsets[i + 1] - 1`.
+
+    Parameters
+    ----------
+    *graphs : TGraph
+        The graphs. The result has the type of the first one (`TGraph` if there are none).
+
+    Returns
+    -------
+    TGraph
+        The disjoint union of the graphs.
+    """
+    values : list = [];
+    edges : list[np.ndarray] = [];
+    offsets = np.zeros(len(graphs) + 1, dtype=np.int64);
+    for i, graph in enumerate(graphs):
+        nodes, own_edges = to_arrays(graph);
+        edges.append(own_edges + offsets[i]);
+        #   Nodes of an earlier disjoint union have their ids as values: keep their original values
+        table = getattr(graph, "values", None);
+        if table is None:
+            values.extend(node.value for node in nodes);
+        else:
+            values.extend(table[node.value] for node in nodes);
+        offsets[i + 1] = offsets[i] + len(nodes);
+
+    nodes = [TNode(i, i) for i in range(len(values))];
+    result = from_arrays(nodes, np.concatenate(edges) if edges else np.empty((0, 2), dtype=np.int64),
+                         type(graphs[0]) if graphs else TGraph);
+    result.values = values;
+    result.offsets = offsets;
+    return result;
+
+def union(*graphs: TGraph) -> TGraph:
+    """
+    Returns the union of `graphs`: nodes with equal values are the same node (as `TNode.__eq__` has it),
+    and edges present in several graphs appear once.
+
+    Parameters
+    ----------
+    *graphs : TGraph
+        The graphs. The result has the type of the first one (`TGraph` if there are none).
+
+    Returns
+    -------
+    TGraph
+        The union of the graphs.
+    """
+    nodes, _, edges = _merge(graphs);
+    keys = edge_union(*(edge_set(own) for own in edges));
+    return from_arrays(nodes, unpack_edges(keys), type(graphs[0]) if graphs else TGraph);
+
+def intersection(G: TGraph, H: TGraph) -> TGraph:
+    """
+    Returns the intersection of `G` and `H`: the nodes whose values are in both graphs, and the edges
+    between them present in both graphs.
+
+    Parameters
+    ----------
+    G : TGraph
+        The first graph. The result has its type.
+    H : TGraph
+        The second graph.
+
+    Returns
+    -------
+    TGraph
+        The intersection of the graphs.
+    """
+    nodes, (g_ids, h_ids), (g_edges, h_edges) = _merge((G, H));
+    common = np.intersect1d(g_ids, h_ids, assume_unique=True);
+    edges = unpack_edges(edge_intersection(edge_set(g_edges), edge_set(h_edges)));
+
+    #   Renumber the common nodes 0..k-1
+    table = np.full(len(nodes), -1, dtype=np.int64);
+    table[common] = np.arange(len(common));
+    return from_arrays([nodes[i] for i in common.tolist()], table[edges], type(G));
+
+def difference(G: TGraph, H: TGraph) -> TGraph:
+    """
+    Returns the difference of `G` and `H`: the nodes of `G`, with the edges of `G` that are not in `H`.
+
+    Parameters
+    ----------
+    G : TGraph
+        The first graph. The result has its type.
+    H : TGraph
+        The graph whose edges are removed.
+
+    Returns
+    -------
+    TGraph
+        The difference of the graphs.
+    """
+    nodes, (g_ids, _), (g_edges, h_edges) = _merge((G, H));
+    edges = unpack_edges(edge_difference(edge_set(g_edges), edge_set(h_edges)));
+
+    #   The nodes of G come first in the combined table
+    return from_arrays(nodes[:int(g_ids.max()) + 1 if len(g_ids) else 0], edges, type(G));
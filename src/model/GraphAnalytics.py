@@ -0,0 +1,117 @@
+""" src/model/GraphAnalytics.py
+Implements bulk graph analytics over integer edge arrays: degrees, connected components and reachability.
+
+Every kernel takes the number of nodes `n` and an (E, 2) array of node ids `0..n-1`, as returned by
+`GraphAlgebra.to_arrays` or `GraphGenerators`, and runs a handful of NumPy operations over whole arrays,
+with no per-node Python call. Edges are undirected; self-loops and repeated edges do not count towards
+degrees, as in `getAdjacencyList`.
+
+Functions
+---------
+degrees(n: int, edges: np.ndarray) -> np.ndarray
+    The degree of every node.
+
+degree_histogram(n: int, edges: np.ndarray) -> np.ndarray
+    The number of nodes of each degree.
+
+connected_components(n: int, edges: np.ndarray) -> np.ndarray
+    The component label of every node, by array-based union-find.
+
+component_sizes(labels: np.ndarray) -> np.ndarray
+    The number of nodes of each component.
+
+reachable_counts(n: int, edges: np.ndarray) -> np.ndarray
+    The number of nodes reachable from every node.
+"""
+
+import numpy as np;
+
+from .EdgeKeys import edge_set, unpack_edges;
+
+__all__ = ["degrees", "degree_histogram", "connected_components", "component_sizes", "reachable_counts"];
+
+
+def _simple(n: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Returns the distinct undirected edges of `edges` without self-loops, as (min, max) rows.
+    """
+    edges = unpack_edges(edge_set(edges));
+    return edges[edges[:, 0] != edges[:, 1]];
+
+def degrees(n: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Returns the degree of every node: its number of distinct neighbors other than itself.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    edges : np.ndarray
+        The (E, 2) array of node ids.
+
+    Returns
+    -------
+    np.ndarray
+        The (n,) int64 degrees.
+    """
+    return np.bincount(_simple(n, edges).ravel(), minlength=n).astype(np.int64, copy=False);
+
+def degree_histogram(n: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Returns the (maxdegree + 1,) array of the number of nodes of each degree.
+    """
+    return np.bincount(degrees(n, edges));
+
+def connected_components(n: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Returns the component of every node, labeled by the smallest node id of the component.
+
+    Array-based union-find: every round hooks, for each edge whose endpoints have different roots, the
+    larger root under the smaller one (concurrent hooks of a root keep the smallest), then compresses all
+    paths at once by pointer jumping, `parent = parent[parent]`, until every node points to its root.
+    Edges whose endpoints share a root are dropped for the next rounds. Roots only ever point to smaller
+    ids, so no cycle can form.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    edges : np.ndarray
+        The (E, 2) array of node ids.
+
+    Returns
+    -------
+    np.ndarray
+        The (n,) int64 labels.
+    """
+    parent = np.arange(n, dtype=np.int64);
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2);
+    u, v = edges[:, 0], edges[:, 1];
+    while len(u):
+        pu, pv = parent[u], parent[v];
+        apart = pu != pv;
+        if not apart.any():
+            break;
+        u, v, pu, pv = u[apart], v[apart], pu[apart], pv[apart];
+        np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv));
+        while True:
+            grandparent = parent[parent];
+            if np.array_equal(grandparent, parent):
+                break;
+            parent = grandparent;
+    return parent;
+
+def component_sizes(labels: np.ndarray) -> np.ndarray:
+    """
+    Returns the (n,) array of the number of nodes labeled `i`, for every label `i` of `connected_components`
+    (0 for the ids that are not labels).
+    """
+    return np.bincount(labels, minlength=len(labels));
+
+def reachable_counts(n: int, edges: np.ndarray) -> np.ndarray:
+    """
+    Returns the (n,) array of the number of nodes reachable from every node, itself included: the size
+    of its component.
+    """
+    labels = connected_components(n, edges);
+    return component_sizes(labels)[labels];
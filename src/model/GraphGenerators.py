@@ -0,0 +1,343 @@
+""" src/model/GraphGenerators.py
+Implements generators of large graphs as NumPy edge arrays.
+
+Every generator returns an iterator over (k, 2) int64 arrays of node ids `0..n-1`, at most `chunk_size`
+edges each, so graphs too large to hold can be streamed to disk or to a consumer. `edge_array` concatenates
+the chunks, and `to_graph` builds a `TGraph` from them. Random generators take a `seed`: an int, a
+`np.random.Generator`, or None for fresh entropy.
+
+Functions
+---------
+complete(n: int) -> Iterator[np.ndarray]
+    The complete graph Kn.
+
+grid(shape: tuple[int, ...], periodic: bool = False) -> Iterator[np.ndarray]
+    The lattice of the given shape (a path, a grid, a cube grid...), optionally wrapped into a torus.
+
+gnp(n: int, p: float) -> Iterator[np.ndarray]
+    The Erdos-Renyi graph G(n, p): each pair is an edge with probability p.
+
+gnm(n: int, m: int) -> Iterator[np.ndarray]
+    The Erdos-Renyi graph G(n, m): m distinct edges drawn uniformly.
+
+random_regular(n: int, d: int) -> Iterator[np.ndarray]
+    A random d-regular graph.
+
+barabasi_albert(n: int, m: int) -> Iterator[np.ndarray]
+    A preferential attachment graph: each new node links to m nodes chosen with probability proportional to their degree.
+
+edge_array(chunks: Iterable[np.ndarray]) -> np.ndarray
+    Concatenates edge chunks.
+
+to_graph(n: int, edges: np.ndarray | Iterable[np.ndarray], cls: type = TGraph) -> TGraph
+    Builds a graph with the nodes `0..n-1` from edges or edge chunks.
+"""
+
+import numpy as np;
+
+from typing                         import Iterable, Iterator;
+from .primitives.datatypes.TGraph   import TGraph, TNode;
+from .GraphAlgebra                  import from_arrays;
+
+__all__ = ["complete", "grid", "gnp", "gnm", "random_regular", "barabasi_albert", "edge_array", "to_graph"];
+
+CHUNK_SIZE : int = 1 << 20;
+"""Default maximum number of edges per chunk."""
+
+type Seed = int | np.random.Generator | None;
+
+
+def _pairs(k: np.ndarray, n: int) -> np.ndarray:
+    """
+    Returns the (len(k), 2) pairs `(i, j)`, `i < j < n`, of the indices `k` in the row-major enumeration of pairs.
+    Row `i` starts at `i * (2n - i - 1) / 2`.
+    """
+    k = np.asarray(k, dtype=np.int64);
+    b = 2 * n - 1;
+    i = np.floor((b - np.sqrt(np.maximum(float(b) * b - 8.0 * k, 0.0))) / 2).astype(np.int64);
+    i = np.clip(i, 0, n - 2);
+    #   Correct the rounding errors of the square root
+    start = i * (b - i) // 2;
+    i = np.where(start > k, i - 1, i);
+    start = i * (b - i) // 2;
+    after = (i + 1) * (b - i - 1) // 2;
+    i = np.where(k >= after, i + 1, i);
+    start = i * (b - i) // 2;
+    return np.stack([i, k - start + i + 1], axis=1);
+
+def complete(n: int, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yields the edges `(i, j)`, `i < j`, of the complete graph Kn in row-major order.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    chunk_size : int, optional
+        The maximum number of edges per chunk.
+
+    Raises
+    ------
+    ValueError
+        If n < 0.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative");
+    total = n * (n - 1) // 2;
+    for lo in range(0, total, chunk_size):
+        yield _pairs(np.arange(lo, min(lo + chunk_size, total), dtype=np.int64), n);
+
+def grid(shape: tuple[int, ...] | int, periodic: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yields the edges of the lattice of the given shape, whose nodes are numbered in row-major order: each
+    node is linked to its successor along every axis.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...] | int
+        The number of nodes along each axis: `(n,)` is a path, `(rows, cols)` a grid.
+    periodic : bool, optional
+        Also link the last node of every line to the first one (a cycle, a torus...). Axes of
+        length 2 or less are not wrapped, which would duplicate edges or make self-loops.
+    chunk_size : int, optional
+        The maximum number of edges per chunk, at most `chunk_size / len(shape)` nodes being processed at a time.
+    """
+    shape = (shape,) if isinstance(shape, int) else tuple(shape);
+    n = int(np.prod(shape, dtype=np.int64));
+    strides = [int(np.prod(shape[axis + 1:], dtype=np.int64)) for axis in range(len(shape))];
+    step = max(1, chunk_size // max(1, len(shape)));
+    for lo in range(0, n, step):
+        ids = np.arange(lo, min(lo + step, n), dtype=np.int64);
+        coords = np.unravel_index(ids, shape);
+        parts = [];
+        for axis, (size, stride) in enumerate(zip(shape, strides)):
+            inner = coords[axis] < size - 1;
+            parts.append(np.stack([ids[inner], ids[inner] + stride], axis=1));
+            if periodic and size > 2:
+                last = ids[~inner];
+                parts.append(np.stack([last - (size - 1) * stride, last], axis=1));
+        edges = np.concatenate(parts) if parts else np.empty((0, 2), dtype=np.int64);
+        for start in range(0, len(edges), chunk_size):
+            yield edges[start:start + chunk_size];
+
+def gnp(n: int, p: float, seed: Seed = None, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yields the edges of an Erdos-Renyi G(n, p) graph, in row-major order. Instead of one coin per pair, the
+    gaps between consecutive edges are drawn from the geometric distribution (Batagelj and Brandes), so the
+    cost is proportional to the number of edges.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    p : float
+        The probability of each edge.
+    seed : int | np.random.Generator | None, optional
+        The seed of the random number generator.
+    chunk_size : int, optional
+        The maximum number of edges per chunk.
+
+    Raises
+    ------
+    ValueError
+        If p is not in [0, 1].
+    """
+    if not 0 <= p <= 1:
+        raise ValueError("p must be in [0, 1]");
+    if p == 1:
+        yield from complete(n, chunk_size);
+        return;
+    rng = np.random.default_rng(seed);
+    total = n * (n - 1) // 2;
+    position = -1;
+    while p > 0:
+        gaps = np.floor(np.log1p(-rng.random(chunk_size)) / np.log1p(-p)).astype(np.int64) + 1;
+        k = position + np.cumsum(gaps);
+        k = k[k < total];
+        if len(k):
+            yield _pairs(k, n);
+        if len(k) < chunk_size:
+            return;
+        position = int(k[-1]);
+
+def gnm(n: int, m: int, seed: Seed = None, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yields the edges of an Erdos-Renyi G(n, m) graph, in row-major order. The pairs are split into blocks,
+    the number of edges of each block is drawn from the multivariate hypergeometric distribution (binomial
+    approximation past 10^9 pairs), then the edges of each block are drawn without replacement, so only
+    one block is held at a time.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    m : int
+        The number of edges.
+    seed : int | np.random.Generator | None, optional
+        The seed of the random number generator.
+    chunk_size : int, optional
+        The approximate maximum number of edges per chunk.
+
+    Raises
+    ------
+    ValueError
+        If m is negative or greater than the number of pairs.
+    """
+    total = n * (n - 1) // 2;
+    if not 0 <= m <= total:
+        raise ValueError(f"m must be in [0, {total}]");
+    if m == 0:
+        return;
+    rng = np.random.default_rng(seed);
+    blocks = -(-m // chunk_size);
+    bounds = np.array([b * total // blocks for b in range(blocks + 1)], dtype=np.int64);
+    sizes = np.diff(bounds);
+    if total < 10**9:
+        counts = rng.multivariate_hypergeometric(sizes, m, method="marginals").tolist();
+    else:
+        #   Beyond the range of NumPy's hypergeometric sampler, draw each count from the binomial distribution
+        #   of the edges left over the pairs left, which is the hypergeometric one up to O(m / total)
+        counts, left, pairs = [], m, total;
+        for size in sizes.tolist():
+            count = min(size, int(rng.binomial(left, size / pairs))) if pairs > size else left;
+            counts.append(count);
+            left, pairs = left - count, pairs - size;
+    for lo, hi, count in zip(bounds[:-1].tolist(), bounds[1:].tolist(), counts):
+        if count:
+            yield _pairs(lo + np.sort(rng.choice(hi - lo, size=count, replace=False)), n);
+
+def random_regular(n: int, d: int, seed: Seed = None, chunk_size: int = CHUNK_SIZE, max_rounds: int = 100) -> Iterator[np.ndarray]:
+    """
+    Yields the edges of a random d-regular graph, drawn with the configuration model: `d` stubs per node are
+    paired at random. Stubs of self-loops and repeated edges are paired again, with the stubs of as many
+    random valid edges, until the graph is simple.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    d : int
+        The degree of every node.
+    seed : int | np.random.Generator | None, optional
+        The seed of the random number generator.
+    chunk_size : int, optional
+        The maximum number of edges per chunk.
+    max_rounds : int, optional
+        The maximum number of repairing rounds.
+
+    Raises
+    ------
+    ValueError
+        If `n * d` is odd or `d >= n`.
+    RuntimeError
+        If the graph is still not simple after `max_rounds` rounds.
+    """
+    if (n * d) % 2 or not 0 <= d < max(n, 1):
+        raise ValueError("n * d must be even and 0 <= d < n");
+    rng = np.random.default_rng(seed);
+    edges = rng.permutation(np.repeat(np.arange(n, dtype=np.int64), d)).reshape(-1, 2);
+    for _ in range(max_rounds):
+        edges.sort(axis=1);
+        keys = edges[:, 0] * n + edges[:, 1];
+        order = np.argsort(keys, kind="stable");
+        repeated = np.zeros(len(edges), dtype=bool);
+        repeated[order[1:]] = keys[order[1:]] == keys[order[:-1]];
+        bad = repeated | (edges[:, 0] == edges[:, 1]);
+        if not bad.any():
+            break;
+        #   Re-pair the bad stubs together with those of as many random good edges
+        good = np.flatnonzero(~bad);
+        redo = np.concatenate([np.flatnonzero(bad), rng.choice(good, size=min(len(good), int(bad.sum())), replace=False)]);
+        edges[redo] = rng.permutation(edges[redo].ravel()).reshape(-1, 2);
+    else:
+        raise RuntimeError(f"no simple {d}-regular graph found in {max_rounds} rounds");
+    for start in range(0, len(edges), chunk_size):
+        yield edges[start:start + chunk_size];
+
+def barabasi_albert(n: int, m: int, seed: Seed = None, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Yields the edges of a Barabasi-Albert preferential attachment graph: node `m` links to nodes `0..m-1`,
+    then each new node links to `m` distinct nodes, each drawn as a uniform endpoint of the edges so far,
+    that is with probability proportional to its degree.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    m : int
+        The number of edges of each new node.
+    seed : int | np.random.Generator | None, optional
+        The seed of the random number generator.
+    chunk_size : int, optional
+        The maximum number of edges per chunk.
+
+    Raises
+    ------
+    ValueError
+        If not `1 <= m < n`.
+    """
+    if not 1 <= m < n:
+        raise ValueError("m must satisfy 1 <= m < n");
+    rng = np.random.default_rng(seed);
+    ends : list[int] = [];
+    chunk : list[int] = [];
+    uniform : list[float] = [];
+    for v in range(m, n):
+        if v == m:
+            targets = set(range(m));
+        else:
+            targets = set();
+            while len(targets) < m:
+                if not uniform:
+                    uniform = rng.random(1 << 16).tolist();
+                targets.add(ends[int(uniform.pop() * len(ends))]);
+        for t in targets:
+            ends += (v, t);
+            chunk += (t, v);
+        if len(chunk) >= 2 * chunk_size:
+            yield np.array(chunk, dtype=np.int64).reshape(-1, 2);
+            chunk = [];
+    if chunk:
+        yield np.array(chunk, dtype=np.int64).reshape(-1, 2);
+
+def edge_array(chunks: Iterable[np.ndarray]) -> np.ndarray:
+    """
+    Concatenates edge chunks into one (E, 2) int64 array.
+    """
+    chunks = list(chunks);
+    return np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.int64);
+
+def to_graph(n: int, edges: np.ndarray | Iterable[np.ndarray], cls: type = TGraph) -> TGraph:
+    """
+    Builds a graph of type `cls` with the nodes `TNode(i, i)`, `0 <= i < n`, and the given edges.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    edges : np.ndarray | Iterable[np.ndarray]
+        An (E, 2) array of node ids, or the chunks of a generator.
+    cls : type, optional
+        The class of the graph. Defaults to `TGraph`.
+
+    Returns
+    -------
+    TGraph
+        The graph.
+    """
+    edges = edges if isinstance(edges, np.ndarray) else edge_array(edges);
+    return from_arrays([TNode(i, i) for i in range(n)], edges, cls);
+
+
+if __name__ == "__main__":
+    import time;
+
+    for name, chunks in [("complete(2000)", complete(2000)),
+                         ("grid((1000, 1000))", grid((1000, 1000))),
+                         ("gnp(10**6, 1e-5)", gnp(10**6, 1e-5, seed=0)),
+                         ("gnm(10**6, 5 * 10**6)", gnm(10**6, 5 * 10**6, seed=0)),
+                         ("random_regular(10**6, 4)", random_regular(10**6, 4, seed=0)),
+                         ("barabasi_albert(10**5, 3)", barabasi_albert(10**5, 3, seed=0))]:
+        start = time.perf_counter();
+        edges = edge_array(chunks);
+        print(f"{name}: {len(edges)} edges in {time.perf_counter() - start:.2f}s");
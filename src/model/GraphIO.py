@@ -0,0 +1,474 @@
+""" src/model/GraphIO.py
+Implements a binary on-disk format for graphs in compressed sparse row (CSR) form, and the conversion of
+text edge lists to it.
+
+A file holds a fixed-size header followed by 64-byte aligned sections:
+    -   `indptr`    : (n + 1,) int64, the neighbors of node `i` are `indices[indptr[i]:indptr[i + 1]]`;
+    -   `indices`   : (nnz,) int32, or int64 for graphs of 2^31 nodes or more;
+    -   `weights`   : (nnz,) float64, optional, the weight of each entry of `indices`;
+    -   node values, optional: a (n,) uint8 kind (0 for int, 1 for str), a (n + 1,) int64 offset table
+        and the UTF-8 text of every value.
+An undirected edge is stored in both rows. `load` maps the whole file with `numpy.memmap` and views the
+sections in place, so opening a graph takes constant time, whatever its size. Read-only maps of the same
+file are shared by the page cache between processes, and a `CSRGraph` is pickled as its path.
+
+Functions
+---------
+csr_from_edges(n: int, edges: np.ndarray, weights: np.ndarray | None = None, symmetric: bool = True) -> tuple
+    Builds the CSR arrays of a graph from an edge array.
+
+save(path: str, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray | None = None, values: list | None = None) -> None
+    Writes CSR arrays to a file.
+
+load(path: str) -> CSRGraph
+    Maps a file.
+
+write_graph(path: str, graph: TGraph) -> None
+    Writes a `TGraph`, with the values of its nodes.
+
+read_graph(path: str, cls: type = TGraph) -> TGraph
+    Reads a `TGraph`.
+
+convert_edge_list(source: str, path: str, ...) -> CSRGraph
+    Converts a text edge list to a file, streaming it in chunks.
+"""
+
+import io;
+import os;
+import struct;
+import tempfile;
+import numpy as np;
+
+from .primitives.datatypes.TGraph   import TGraph, TNode;
+from .GraphAlgebra                  import to_arrays, from_arrays;
+from .GraphAnalytics                import connected_components;
+
+__all__ = ["CSRGraph", "csr_from_edges", "save", "load", "write_graph", "read_graph", "convert_edge_list"];
+
+MAGIC   : bytes = b"TGRAPHCSR\x00";
+VERSION : int   = 1;
+
+_HEADER     = struct.Struct("<10sHIqqqqqqqqq");
+"""magic, version, index bytes, n, nnz, then the offsets of indptr, indices, weights, kinds, value offsets
+and value text, and the length of the value text (offsets are 0 for missing sections)."""
+_HEADER_SIZE    : int = 128;
+_ALIGN          : int = 64;
+
+
+class CSRGraph:
+    """
+    `CSRGraph` is a graph in CSR form, usually memory-mapped from a file by `load`.
+
+    Attributes
+    ----------
+    n : int
+        The number of nodes.
+    indptr : np.ndarray
+        The (n + 1,) row offsets.
+    indices : np.ndarray
+        The (nnz,) neighbors of all nodes.
+    weights : np.ndarray | None
+        The (nnz,) weights of the entries of `indices`.
+    path : str | None
+        The file the graph is mapped from.
+
+    Methods
+    -------
+    neighbors(i: int) -> np.ndarray
+        Returns the neighbors of node i.
+    degrees() -> np.ndarray
+        Returns the number of entries of every row.
+    maxdegree() -> int, mindegree() -> int
+        Return the largest and smallest number of entries of a row (the `Valency` protocol).
+    edges() -> np.ndarray
+        Returns the entries as `(row, column)` pairs.
+    components() -> np.ndarray
+        Returns the connected component of every node.
+    value(i: int) -> int | str
+        Returns the value of node i (i itself when the file has no value table).
+    adjacencyList() -> dict[int, list[int]]
+        Returns the adjacency list of the graph, with node ids as keys.
+    to_graph(cls: type = TGraph) -> TGraph
+        Builds the `TGraph` of the graph.
+    """
+    def __init__(self,  indptr: np.ndarray,
+                        indices: np.ndarray,
+                        weights: np.ndarray | None = None,
+                        kinds: np.ndarray | None = None,
+                        value_offsets: np.ndarray | None = None,
+                        value_text: np.ndarray | None = None,
+                        path: str | None = None) -> None:
+        self.n = len(indptr) - 1;
+        self.indptr = indptr;
+        self.indices = indices;
+        self.weights = weights;
+        self._kinds = kinds;
+        self._value_offsets = value_offsets;
+        self._value_text = value_text;
+        self.path = path;
+
+    def __len__(self) -> int:
+        return self.n;
+
+    def __reduce__(self):
+        #   Worker processes map the file again instead of receiving a copy of the arrays
+        if self.path is None:
+            return (CSRGraph, (self.indptr, self.indices, self.weights, self._kinds, self._value_offsets, self._value_text));
+        return (load, (self.path,));
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]];
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr);
+
+    def maxdegree(self) -> int:
+        return int(self.degrees().max()) if self.n else 0;
+
+    def mindegree(self) -> int:
+        return int(self.degrees().min()) if self.n else 0;
+
+    def edges(self) -> np.ndarray:
+        """
+        Returns the (nnz, 2) int64 array of the `(row, column)` pairs of the stored entries.
+        """
+        rows = np.repeat(np.arange(self.n, dtype=np.int64), self.degrees());
+        return np.stack([rows, np.asarray(self.indices, dtype=np.int64)], axis=1);
+
+    def components(self) -> np.ndarray:
+        """
+        Returns the component labels of the nodes (see `GraphAnalytics.connected_components`).
+        """
+        return connected_components(self.n, self.edges());
+
+    def value(self, i: int) -> int | str:
+        if self._kinds is None:
+            return i;
+        text = bytes(self._value_text[self._value_offsets[i]:self._value_offsets[i + 1]]).decode("utf-8");
+        return int(text) if self._kinds[i] == 0 else text;
+
+    def values(self) -> list[int | str]:
+        if self._kinds is None:
+            return list(range(self.n));
+        #   Offsets are in bytes: slice the encoded text, not the decoded one
+        data = bytes(self._value_text);
+        offsets = np.asarray(self._value_offsets).tolist();
+        return [int(data[a:b]) if k == 0 else data[a:b].decode("utf-8")
+                for k, a, b in zip(np.asarray(self._kinds).tolist(), offsets[:-1], offsets[1:])];
+
+    def adjacencyList(self) -> dict[int, list[int]]:
+        indices = np.asarray(self.indices).tolist();
+        indptr = np.asarray(self.indptr).tolist();
+        return {i: indices[indptr[i]:indptr[i + 1]] for i in range(self.n) if indptr[i] < indptr[i + 1]};
+
+    def to_graph(self, cls: type = TGraph) -> TGraph:
+        """
+        Builds the `TGraph` of the graph: one node per row, and one edge per pair of symmetric entries.
+        """
+        nodes = [TNode(v, i) for i, v in enumerate(self.values())];
+        edges = self.edges();
+        return from_arrays(nodes, edges[edges[:, 0] <= edges[:, 1]], cls);
+
+
+def _index_dtype(n: int) -> np.dtype:
+    return np.dtype(np.int32) if n < 2**31 else np.dtype(np.int64);
+
+def csr_from_edges(n: int,
+                   edges: np.ndarray,
+                   weights: np.ndarray | None = None,
+                   symmetric: bool = True) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """
+    Builds the CSR arrays of a graph from an edge array, with sorted rows.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    edges : np.ndarray
+        The (E, 2) array of node ids.
+    weights : np.ndarray | None, optional
+        The (E,) weights of the edges.
+    symmetric : bool, optional
+        Store every edge in the rows of both endpoints (undirected graphs). Defaults to True.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray | None]
+        The indptr, indices and weights arrays.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2);
+    rows, cols = edges[:, 0], edges[:, 1];
+    if symmetric:
+        loops = rows == cols;
+        rows, cols = np.concatenate([rows, cols[~loops]]), np.concatenate([cols, rows[~loops]]);
+        if weights is not None:
+            weights = np.concatenate([weights, np.asarray(weights)[~loops]]);
+    order = np.lexsort((cols, rows));
+    indptr = np.zeros(n + 1, dtype=np.int64);
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:]);
+    indices = cols[order].astype(_index_dtype(n));
+    return indptr, indices, None if weights is None else np.asarray(weights, dtype=np.float64)[order];
+
+def _layout(n: int, nnz: int, index_bytes: int, weighted: bool, text_bytes: int | None) -> list[int]:
+    """
+    Returns the offsets of the sections of a file (0 for missing sections), and the total size.
+    """
+    sizes = [8 * (n + 1), index_bytes * nnz, 8 * nnz if weighted else 0,
+             n if text_bytes is not None else 0, 8 * (n + 1) if text_bytes is not None else 0, text_bytes or 0];
+    present = [True, True, weighted, text_bytes is not None, text_bytes is not None, text_bytes is not None];
+    offsets, position = [], _HEADER_SIZE;
+    for size, there in zip(sizes, present):
+        position = -(-position // _ALIGN) * _ALIGN;
+        offsets.append(position if there else 0);
+        position += size if there else 0;
+    return offsets + [position];
+
+def _write_header(f, n: int, nnz: int, index_bytes: int, offsets: list[int], text_bytes: int) -> None:
+    f.seek(0);
+    f.write(_HEADER.pack(MAGIC, VERSION, index_bytes, n, nnz, *offsets[:6], text_bytes).ljust(_HEADER_SIZE, b"\0"));
+
+def _encode_values(values: list) -> tuple[np.ndarray, np.ndarray, bytes]:
+    kinds = np.fromiter((0 if isinstance(v, int) else 1 for v in values), dtype=np.uint8, count=len(values));
+    encoded = [str(v).encode("utf-8") for v in values];
+    offsets = np.zeros(len(values) + 1, dtype=np.int64);
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:]);
+    return kinds, offsets, b"".join(encoded);
+
+def save(path: str,
+         indptr: np.ndarray,
+         indices: np.ndarray,
+         weights: np.ndarray | None = None,
+         values: list | None = None) -> None:
+    """
+    Writes CSR arrays to a file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    indptr : np.ndarray
+        The (n + 1,) row offsets.
+    indices : np.ndarray
+        The (nnz,) neighbors.
+    weights : np.ndarray | None, optional
+        The (nnz,) weights.
+    values : list | None, optional
+        The int or str value of every node.
+    """
+    n, nnz = len(indptr) - 1, len(indices);
+    dtype = _index_dtype(n);
+    table = _encode_values(values) if values is not None else None;
+    offsets = _layout(n, nnz, dtype.itemsize, weights is not None, len(table[2]) if table is not None else None);
+    sections = [np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=dtype),
+                None if weights is None else np.asarray(weights, dtype=np.float64)];
+    sections += [table[0], table[1], np.frombuffer(table[2], dtype=np.uint8)] if table is not None else [None] * 3;
+    with open(path, "wb") as f:
+        _write_header(f, n, nnz, dtype.itemsize, offsets, len(table[2]) if table is not None else 0);
+        for offset, section in zip(offsets, sections):
+            if section is not None:
+                f.seek(offset);
+                section.tofile(f);
+        f.truncate(offsets[-1]);
+
+def load(path: str) -> CSRGraph:
+    """
+    Maps a file written by `save`, `write_graph` or `convert_edge_list`, read-only.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a graph file of a supported version.
+
+    Returns
+    -------
+    CSRGraph
+        The graph, whose arrays are views of the mapped file.
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER_SIZE);
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path} is not a graph file");
+    magic, version, index_bytes, n, nnz, *offsets, text_bytes = _HEADER.unpack(header[:_HEADER.size]);
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a graph file of version {VERSION}");
+    data = np.memmap(path, dtype=np.uint8, mode="r");
+
+    def section(i: int, dtype, count: int) -> np.ndarray | None:
+        if not offsets[i]:
+            return None;
+        dtype = np.dtype(dtype);
+        return data[offsets[i]:offsets[i] + dtype.itemsize * count].view(dtype);
+
+    return CSRGraph(section(0, np.int64, n + 1), section(1, np.int32 if index_bytes == 4 else np.int64, nnz),
+                    section(2, np.float64, nnz), section(3, np.uint8, n), section(4, np.int64, n + 1),
+                    section(5, np.uint8, text_bytes), path);
+
+def write_graph(path: str, graph: TGraph) -> None:
+    """
+    Writes a `TGraph` to a file, with the values of its nodes.
+    """
+    nodes, edges = to_arrays(graph);
+    indptr, indices, _ = csr_from_edges(len(nodes), edges);
+    save(path, indptr, indices, values=[node.value for node in nodes]);
+
+def read_graph(path: str, cls: type = TGraph) -> TGraph:
+    """
+    Reads a `TGraph` from a file.
+    """
+    return load(path).to_graph(cls);
+
+def _read_chunks(source: str, chunk_bytes: int):
+    """
+    Yields the text of `source` in blocks of about `chunk_bytes` bytes, cut at line ends.
+    """
+    with open(source, "rb") as f:
+        rest = b"";
+        while True:
+            block = f.read(chunk_bytes);
+            if not block:
+                break;
+            block = rest + block;
+            cut = block.rfind(b"\n") + 1;
+            if cut == 0:
+                rest = block;
+                continue;
+            rest = block[cut:];
+            yield block[:cut];
+        if rest.strip():
+            yield rest;
+
+def convert_edge_list(source: str,
+                      path: str,
+                      n: int | None = None,
+                      weighted: bool = False,
+                      symmetric: bool = True,
+                      comments: str = "#",
+                      delimiter: str | None = None,
+                      chunk_bytes: int = 1 << 26) -> CSRGraph:
+    """
+    Converts a text edge list (one `u v` or `u v w` line per edge, with non-negative integer node ids) to a
+    graph file, holding only one chunk of edges and the per-node counters in memory.
+
+    The first pass parses the text chunk by chunk with `np.loadtxt`, counts the degrees and spills the
+    parsed edges to a temporary binary file. The second pass streams the spilled edges and scatters each
+    chunk into the memory-mapped `indices` of the output, at per-row cursors. Rows keep the order of the
+    text, with no duplicate removal.
+
+    Parameters
+    ----------
+    source : str
+        The path of the edge list.
+    path : str
+        The path of the graph file.
+    n : int | None, optional
+        The number of nodes. Defaults to the largest id plus one.
+    weighted : bool, optional
+        Read a weight from the third column.
+    symmetric : bool, optional
+        Store every edge in the rows of both endpoints (undirected graphs). Defaults to True.
+    comments : str, optional
+        The prefix of comment lines.
+    delimiter : str | None, optional
+        The column delimiter. Defaults to whitespace.
+    chunk_bytes : int, optional
+        The size of the text blocks parsed at a time.
+
+    Returns
+    -------
+    CSRGraph
+        The converted graph, mapped from `path`.
+    """
+    degrees = np.zeros(0, dtype=np.int64);
+    nnz = 0;
+    columns = (0, 1, 2) if weighted else (0, 1);
+    record = np.dtype([("u", np.int64), ("v", np.int64), ("w", np.float64)] if weighted else [("u", np.int64), ("v", np.int64)]);
+    spill = tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(path)), suffix=".edges", delete=False);
+    try:
+        #   First pass: parse, count and spill
+        with spill:
+            for block in _read_chunks(source, chunk_bytes):
+                table = np.loadtxt(io.StringIO(block.decode("utf-8")), dtype=np.float64 if weighted else np.int64,
+                                   comments=comments, delimiter=delimiter, usecols=columns, ndmin=2);
+                if len(table) == 0:
+                    continue;
+                chunk = np.empty(len(table), dtype=record);
+                chunk["u"], chunk["v"] = table[:, 0], table[:, 1];
+                if weighted:
+                    chunk["w"] = table[:, 2];
+                chunk.tofile(spill);
+                rows = _rows(chunk, symmetric)[0];
+                if len(rows) and rows.max() >= len(degrees):
+                    degrees = np.concatenate([degrees, np.zeros(int(rows.max()) + 1 - len(degrees), dtype=np.int64)]);
+                degrees += np.bincount(rows, minlength=len(degrees));
+                nnz += len(rows);
+
+        n = len(degrees) if n is None else n;
+        degrees = np.concatenate([degrees, np.zeros(max(0, n - len(degrees)), dtype=np.int64)])[:n];
+        indptr = np.zeros(n + 1, dtype=np.int64);
+        np.cumsum(degrees, out=indptr[1:]);
+        dtype = _index_dtype(n);
+        offsets = _layout(n, nnz, dtype.itemsize, weighted, None);
+        with open(path, "wb") as f:
+            _write_header(f, n, nnz, dtype.itemsize, offsets, 0);
+            f.seek(offsets[0]);
+            indptr.tofile(f);
+            f.truncate(offsets[-1]);
+
+        #   Second pass: scatter each chunk of spilled edges at the cursors of its rows
+        data = np.memmap(path, dtype=np.uint8, mode="r+");
+        indices = data[offsets[1]:offsets[1] + dtype.itemsize * nnz].view(dtype);
+        weights = data[offsets[2]:offsets[2] + 8 * nnz].view(np.float64) if weighted else None;
+        cursor = indptr[:-1].copy();
+        edges = np.memmap(spill.name, dtype=record, mode="r") if os.path.getsize(spill.name) else np.empty(0, dtype=record);
+        step = max(1, chunk_bytes // record.itemsize);
+        for start in range(0, len(edges), step):
+            rows, cols, w = _rows(np.asarray(edges[start:start + step]), symmetric);
+            order = np.argsort(rows, kind="stable");
+            rows, cols = rows[order], cols[order];
+            #   Rank of each entry among the entries of its row in this chunk
+            first = np.searchsorted(rows, rows, side="left");
+            position = cursor[rows] + np.arange(len(rows)) - first;
+            indices[position] = cols;
+            if weighted:
+                weights[position] = w[order];
+            heads = np.flatnonzero(np.diff(rows, prepend=-1));
+            cursor[rows[heads]] += np.diff(heads, append=len(rows));
+        data.flush();
+        del data, indices, weights, edges;
+    finally:
+        os.unlink(spill.name);
+    return load(path);
+
+def _rows(chunk: np.ndarray, symmetric: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """
+    Returns the row, column and weight of every CSR entry of a chunk of parsed edges.
+    """
+    u, v = chunk["u"], chunk["v"];
+    w = chunk["w"] if "w" in chunk.dtype.names else None;
+    if not symmetric:
+        return u, v, w;
+    other = u != v;
+    return (np.concatenate([u, v[other]]), np.concatenate([v, u[other]]),
+            None if w is None else np.concatenate([w, w[other]]));
+
+
+if __name__ == "__main__":
+    import time;
+    from .GraphGenerators import gnm, edge_array;
+
+    directory = tempfile.mkdtemp();
+    text, binary = os.path.join(directory, "edges.txt"), os.path.join(directory, "graph.csr");
+    edges = edge_array(gnm(10**6, 5 * 10**6, seed=0));
+    np.savetxt(text, edges, fmt="%d");
+
+    start = time.perf_counter();
+    graph = convert_edge_list(text, binary, chunk_bytes=1 << 24);
+    print(f"converted {graph.n} nodes, {len(graph.indices)} entries in {time.perf_counter() - start:.2f}s");
+    start = time.perf_counter();
+    graph = load(binary);
+    print(f"loaded in {1e3 * (time.perf_counter() - start):.2f}ms, degree of node 0: {len(graph.neighbors(0))}");
@@ -1,4 +1,4 @@
-from primitives.TGraphBuilder import create_node
+from .primitives.TGraphBuilder import create_node
 from typing import Any, TypeVar
 from string import ascii_letters
 
@@ -20,9 +20,9 @@ def ascii_nodes(n: int) -> list:
     
     Raises
     ------
-    NotImplemented
+    ValueError
         If `n` is greater than the number of letters in the alphabet.
     """
     if n > len(ascii_letters):
-        raise NotImplemented(f"n must be less than {len(ascii_letters)}");
+        raise ValueError(f"n must be at most {len(ascii_letters)}");
     return [create_node(ascii_letters[i - 1], i) for i in range(1, n + 1)];
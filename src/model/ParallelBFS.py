@@ -0,0 +1,279 @@
+""" src/model/ParallelBFS.py
+Implements a level-synchronous, direction-optimizing breadth-first search over CSR graphs, in parallel
+over a process pool.
+
+The CSR arrays, the distance and parent arrays, the current frontier and a frontier bitmap are placed in
+`multiprocessing.shared_memory` blocks, which the workers attach to once and reuse. Each level is split into
+parts of about the same number of edges, and every part is one job:
+    -   top-down, a job scans the neighbors of its part of the frontier and returns the unvisited ones with
+        their parents;
+    -   bottom-up, a job scans the unvisited vertices of its range of ids and returns those with a neighbor
+        in the frontier, with the first such neighbor as parent.
+Workers only read the shared arrays and return their candidates in their own buffers; the parent process
+merges them, keeps the first parent of every vertex (`np.unique`) and writes the distances and parents, so
+no atomic operations are needed. The direction switches as in Beamer's direction-optimizing BFS: to
+bottom-up when the edges out of the frontier exceed `1 / alpha` of the edges out of unvisited vertices,
+back to top-down when the frontier holds fewer than `n / beta` vertices.
+
+Functions
+---------
+parallel_bfs(graph, source: int, max_workers: int = 1, ...) -> tuple[np.ndarray, np.ndarray]
+    Returns the distance and parent of every vertex.
+"""
+
+import sys;
+import numpy as np;
+
+from concurrent.futures         import Executor, ProcessPoolExecutor;
+from multiprocessing            import shared_memory;
+
+__all__ = ["parallel_bfs"];
+
+ALPHA : float = 14.0;
+BETA  : float = 24.0;
+
+_GATHER_EDGES : int = 1 << 22;
+"""Maximum number of edges gathered at once by a kernel, to bound its temporary arrays."""
+
+_attached : dict[str, tuple[shared_memory.SharedMemory, np.ndarray]] = {};
+"""The shared arrays attached by a worker process, by block name."""
+
+
+def _gather(indptr: np.ndarray, indices: np.ndarray, vertices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the neighbors of `vertices` and, for each, the position of its vertex in `vertices`.
+    """
+    starts = indptr[vertices];
+    degrees = indptr[vertices + 1] - starts;
+    total = int(degrees.sum());
+    owners = np.repeat(np.arange(len(vertices)), degrees);
+    first = np.cumsum(degrees) - degrees;
+    positions = np.repeat(starts - first, degrees) + np.arange(total);
+    return indices[positions].astype(np.int64, copy=False), owners;
+
+def _parts(weights: np.ndarray, count: int, limit: int) -> list[tuple[int, int]]:
+    """
+    Splits `range(len(weights))` into at most `count` ranges of about the same total weight, further split
+    so that no range weighs much more than `limit`.
+    """
+    cumulative = np.cumsum(weights);
+    total = int(cumulative[-1]) if len(cumulative) else 0;
+    count = max(count, -(-total // limit), 1);
+    bounds = np.unique(np.searchsorted(cumulative, np.linspace(0, total, count + 1)[1:-1], side="right"));
+    bounds = [0] + [int(b) for b in bounds if 0 < b < len(weights)] + [len(weights)];
+    return [(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if lo < hi];
+
+def _top_down(indptr, indices, dist, frontier) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unvisited neighbors of `frontier` and their parents, possibly with repetitions.
+    """
+    vertices, parents = [], [];
+    for lo, hi in _parts(indptr[frontier + 1] - indptr[frontier], 1, _GATHER_EDGES):
+        part = frontier[lo:hi];
+        neighbors, owners = _gather(indptr, indices, part);
+        fresh = dist[neighbors] < 0;
+        vertices.append(neighbors[fresh]);
+        parents.append(part[owners[fresh]]);
+    if not vertices:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64);
+    return np.concatenate(vertices), np.concatenate(parents);
+
+def _bottom_up(indptr, indices, dist, in_frontier, lo: int, hi: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unvisited vertices of `lo..hi-1` with a neighbor in the frontier, and that neighbor.
+    """
+    unvisited = lo + np.flatnonzero(dist[lo:hi] < 0);
+    vertices, parents = [], [];
+    for a, b in _parts(indptr[unvisited + 1] - indptr[unvisited], 1, _GATHER_EDGES):
+        part = unvisited[a:b];
+        neighbors, owners = _gather(indptr, indices, part);
+        hit = in_frontier[neighbors] != 0;
+        owners, neighbors = owners[hit], neighbors[hit];
+        #   Owners are sorted: the first hit of each owner is its parent
+        first = np.flatnonzero(np.diff(owners, prepend=-1));
+        vertices.append(part[owners[first]]);
+        parents.append(neighbors[first]);
+    if not vertices:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64);
+    return np.concatenate(vertices), np.concatenate(parents);
+
+def _attach(spec: dict[str, tuple[str, str, tuple]]) -> dict[str, np.ndarray]:
+    """
+    Returns the shared arrays described by `spec` (`key -> (block name, dtype, shape)`), attaching the
+    blocks the first time a worker sees them.
+    """
+    names = {name for name, _, _ in spec.values()};
+    if not names <= _attached.keys():
+        #   A new search: release the blocks of the previous one, which its process has unlinked
+        for old in [name for name in _attached if name not in names]:
+            block, _ = _attached.pop(old);
+            block.close();
+    arrays = {};
+    for key, (name, dtype, shape) in spec.items():
+        if name not in _attached:
+            #   The parent process owns the block and unlinks it. Pool workers share its resource tracker, so
+            #   their registration of the name is the parent's one
+            if sys.version_info >= (3, 13):
+                block = shared_memory.SharedMemory(name=name, track=False);
+            else:
+                block = shared_memory.SharedMemory(name=name);
+            _attached[name] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf));
+        arrays[key] = _attached[name][1];
+    return arrays;
+
+def _step(job: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Runs one part of a level. Module level so it can run in a worker process.
+
+    Parameters
+    ----------
+    job : tuple
+        `(spec, direction, lo, hi)`: the shared arrays, `"top-down"` or `"bottom-up"`, and the range of
+        the frontier (top-down) or of the vertex ids (bottom-up) to scan.
+    """
+    spec, direction, lo, hi = job;
+    a = _attach(spec);
+    if direction == "top-down":
+        return _top_down(a["indptr"], a["indices"], a["dist"], a["frontier"][lo:hi]);
+    return _bottom_up(a["indptr"], a["indices"], a["dist"], a["in_frontier"], lo, hi);
+
+def parallel_bfs(graph,
+                 source: int,
+                 max_workers: int = 1,
+                 executor: Executor | None = None,
+                 alpha: float = ALPHA,
+                 beta: float = BETA,
+                 parts_per_worker: int = 4) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Breadth-first search from `source`.
+
+    Parameters
+    ----------
+    graph : CSRGraph
+        The graph, or any object with `indptr` and `indices` CSR arrays (see `GraphIO`). Edges are followed
+        from the row of a vertex, so undirected graphs must store both directions.
+    source : int
+        The id of the source vertex.
+    max_workers : int, optional
+        The number of processes: those of the private pool when `executor` is `None` (with 1, the levels
+        run in this process, on the arrays of `graph`, without shared memory), else those of `executor`.
+        Each level is split into `max_workers * parts_per_worker` jobs.
+    executor : Executor | None, optional
+        A process pool running the jobs, instead of a private one. Pass its number of workers as
+        `max_workers`.
+    alpha : float, optional
+        Switch to bottom-up when the frontier's edges exceed the unvisited vertices' edges divided by `alpha`.
+    beta : float, optional
+        Switch back to top-down when the frontier has fewer than `n / beta` vertices.
+    parts_per_worker : int, optional
+        The number of jobs per worker and level, for load balancing.
+
+    Raises
+    ------
+    ValueError
+        If `source` is not a vertex of the graph, or `max_workers` is not positive.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The (n,) int64 distances from `source` (-1 for unreachable vertices) and parents (-1 for unreachable
+        vertices, `source` for the source).
+    """
+    indptr, indices = np.asarray(graph.indptr), np.asarray(graph.indices);
+    n = len(indptr) - 1;
+    if not 0 <= source < n:
+        raise ValueError(f"source must be in [0, {n})");
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer");
+    workers = max_workers;
+    parallel = executor is not None or max_workers > 1;
+
+    blocks : list[shared_memory.SharedMemory] = [];
+    arrays : dict[str, np.ndarray] = {};
+    own_executor = executor is None and parallel;
+    try:
+        if parallel:
+            #   Shared copies of the graph and of the search state
+            spec = {};
+            for key, like in [("indptr", indptr), ("indices", indices), ("dist", np.empty(n, np.int64)),
+                              ("parent", np.empty(n, np.int64)), ("frontier", np.empty(n, np.int64)),
+                              ("in_frontier", np.empty(n, np.uint8))]:
+                block = shared_memory.SharedMemory(create=True, size=max(1, like.nbytes));
+                blocks.append(block);
+                arrays[key] = np.ndarray(like.shape, dtype=like.dtype, buffer=block.buf);
+                spec[key] = (block.name, like.dtype.str, like.shape);
+            arrays["indptr"][:] = indptr;
+            arrays["indices"][:] = indices;
+            if own_executor:
+                executor = ProcessPoolExecutor(max_workers=max_workers);
+        else:
+            arrays = {"indptr": indptr, "indices": indices, "dist": np.empty(n, np.int64),
+                      "parent": np.empty(n, np.int64), "in_frontier": np.empty(n, np.uint8)};
+        dist, parent, in_frontier = arrays["dist"], arrays["parent"], arrays["in_frontier"];
+
+        dist.fill(-1);
+        parent.fill(-1);
+        in_frontier.fill(0);
+        degrees = np.diff(indptr);
+        dist[source], parent[source] = 0, source;
+        frontier = np.array([source], dtype=np.int64);
+        unexplored = int(degrees.sum()) - int(degrees[source]);
+        bottom_up = False;
+        level = 0;
+        while len(frontier):
+            frontier_edges = int(degrees[frontier].sum());
+            if not bottom_up and frontier_edges > unexplored / alpha:
+                bottom_up = True;
+            elif bottom_up and len(frontier) < n / beta:
+                bottom_up = False;
+
+            if bottom_up:
+                in_frontier[frontier] = 1;
+                ranges = _parts(degrees, workers * parts_per_worker, _GATHER_EDGES);
+                if parallel:
+                    results = list(executor.map(_step, [(spec, "bottom-up", lo, hi) for lo, hi in ranges]));
+                else:
+                    results = [_bottom_up(indptr, indices, dist, in_frontier, lo, hi) for lo, hi in ranges];
+                in_frontier[frontier] = 0;
+            else:
+                ranges = _parts(degrees[frontier], workers * parts_per_worker, _GATHER_EDGES);
+                if parallel:
+                    arrays["frontier"][:len(frontier)] = frontier;
+                    results = list(executor.map(_step, [(spec, "top-down", lo, hi) for lo, hi in ranges]));
+                else:
+                    results = [_top_down(indptr, indices, dist, frontier[lo:hi]) for lo, hi in ranges];
+
+            #   Merge the per-job buffers, keeping the first parent found for every vertex
+            vertices = np.concatenate([v for v, _ in results]) if results else np.empty(0, np.int64);
+            parents = np.concatenate([p for _, p in results]) if results else np.empty(0, np.int64);
+            vertices, first = np.unique(vertices, return_index=True);
+            level += 1;
+            dist[vertices] = level;
+            parent[vertices] = parents[first];
+            unexplored -= int(degrees[vertices].sum());
+            frontier = vertices;
+        return np.array(dist), np.array(parent);
+    finally:
+        if own_executor:
+            executor.shutdown();
+        #   Views of the blocks must be gone before they are closed
+        arrays.clear();
+        dist = parent = in_frontier = None;
+        for block in blocks:
+            block.close();
+            block.unlink();
+
+
+if __name__ == "__main__":
+    import time;
+    from .GraphGenerators   import gnm, edge_array;
+    from .GraphIO           import CSRGraph, csr_from_edges;
+
+    n = 10**6;
+    graph = CSRGraph(*csr_from_edges(n, edge_array(gnm(n, 8 * n, seed=0))));
+    for workers in (1, 2, 4):
+        start = time.perf_counter();
+        dist, parent = parallel_bfs(graph, 0, max_workers=workers);
+        elapsed = time.perf_counter() - start;
+        print(f"{workers} workers: {elapsed:.2f}s, {(dist >= 0).sum()} reached, depth {dist.max()}, "
+              f"{len(graph.indices) / elapsed / 1e6:.1f}M edges/s");
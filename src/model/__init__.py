@@ -0,0 +1,55 @@
+""" src/model/__init__.py
+The `model` package: graph types, graph algebra, generators, analytics and I/O.
+
+Importing the package loads nothing else: its submodules are imported the first time one of them, or one
+of the names below, is accessed (module `__getattr__`).
+
+Names exported lazily, by module
+--------------------------------
+primitives.datatypes.TNode : TNode, TEdge
+primitives.datatypes.TGraph : TGraph
+ConcreteDataTypes : UAGraph, PNode, Kn, EmptyGraph, cast
+GraphAlgebra : to_arrays, from_arrays, disjoint_union, union, intersection, difference
+EdgeKeys : pack_edges, unpack_edges, edge_set, edge_union, edge_intersection, edge_difference, edge_contains
+GraphGenerators : complete, grid, gnp, gnm, random_regular, barabasi_albert, edge_array, to_graph
+GraphAnalytics : degrees, degree_histogram, connected_components, component_sizes, reachable_counts
+GraphIO : CSRGraph, csr_from_edges, save, load, write_graph, read_graph, convert_edge_list
+ParallelBFS : parallel_bfs
+"""
+
+import  importlib;
+
+_MODULES : dict[str, list[str]] = {
+    "primitives.datatypes.TNode": ["TNode", "TEdge"],
+    "primitives.datatypes.TGraph": ["TGraph"],
+    "ConcreteDataTypes": ["UAGraph", "PNode", "Kn", "EmptyGraph", "cast"],
+    "GraphAlgebra": ["to_arrays", "from_arrays", "disjoint_union", "union", "intersection", "difference"],
+    "EdgeKeys": ["pack_edges", "unpack_edges", "edge_set", "edge_union", "edge_intersection", "edge_difference", "edge_contains"],
+    "GraphGenerators": ["complete", "grid", "gnp", "gnm", "random_regular", "barabasi_albert", "edge_array", "to_graph"],
+    "GraphAnalytics": ["degrees", "degree_histogram", "connected_components", "component_sizes", "reachable_counts"],
+    "GraphIO": ["CSRGraph", "csr_from_edges", "save", "load", "write_graph", "read_graph", "convert_edge_list"],
+    "ParallelBFS": ["parallel_bfs"],
+};
+
+_EXPORTS : dict[str, str] = {name: module for module, names in _MODULES.items() for name in names};
+
+_SUBMODULES : frozenset[str] = frozenset({
+    "primitives", "functionals", "ConcreteDataTypes", "EdgeKeys", "GraphAlgebra", "GraphAnalytics",
+    "GraphGenerators", "GraphIO", "GraphUtils", "ParallelBFS",
+});
+
+__all__ = sorted(_EXPORTS);
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__);
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name);
+        globals()[name] = value;
+        return value;
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}");
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES);
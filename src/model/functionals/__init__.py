@@ -0,0 +1,3 @@
+""" src/model/functionals/__init__.py
+The graph protocols of `GraphProtocols`.
+"""
@@ -21,7 +21,7 @@ get_adjacency_matrix(nodes: list[Any] | list[TNode] | TGraph, edges: list[tuple[
     Creates an adjacency matrix from the given nodes and edges.
 """
 
-from primitives.datatypes.TGraph import TGraph, TEdge, TNode, getAdjacencyList, getAdjacencyMatrix, AdjacencyMatrix, AdjacencyList;
+from .datatypes.TGraph import TGraph, TEdge, TNode, getAdjacencyList, getAdjacencyMatrix, AdjacencyMatrix, AdjacencyList;
 from typing import Any;
 
 __all__ = ["create_node", "create_edge", "create_graph", "create_adjacency_list", "create_adjacency_matrix"];
@@ -0,0 +1,3 @@
+""" src/model/primitives/__init__.py
+The graph primitives: `TGraphBuilder` and the `datatypes` TNode and TGraph.
+"""
@@ -1,6 +1,7 @@
-from primitives.datatypes.TNode import TNode, TEdge, AdjacencyList, AdjacencyMatrix, getAdjacencyList, getAdjacencyMatrix;
+from .TNode                        import TNode, TEdge, AdjacencyList, AdjacencyMatrix, getAdjacencyList, getAdjacencyMatrix;
+from ...functionals.GraphProtocols import Valency;
 
-class TGraph:
+class TGraph(Valency):
     nodes: set[TNode] = set();
     edges: set[TEdge] = set();
 
@@ -40,4 +41,139 @@ class TGraph:
             The adjacency matrix of the graph.
         """
         return getAdjacencyMatrix(self.edges);
+
+    def arrays(self) -> "tuple[list[TNode], np.ndarray]":
+        """
+        Gets the nodes of the graph and its edges as an (E, 2) array of indices into the node list
+        (see `GraphAlgebra.to_arrays`). The analytics below are computed in bulk from these arrays.
+        
+        Returns
+        -------
+        tuple[list[TNode], np.ndarray]
+            The nodes and the edges of the graph.
+        """
+        #   GraphAlgebra builds graphs of this class, and the array methods need NumPy: import them on use,
+        #   so that importing the graph types stays cheap
+        from ...GraphAlgebra import to_arrays;
+        return to_arrays(self);
+    
+    def edgeSet(self) -> "tuple[list[TNode], np.ndarray]":
+        """
+        Gets the distinct edges of the graph as a sorted array of packed keys (see `EdgeKeys.edge_set`),
+        for membership tests and set operations with `EdgeKeys`.
+        
+        Returns
+        -------
+        tuple[list[TNode], np.ndarray]
+            The nodes, and the keys of the edges between their indices.
+        """
+        from ...EdgeKeys import edge_set;
+        nodes, edges = self.arrays();
+        return nodes, edge_set(edges);
+    
+    def degrees(self) -> "tuple[list[TNode], np.ndarray]":
+        """
+        Gets the degree of every node: its number of distinct neighbors, as in `adjacencyList()`.
+        
+        Returns
+        -------
+        tuple[list[TNode], np.ndarray]
+            The nodes, and the (V,) array of their degrees.
+        """
+        from ...GraphAnalytics import degrees;
+        nodes, edges = self.arrays();
+        return nodes, degrees(len(nodes), edges);
+    
+    def _indices(self, nodes: list[TNode], *query: TNode) -> list[int]:
+        """
+        Gets the indices of the `query` nodes in the node list of `arrays()`, with the mapping `to_arrays`
+        uses for the edges: by value, the last node of the list holding each value.
+        
+        Raises
+        ------
+        ValueError
+            If a node is not a node of the graph.
+        """
+        index = {node.value: i for i, node in enumerate(nodes)};
+        for node in query:
+            if node.value not in index:
+                raise ValueError(f"{node} is not a node of the graph");
+        return [index[node.value] for node in query];
+    
+    def degree(self, node: TNode) -> int:
+        """
+        Gets the degree of `node`, counting only its own edges.
+        
+        Raises
+        ------
+        ValueError
+            If `node` is not a node of the graph.
+        """
+        import numpy as np;
+        nodes, edges = self.arrays();
+        i, = self._indices(nodes, node);
+        neighbors = np.concatenate([edges[edges[:, 0] == i, 1], edges[edges[:, 1] == i, 0]]);
+        return len(np.unique(neighbors[neighbors != i]));
+    
+    def maxdegree(self) -> int:
+        """
+        Gets the maximum degree of the graph, 0 if it has no nodes.
+        """
+        values = self.degrees()[1];
+        return int(values.max()) if len(values) else 0;
+    
+    def mindegree(self) -> int:
+        """
+        Gets the minimum degree of the graph, 0 if it has no nodes.
+        """
+        values = self.degrees()[1];
+        return int(values.min()) if len(values) else 0;
     
+    def degreeHistogram(self) -> "np.ndarray":
+        """
+        Gets the (maxdegree + 1,) array of the number of nodes of each degree.
+        """
+        import numpy as np;
+        return np.bincount(self.degrees()[1], minlength=1);
+    
+    def components(self) -> "tuple[list[TNode], np.ndarray]":
+        """
+        Gets the connected component of every node (see `GraphAnalytics.connected_components`).
+        
+        Returns
+        -------
+        tuple[list[TNode], np.ndarray]
+            The nodes, and the (V,) array of their components, numbered `0..k-1` in order of first node.
+        """
+        import numpy as np;
+        from ...GraphAnalytics import connected_components;
+        nodes, edges = self.arrays();
+        labels = connected_components(len(nodes), edges);
+        return nodes, np.unique(labels, return_inverse=True)[1];
+    
+    def reachableCounts(self) -> "tuple[list[TNode], np.ndarray]":
+        """
+        Gets the number of nodes reachable from every node, itself included.
+        
+        Returns
+        -------
+        tuple[list[TNode], np.ndarray]
+            The nodes, and the (V,) array of their reachable counts.
+        """
+        from ...GraphAnalytics import component_sizes;
+        nodes, labels = self.components();
+        return nodes, component_sizes(labels)[labels];
+    
+    def isReachable(self, source: TNode, target: TNode) -> bool:
+        """
+        Checks whether `target` can be reached from `source`, e.g. to skip a search with an unreachable goal.
+        Computes the components of the whole graph: for many queries, use `components()` once.
+        
+        Raises
+        ------
+        ValueError
+            If `source` or `target` is not a node of the graph.
+        """
+        nodes, labels = self.components();
+        i, j = self._indices(nodes, source, target);
+        return bool(labels[i] == labels[j]);
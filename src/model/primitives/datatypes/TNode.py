@@ -117,10 +117,11 @@ class TNode:
         return self.value == other.value;
     
 #   Edge    type
-type TEdge = set[TNode, TNode];
+type TEdge = tuple[TNode, TNode];
 """
 `TEdge` is the type for representing an edge in a graph.
-An edge is a set of two nodes.
+An edge is a pair of nodes. Edges are undirected: `(u, v)` and `(v, u)` are the same edge, and
+array code compares them by their packed keys (see `EdgeKeys`).
 """
 
 type AdjacencyList = dict[TNode, list[TNode]];
@@ -152,7 +153,7 @@ def edge(v: TNode, w: TNode) -> TEdge:
     TEdge
         The edge between v and w.
     """
-    return {v, w};
+    return (v, w);
 
 def getNodesFromEdges(edges: list[TEdge]) -> list[TNode]:
     """
@@ -170,7 +171,7 @@ def getNodesFromEdges(edges: list[TEdge]) -> list[TNode]:
     """
     nodes : set[TNode] = set();
     for edge in edges:
-        u, v = tuple(edge);
+        u, v = edge;
         nodes.add(u);
         nodes.add(v);
     return list(nodes);
@@ -192,7 +193,7 @@ def getAdjacencyList(edges: list[TEdge]) -> AdjacencyList:
     nodes : list[TNode] = getNodesFromEdges(edges);
     adjacencyList : AdjacencyList = {node: [] for node in nodes};
     for edge in edges:
-        u, v = tuple(edge);
+        u, v = edge;
         
         if u == v:
             continue;
@@ -245,7 +246,7 @@ def getAdjacencyMatrix(edges: list[TEdge]) -> AdjacencyMatrix:
     nodes : list[TNode] = getNodesFromEdges(edges);
     adjacencyMatrix : AdjacencyMatrix = [[0 for _ in range(len(nodes))] for _ in range(len(nodes))];
     for edge in edges:
-        u, v = tuple(edge);
+        u, v = edge;
         adjacencyMatrix[nodes.index(u)][nodes.index(v)] = 1;
         adjacencyMatrix[nodes.index(v)][nodes.index(u)] = 1;
     return adjacencyMatrix;
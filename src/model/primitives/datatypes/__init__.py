@@ -0,0 +1,3 @@
+""" src/model/primitives/datatypes/__init__.py
+The graph datatypes: `TNode` (nodes, edges and adjacency helpers) and `TGraph`.
+"""
@@ -0,0 +1,190 @@
+""" src/searching/BeamSearch.py
+Beam searches over states encoded as rows of a NumPy array.
+Methods:
+    -   beam_search
+        Keeps the `width` best successors of each layer.
+    -   stochastic_beam_search
+        Samples `width` successors of each layer with Boltzmann probabilities of their scores.
+
+Both searches evaluate a whole layer at a time: `expand` maps the (K, D) array of the current layer to
+the (M, D) array of its successors, and `score` maps that array to the (M,) array of their scores, lower
+is better. There is no per-state Python call, so the cost of a layer is a handful of NumPy operations.
+"""
+
+import  logging;
+import  numpy as np;
+from    typing          import Any, Callable;
+from    .SearchStats    import SearchStats, resolve_stats;
+from    .SearchResult   import SearchResult, SearchStatus;
+from    .Progress       import ProgressReporter, as_progress;
+from    .Budget         import SearchBudget;
+
+__all__ = ["beam_search", "stochastic_beam_search"];
+
+logger = logging.getLogger(__name__);
+
+
+def beam_search(initial: np.ndarray,
+                expand: Callable[[np.ndarray], np.ndarray],
+                score: Callable[[np.ndarray], np.ndarray],
+                width: int = 16,
+                max_layers: int = 1000,
+                goal_score: float = 0,
+                patience: int | None = None,
+                stochastic: bool = False,
+                temperature: float = 1.0,
+                rng: np.random.Generator | None = None,
+                stats: SearchStats | None = None,
+                progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                budget: SearchBudget | None = None) -> SearchResult:
+    """
+    Beam search: each layer is the set of distinct successors of the previous one, cut down to `width`
+    states. The search stops when a state scores `goal_score` or less.
+
+    Parameters:
+        initial (np.ndarray): The (K, D) array of initial states (a single state may be given as a (D,) array).
+        expand (Callable): Maps a (K, D) layer to the (M, D) array of its successors.
+        score (Callable): Maps a (M, D) array of states to their (M,) scores, lower is better.
+        width (int): The number of states kept per layer.
+        max_layers (int): The maximum number of layers.
+        goal_score (float): States scoring at most `goal_score` are goals.
+        patience (int | None): Stop after this many layers without improving the best score. Never when `None`.
+        stochastic (bool): Sample the layer instead of keeping its best states (see `stochastic_beam_search`).
+        temperature (float): The temperature of the sampling, in units of the score.
+        rng (np.random.Generator | None): The random number generator of the sampling.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, frontier memory and cancellation limits.
+
+    Returns:
+        SearchResult: The goal state, or the best state of all layers, with its score as `cost`.
+            `status` is `ITERATION_LIMIT` when `max_layers` or `patience` ran out, and `EXHAUSTED`
+            when a layer has no successors.
+    """
+    rng = np.random.default_rng() if rng is None else rng;
+    layer = np.atleast_2d(np.asarray(initial));
+    scores = np.asarray(score(layer));
+    best_i = int(np.argmin(scores));
+    best, best_score = layer[best_i].copy(), scores[best_i];
+    status = SearchStatus.ITERATION_LIMIT;
+    since_improvement = 0;
+    expanded = 0;
+    i = 0;
+
+    stats    = resolve_stats(stats, "stochastic_beam_search" if stochastic else "beam_search");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+        stats.set_initial_heuristic(float(best_score));
+    if budget is not None:
+        budget.start();
+
+    for i in range(max_layers):
+        if best_score <= goal_score:
+            status = SearchStatus.SOLVED;
+            break;
+
+        #   Check the budget; a layer is a large unit of work, so it is checked every layer
+        if budget is not None:
+            stop = budget.check(expanded, layer.nbytes);
+            if stop is not None:
+                status = stop;
+                break;
+
+        #   Expand and score the whole layer at once, dropping duplicate successors
+        successors = expand(layer);
+        expanded += len(layer);
+        if len(successors) == 0:
+            status = SearchStatus.EXHAUSTED;
+            break;
+        successors = _unique_rows(successors);
+        successor_scores = np.asarray(score(successors));
+        if stats is not None:
+            stats.nodes_expanded(len(layer), float(scores.sum()));
+            stats.nodes_generated(len(successors));
+            stats.update_max_frontier(len(successors));
+
+        #   Select the next layer
+        if stochastic:
+            keep = _sample(successor_scores, width, temperature, rng);
+        elif len(successors) > width:
+            keep = np.argpartition(successor_scores, width - 1)[:width];
+        else:
+            keep = np.arange(len(successors));
+        layer, scores = successors[keep], successor_scores[keep];
+
+        #   Keep the best state of all layers: the beam itself may get worse
+        layer_best = int(np.argmin(scores));
+        if scores[layer_best] < best_score:
+            best, best_score = layer[layer_best].copy(), scores[layer_best];
+            since_improvement = 0;
+        else:
+            since_improvement += 1;
+            if patience is not None and since_improvement >= patience:
+                i += 1;
+                break;
+
+        if progress is not None and i % progress.every == 0:
+            progress.report(i, best=float(best_score), layer=len(layer));
+    else:
+        if best_score <= goal_score:
+            status = SearchStatus.SOLVED;
+        i = max_layers;
+
+    logger.debug("%s: %s after %d layers, best score %s",
+                 "stochastic_beam_search" if stochastic else "beam_search", status.value, i, best_score);
+    if stats is not None:
+        stats.finish();
+    return SearchResult(best, status, i, stats, cost=float(best_score));
+
+
+def stochastic_beam_search(initial: np.ndarray,
+                           expand: Callable[[np.ndarray], np.ndarray],
+                           score: Callable[[np.ndarray], np.ndarray],
+                           width: int = 16,
+                           temperature: float = 1.0,
+                           **kwargs) -> SearchResult:
+    """
+    Stochastic beam search: each layer is a sample of `width` distinct successors of the previous one,
+    drawn with probabilities proportional to `exp(-(score - min_score) / temperature)`. Sampling keeps
+    the beam diverse, so it does not collapse onto a single local minimum as `beam_search` tends to.
+
+    Parameters:
+        temperature (float): The temperature of the sampling, in units of the score. Lower values
+            approach `beam_search`.
+        See `beam_search` for the other parameters.
+    """
+    return beam_search(initial, expand, score, width, stochastic=True, temperature=temperature, **kwargs);
+
+
+def _unique_rows(states: np.ndarray) -> np.ndarray:
+    """
+    Returns the distinct rows of `states`. Rows are compared as raw bytes, which is much faster than
+    `np.unique(states, axis=0)`.
+    """
+    states = np.ascontiguousarray(states);
+    rows = states.view(np.dtype((np.void, states.dtype.itemsize * states.shape[1]))).ravel();
+    _, index = np.unique(rows, return_index=True);
+    return states[np.sort(index)];
+
+
+def _sample(scores: np.ndarray, width: int, temperature: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Returns the indices of at most `width` distinct entries of `scores`, sampled with Boltzmann weights.
+
+    At low temperatures the weights of all but the best entries underflow to 0: only the entries of
+    non-zero weight are sampled, and the rest of the beam is filled with the best remaining entries, so the
+    selection approaches that of `beam_search`.
+    """
+    if len(scores) <= width:
+        return np.arange(len(scores));
+    weights = np.exp(-(scores - scores.min()) / max(temperature, 1e-12));
+    sampled = min(width, int(np.count_nonzero(weights)));
+    chosen = rng.choice(len(scores), size=sampled, replace=False, p=weights / weights.sum());
+    if sampled == width:
+        return chosen;
+    rest = np.ones(len(scores), dtype=bool);
+    rest[chosen] = False;
+    rest = np.flatnonzero(rest);
+    best = rest[np.argpartition(scores[rest], width - sampled - 1)[:width - sampled]];
+    return np.concatenate([chosen, best]);
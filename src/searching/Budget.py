@@ -0,0 +1,105 @@
+""" src/searching/Budget.py
+Time, node and memory budgets with cooperative cancellation for the search entry points.
+
+Classes:
+    -   CancellationToken
+        Thread-safe flag a caller sets to stop a running search.
+    -   SearchBudget
+        Wall-clock deadline, expansion limit, frontier memory limit and cancellation token of a search.
+
+Budget checks are amortized: search loops call `SearchBudget.check` only on iterations that are
+multiples of `check_every`, so a budget costs one modulo per iteration. When a limit is hit the search
+stops and returns its best-so-far state with the matching `SearchStatus`.
+"""
+
+import  threading;
+import  time;
+from    .SearchResult   import SearchStatus;
+
+__all__ = ["CancellationToken", "SearchBudget"];
+
+
+class CancellationToken:
+    """
+    `CancellationToken` is shared between the caller and a running search. Calling `cancel()`, from any
+    thread, makes the search stop at its next budget check with `SearchStatus.CANCELLED`.
+    """
+    def __init__(self):
+        self._event = threading.Event();
+
+    def cancel(self) -> None:
+        self._event.set();
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set();
+
+
+class SearchBudget:
+    """
+    `SearchBudget` bounds the resources of a single search.
+
+    Attributes:
+        timeout (float | None): Seconds the search may run, counted from `start()`.
+        deadline (float | None): Absolute `time.monotonic()` value after which the search stops.
+        max_expansions (int | None): The maximum number of expanded nodes.
+        max_frontier_bytes (int | None): The maximum estimated size of the frontier, in bytes.
+        token (CancellationToken | None): Cancels the search when set.
+        check_every (int): Search loops check the budget every `check_every` expansions.
+    """
+    def __init__(self,  timeout: float | None = None,
+                        deadline: float | None = None,
+                        max_expansions: int | None = None,
+                        max_frontier_bytes: int | None = None,
+                        token: CancellationToken | None = None,
+                        check_every: int = 256):
+        """
+        Parameters:
+            timeout (float | None): Seconds the search may run. Combined with `deadline`, the earliest wins.
+            deadline (float | None): Absolute `time.monotonic()` deadline.
+            max_expansions (int | None): The maximum number of expanded nodes.
+            max_frontier_bytes (int | None): The maximum estimated size of the frontier, in bytes.
+            token (CancellationToken | None): Cancels the search when set.
+            check_every (int): The number of expansions between two budget checks.
+
+        Raises:
+            ValueError: If `check_every` is not positive.
+        """
+        if check_every < 1:
+            raise ValueError("check_every must be a positive integer");
+        self.timeout = timeout;
+        self.deadline = deadline;
+        self.max_expansions = max_expansions;
+        self.max_frontier_bytes = max_frontier_bytes;
+        self.token = token;
+        self.check_every = check_every;
+        self._deadline = deadline;
+
+    def start(self) -> None:
+        """
+        Starts the clock of the budget. Search entry points call this once, before their main loop.
+        """
+        if self.timeout is not None:
+            end = time.monotonic() + self.timeout;
+            self._deadline = end if self.deadline is None else min(end, self.deadline);
+
+    def check(self, expansions: int, frontier_bytes: int = 0) -> SearchStatus | None:
+        """
+        Returns the status the search must stop with, or `None` if it may continue.
+
+        Parameters:
+            expansions (int): The number of nodes expanded so far.
+            frontier_bytes (int): The estimated size of the frontier, in bytes.
+
+        Returns:
+            SearchStatus | None: `CANCELLED`, `TIMEOUT`, `NODE_LIMIT` or `MEMORY_LIMIT`, or `None`.
+        """
+        if self.token is not None and self.token.cancelled:
+            return SearchStatus.CANCELLED;
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return SearchStatus.TIMEOUT;
+        if self.max_expansions is not None and expansions >= self.max_expansions:
+            return SearchStatus.NODE_LIMIT;
+        if self.max_frontier_bytes is not None and frontier_bytes > self.max_frontier_bytes:
+            return SearchStatus.MEMORY_LIMIT;
+        return None;
@@ -0,0 +1,548 @@
+""" src/searching/CSP.py
+Constraint satisfaction problems over finite domains, with propagation-based and local search solvers.
+
+Classes:
+    -   CSP
+        Variables with bitset domains over a shared value list, and binary constraints.
+    -   SudokuCSP
+        A `SudokuBoard` of any box size as a CSP: cells differ from their peers.
+    -   ColoringCSP
+        The coloring of a graph with `colors` colors: adjacent nodes differ.
+
+Methods:
+    -   backtracking_search
+        Depth-first search with MRV/degree variable ordering, LCV value ordering and forward checking
+        or maintained arc consistency.
+    -   min_conflicts
+        Local search repairing a complete assignment, one conflicted variable at a time.
+
+Domains are Python ints used as bitsets: bit `i` stands for `values[i]`. A binary constraint on `(x, y)`
+is stored, for each direction, as a support table: `support[a]` is the bitset of the values of `y`
+compatible with value `a` of `x`. Revising `x` against `y` is then one AND per value of `x`
+(bit-parallel AC-3, which subsumes the support bookkeeping of AC-2001 for domains of machine-word
+size). Difference constraints, the only kind Sudoku and coloring need, have no table at all: `x` loses
+a value only when `y` is fixed to it.
+"""
+
+import  logging;
+import  random;
+from    collections     import deque;
+from    typing          import Any, Callable, Iterable;
+from    .SearchStats    import SearchStats, resolve_stats;
+from    .SearchResult   import SearchResult, SearchStatus;
+from    .Progress       import ProgressReporter, as_progress;
+from    .Budget         import SearchBudget;
+
+__all__ = ["CSP", "SudokuCSP", "ColoringCSP", "backtracking_search", "min_conflicts"];
+
+logger = logging.getLogger(__name__);
+
+DOMAIN_BYTES : int = 32;
+"""Estimated bytes per variable of a copy of the domains, used for memory budgets."""
+
+
+class CSP:
+    """
+    `CSP` is a set of variables `0, ..., len(domains) - 1` taking values in a shared list, with binary
+    constraints between them.
+
+    Attributes:
+        values (list): The values; domains are bitsets of indices into this list.
+        domains (list[int]): The initial domain of each variable.
+        neighbors (list[dict[int, list[int] | None]]): For each variable `x`, maps each constrained
+            variable `y` to the support table of `(x, y)`, or to `None` for a difference constraint.
+
+    Methods:
+        Modelling
+            restrict(var: int, allowed: Iterable)
+            assign(var: int, value: Any)
+            add_different(x: int, y: int)
+            add_all_different(variables: Iterable[int])
+            add_constraint(x: int, y: int, relation: Callable[[Any, Any], bool])
+
+        Propagation
+            revise(domains: list[int], x: int, y: int) -> bool
+            ac3(domains: list[int], arcs: Iterable[tuple[int, int]] | None = None) -> bool
+            forward_check(domains: list[int], var: int) -> bool
+            is_consistent(domains: list[int]) -> bool
+
+        Results
+            decode(assignment: list[Any]) -> Any
+    """
+    def __init__(self, variables: int, values: list[Any]):
+        """
+        Parameters:
+            variables (int): The number of variables.
+            values (list): The values of the variables. Every domain starts with all of them.
+        """
+        self.values = list(values);
+        self._index = {v: i for i, v in enumerate(self.values)};
+        self._full = (1 << len(self.values)) - 1;
+        self.domains : list[int] = [self._full] * variables;
+        self.neighbors : list[dict[int, list[int] | None]] = [{} for _ in range(variables)];
+
+    def __len__(self) -> int:
+        return len(self.domains);
+
+    #   Modelling
+    def restrict(self, var: int, allowed: Iterable[Any]) -> None:
+        """
+        Removes from the domain of `var` the values not in `allowed`.
+        """
+        mask = 0;
+        for value in allowed:
+            mask |= 1 << self._index[value];
+        self.domains[var] &= mask;
+
+    def assign(self, var: int, value: Any) -> None:
+        """
+        Fixes `var` to `value`.
+        """
+        self.domains[var] = 1 << self._index[value];
+
+    def add_different(self, x: int, y: int) -> None:
+        """
+        Constrains `x` and `y` to take different values.
+        """
+        self._add(x, y, None);
+        self._add(y, x, None);
+
+    def add_all_different(self, variables: Iterable[int]) -> None:
+        """
+        Constrains `variables` to take pairwise different values.
+        """
+        variables = list(variables);
+        for i, x in enumerate(variables):
+            for y in variables[i + 1:]:
+                self.add_different(x, y);
+
+    def add_constraint(self, x: int, y: int, relation: Callable[[Any, Any], bool]) -> None:
+        """
+        Constrains `(x, y)` to satisfy `relation(value_x, value_y)`.
+        """
+        values = self.values;
+        forward = [sum(1 << j for j, b in enumerate(values) if relation(a, b)) for a in values];
+        backward = [sum(1 << i for i, a in enumerate(values) if relation(a, b)) for b in values];
+        self._add(x, y, forward);
+        self._add(y, x, backward);
+
+    def _add(self, x: int, y: int, table: list[int] | None) -> None:
+        """
+        Adds the support table of `(x, y)`, intersecting it with an existing constraint on the same pair.
+        """
+        if x == y:
+            raise ValueError("Constraints must relate two different variables");
+        if y not in self.neighbors[x]:
+            self.neighbors[x][y] = table;
+            return;
+        old = self.neighbors[x][y];
+        old = _difference_table(len(self.values)) if old is None else old;
+        new = _difference_table(len(self.values)) if table is None else table;
+        self.neighbors[x][y] = [a & b for a, b in zip(old, new)];
+
+    def _compatible(self, x: int, a: int, y: int, b: int) -> bool:
+        """
+        Returns True if value index `a` of `x` and value index `b` of `y` satisfy their constraint.
+        """
+        table = self.neighbors[x][y];
+        return a != b if table is None else (table[a] >> b) & 1 == 1;
+
+    #   Propagation
+    def revise(self, domains: list[int], x: int, y: int) -> bool:
+        """
+        Removes from the domain of `x` the values without support in the domain of `y`.
+        Returns True if the domain of `x` changed.
+        """
+        dx, dy = domains[x], domains[y];
+        table = self.neighbors[x][y];
+        if table is None:
+            #   Difference: only a fixed `y` removes a value
+            if dy & (dy - 1) or not dx & dy:
+                return False;
+            domains[x] = dx & ~dy;
+            return True;
+        kept, bits = dx, dx;
+        while bits:
+            bit = bits & -bits;
+            bits ^= bit;
+            if not table[bit.bit_length() - 1] & dy:
+                kept &= ~bit;
+        if kept == dx:
+            return False;
+        domains[x] = kept;
+        return True;
+
+    def ac3(self, domains: list[int], arcs: Iterable[tuple[int, int]] | None = None) -> bool:
+        """
+        Makes `domains` arc consistent, in place, starting from `arcs` (all the arcs by default).
+        Returns False if a domain becomes empty.
+        """
+        if arcs is None:
+            arcs = ((x, y) for x in range(len(domains)) for y in self.neighbors[x]);
+        queue = deque(arcs);
+        queued = set(queue);
+        while queue:
+            arc = queue.popleft();
+            queued.discard(arc);
+            x, y = arc;
+            if self.revise(domains, x, y):
+                if domains[x] == 0:
+                    return False;
+                for z in self.neighbors[x]:
+                    if z != y and (z, x) not in queued:
+                        queue.append((z, x));
+                        queued.add((z, x));
+        return True;
+
+    def forward_check(self, domains: list[int], var: int) -> bool:
+        """
+        Revises the neighbors of `var` against it, in place, and goes on from every neighbor this fixes to a
+        single value. Returns False if a domain becomes empty.
+        """
+        stack = [var];
+        while stack:
+            x = stack.pop();
+            for y in self.neighbors[x]:
+                if self.revise(domains, y, x):
+                    dy = domains[y];
+                    if dy == 0:
+                        return False;
+                    if dy & (dy - 1) == 0:
+                        stack.append(y);
+        return True;
+
+    def is_consistent(self, domains: list[int]) -> bool:
+        """
+        Returns True if every variable has a single value and all the constraints hold.
+        """
+        index = [d.bit_length() - 1 for d in domains];
+        if any(d == 0 or d & (d - 1) for d in domains):
+            return False;
+        return all(self._compatible(x, index[x], y, index[y])
+                   for x in range(len(domains)) for y in self.neighbors[x] if x < y);
+
+    #   Results
+    def decode(self, assignment: list[Any]) -> Any:
+        """
+        Returns the solution represented by `assignment`, the value of each variable. Front-ends override it.
+        """
+        return assignment;
+
+
+class SudokuCSP(CSP):
+    """
+    `SudokuCSP` is a `SudokuBoard` as a CSP: one variable per cell, in row-major order, with the values
+    `1..size`, the given cells fixed and every cell different from its peers.
+    """
+    def __init__(self, board):
+        """
+        Parameters:
+            board (SudokuBoard): The board to solve.
+        """
+        from .sudoku import Vectorized;
+        g = Vectorized.geometry(board.n);
+        super().__init__(g.cells, list(range(1, g.size + 1)));
+        self.board = board;
+        for cell, value in enumerate(board.grid.ravel().tolist()):
+            if value:
+                self.assign(cell, value);
+        for cell, peers in enumerate(g.peers.tolist()):
+            for peer in peers:
+                if cell < peer:
+                    self.add_different(cell, peer);
+
+    def decode(self, assignment: list[Any]):
+        """
+        Returns the board with the values of `assignment`, keeping the fixed cells of the original board.
+        """
+        from .sudoku.Board import SudokuBoard;
+        board = self.board;
+        grid = board.grid.copy();
+        grid.ravel()[:] = [0 if v is None else v for v in assignment];
+        return SudokuBoard(grid, board.fixed.copy());
+
+
+class ColoringCSP(CSP):
+    """
+    `ColoringCSP` is the coloring of a graph with `colors` colors: one variable per node, in the order of
+    the adjacency list, with the values `0..colors - 1`, and adjacent nodes with different colors.
+
+    Attributes:
+        nodes (list): The node of each variable.
+    """
+    def __init__(self, graph: Any, colors: int):
+        """
+        Parameters:
+            graph: A `TGraph`, or any object with an `adjacencyList()` method.
+            colors (int): The number of colors.
+        """
+        adjacency = graph.adjacencyList();
+        self.nodes = list(adjacency);
+        super().__init__(len(self.nodes), list(range(colors)));
+        index = {node: i for i, node in enumerate(self.nodes)};
+        for node, neighbors in adjacency.items():
+            for other in neighbors:
+                if index[node] < index[other]:
+                    self.add_different(index[node], index[other]);
+
+    def decode(self, assignment: list[Any]) -> dict[Any, Any]:
+        """
+        Returns the color of each node.
+        """
+        return dict(zip(self.nodes, assignment));
+
+
+def _difference_table(size: int) -> list[int]:
+    full = (1 << size) - 1;
+    return [full & ~(1 << a) for a in range(size)];
+
+
+def _values_of(csp: CSP, domains: list[int]) -> list[Any]:
+    """
+    Returns the value of each variable with a single value, `None` for the others.
+    """
+    return [csp.values[d.bit_length() - 1] if d and not d & (d - 1) else None for d in domains];
+
+
+def backtracking_search(csp: CSP,
+                        inference: str = "mac",
+                        lcv: bool = True,
+                        stats: SearchStats | None = None,
+                        progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                        budget: SearchBudget | None = None) -> SearchResult:
+    """
+    Depth-first search over the domains of `csp`.
+
+    The initial domains are made arc consistent. Each node then picks the unfixed variable with the
+    fewest values (MRV), breaking ties by the most constrained neighbors (degree), tries its values in
+    least-constraining-first order (LCV) and propagates each choice.
+
+    Parameters:
+        csp (CSP): The problem.
+        inference (str): `"mac"` maintains arc consistency after each choice; `"forward"` does forward
+            checking, extended to the variables it fixes.
+        lcv (bool): Order values by the number of neighbor values they rule out. In index order otherwise.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, frontier memory and cancellation limits.
+
+    Returns:
+        SearchResult: `csp.decode` of the solution, or of the most constrained domains reached when the
+            search stopped early (`None` for unfixed variables). `EXHAUSTED` if there is no solution.
+
+    Raises:
+        ValueError: If `inference` is not `"mac"` or `"forward"`.
+    """
+    if inference not in ("mac", "forward"):
+        raise ValueError("inference must be 'mac' or 'forward'");
+    stats    = resolve_stats(stats, "backtracking_search");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+    if budget is not None:
+        budget.start();
+
+    neighbors = csp.neighbors;
+    domains = list(csp.domains);
+    status = SearchStatus.EXHAUSTED;
+    best = domains;
+    i = 0;
+    stack : list[list[int]] = [domains] if csp.ac3(domains) else [];
+    while stack:
+        if budget is not None and i % budget.check_every == 0:
+            stop = budget.check(i, len(stack) * len(domains) * DOMAIN_BYTES);
+            if stop is not None:
+                status = stop;
+                break;
+        domains = stack.pop();
+        i += 1;
+
+        #   MRV, ties broken by degree among the unfixed variables
+        var, size, degree = -1, 0, -1;
+        for x, d in enumerate(domains):
+            if d & (d - 1):
+                count = d.bit_count();
+                if var < 0 or count < size or (count == size and len(neighbors[x]) > degree):
+                    var, size, degree = x, count, len(neighbors[x]);
+        if var < 0:
+            if csp.is_consistent(domains):
+                best = domains;
+                status = SearchStatus.SOLVED;
+                break;
+            continue;
+        if sum(d.bit_count() for d in domains) < sum(d.bit_count() for d in best):
+            best = domains;
+
+        #   Values, least constraining first
+        choices = [];
+        bits = domains[var];
+        while bits:
+            bit = bits & -bits;
+            bits ^= bit;
+            choices.append(bit);
+        if lcv:
+            choices.sort(key=lambda bit: _ruled_out(csp, domains, var, bit));
+
+        children = [];
+        for bit in choices:
+            child = list(domains);
+            child[var] = bit;
+            if inference == "mac":
+                ok = csp.ac3(child, ((y, var) for y in neighbors[var]));
+            else:
+                ok = csp.forward_check(child, var);
+            if ok:
+                children.append(child);
+        #   Pushed in reverse, so the least constraining value is explored first
+        stack.extend(reversed(children));
+
+        if stats is not None:
+            stats.node_expanded();
+            stats.nodes_generated(len(children));
+            stats.update_max_frontier(len(stack));
+        if progress is not None and i % progress.every == 0:
+            progress.report(i, frontier=len(stack), variable=var);
+
+    logger.debug("backtracking_search: %s after %d nodes", status.value, i);
+    if stats is not None:
+        stats.finish();
+    return SearchResult(csp.decode(_values_of(csp, best)), status, i, stats);
+
+
+def _ruled_out(csp: CSP, domains: list[int], var: int, bit: int) -> int:
+    """
+    Returns the number of values of the neighbors of `var` incompatible with `var` taking value `bit`.
+    """
+    a = bit.bit_length() - 1;
+    total = 0;
+    for y, table in csp.neighbors[var].items():
+        dy = domains[y];
+        total += (dy & bit != 0) if table is None else (dy & ~table[a]).bit_count();
+    return total;
+
+
+def min_conflicts(csp: CSP,
+                  max_steps: int = 100000,
+                  rng: random.Random | None = None,
+                  stats: SearchStats | None = None,
+                  progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                  budget: SearchBudget | None = None) -> SearchResult:
+    """
+    Min-conflicts local search: starts from a random complete assignment within the domains (made arc
+    consistent first), then repeatedly gives a random conflicted variable the value of its domain with
+    the fewest conflicts, ties broken at random.
+
+    Parameters:
+        csp (CSP): The problem.
+        max_steps (int): The maximum number of repairs.
+        rng (random.Random | None): The random number generator. Defaults to the `random` module.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, frontier memory and cancellation limits.
+
+    Returns:
+        SearchResult: `csp.decode` of the solution, or of the assignment with the fewest conflicts, with
+            the number of violated constraints as `cost`. `EXHAUSTED` if a domain is empty.
+    """
+    rng = random if rng is None else rng;
+    stats    = resolve_stats(stats, "min_conflicts");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+    if budget is not None:
+        budget.start();
+
+    domains = list(csp.domains);
+    if not csp.ac3(domains):
+        if stats is not None:
+            stats.finish();
+        return SearchResult(csp.decode(_values_of(csp, domains)), SearchStatus.EXHAUSTED, 0, stats);
+    options = [[b for b in range(len(csp.values)) if d >> b & 1] for d in domains];
+    value = [rng.choice(o) for o in options];
+    neighbors = csp.neighbors;
+
+    def conflicts_of(x: int, a: int) -> int:
+        return sum(not csp._compatible(x, a, y, value[y]) for y in neighbors[x]);
+
+    #   Conflicts of each variable, and the variables with at least one
+    conflicts = [conflicts_of(x, value[x]) for x in range(len(value))];
+    conflicted = {x for x, c in enumerate(conflicts) if c};
+    total = sum(conflicts) // 2;
+    best, best_total = list(value), total;
+    status = SearchStatus.ITERATION_LIMIT;
+    step = 0;
+    for step in range(max_steps):
+        if not conflicted:
+            status = SearchStatus.SOLVED;
+            break;
+        if budget is not None and step % budget.check_every == 0:
+            stop = budget.check(step, 0);
+            if stop is not None:
+                status = stop;
+                break;
+
+        x = rng.choice(tuple(conflicted));
+        scores = [conflicts_of(x, a) for a in options[x]];
+        low = min(scores);
+        a = rng.choice([o for o, s in zip(options[x], scores) if s == low]);
+        old = value[x];
+        if a != old:
+            value[x] = a;
+            for y in neighbors[x]:
+                delta = (not csp._compatible(x, a, y, value[y])) - (not csp._compatible(x, old, y, value[y]));
+                if delta:
+                    conflicts[y] += delta;
+                    conflicts[x] += delta;
+                    total += delta;
+                    for z in (x, y):
+                        if conflicts[z]:
+                            conflicted.add(z);
+                        else:
+                            conflicted.discard(z);
+        if total < best_total:
+            best, best_total = list(value), total;
+
+        if stats is not None:
+            stats.node_expanded(conflicts[x]);
+            stats.nodes_generated(len(options[x]));
+        if progress is not None and step % progress.every == 0:
+            progress.report(step, conflicts=total, best=best_total);
+    else:
+        if not conflicted:
+            status = SearchStatus.SOLVED;
+        step = max_steps;
+
+    if status is SearchStatus.SOLVED:
+        best, best_total = value, 0;
+    logger.debug("min_conflicts: %s after %d steps, %d conflicts", status.value, step, best_total);
+    if stats is not None:
+        stats.finish();
+    return SearchResult(csp.decode([csp.values[a] for a in best]), status, step, stats, cost=best_total);
+
+
+if __name__ == "__main__":
+    import  time;
+    from    .sudoku.Board       import SudokuBoard, b_1;
+    from    .sudoku.Generator   import generate, to_boards;
+
+    logging.basicConfig(level=logging.INFO);
+
+    #   Sudoku
+    for board in [SudokuBoard.from_string(b_1)] + to_boards(generate(3, difficulty="expert", seed=0)[0]):
+        for inference in ("mac", "forward"):
+            start = time.perf_counter();
+            result = backtracking_search(SudokuCSP(board), inference=inference);
+            print(inference, result, result.state.is_solved(), f"{time.perf_counter() - start:.3f}s");
+
+    #   Colorings: K4 needs four colors, the Petersen graph three
+    import  numpy as np;
+    from    model.ConcreteDataTypes import Kn;
+    from    model.GraphGenerators   import to_graph;
+
+    for colors in (3, 4):
+        print("K4", colors, backtracking_search(ColoringCSP(Kn(4), colors)).status.value);
+    petersen = to_graph(10, np.array([(i, (i + 1) % 5) for i in range(5)] + [(i, i + 5) for i in range(5)]
+                                     + [(5 + i, 5 + (i + 2) % 5) for i in range(5)]));
+    for colors in (2, 3):
+        print("Petersen", colors, backtracking_search(ColoringCSP(petersen, colors)),
+              min_conflicts(ColoringCSP(petersen, colors), max_steps=1000, rng=random.Random(0)).cost);
@@ -0,0 +1,162 @@
+""" src/searching/Checkpoint.py
+Checkpoint and resume for long-running searches.
+
+Classes:
+    -   Checkpoint
+        A snapshot of a search: named NumPy arrays (packed frontier, closed set, ...) and JSON metadata.
+    -   Checkpointer
+        Decides when a search saves its snapshot and where, and loads it back on resume.
+
+Functions:
+    -   pack_rng, unpack_rng
+        Convert the state of a `random.Random` (or of the `random` module) to and from a NumPy array.
+
+A checkpoint is a single `.npz` file. Searches store their states as packed integer
+arrays, one row per state, so a snapshot of millions of states is one contiguous block per array and
+loads without building Python objects. Files are written to a temporary name and renamed, so an eviction
+while saving leaves the previous checkpoint intact.
+"""
+
+import  json;
+import  os;
+import  time;
+from    typing  import Any;
+
+import  numpy as np;
+
+__all__ = ["Checkpoint", "Checkpointer", "pack_rng", "unpack_rng"];
+
+FORMAT_VERSION : int = 1;
+
+
+class Checkpoint:
+    """
+    `Checkpoint` is the snapshot of a search.
+
+    Attributes:
+        kind (str): The name of the search that wrote the checkpoint, checked on load.
+        arrays (dict[str, np.ndarray]): Packed search data, e.g. `frontier` and `visited`.
+        meta (dict[str, Any]): JSON-serializable scalars, e.g. the iteration and the stats.
+    """
+    def __init__(self, kind: str, arrays: dict[str, np.ndarray] | None = None, meta: dict[str, Any] | None = None):
+        self.kind = kind;
+        self.arrays = arrays if arrays is not None else {};
+        self.meta = meta if meta is not None else {};
+
+    def save(self, path: str) -> None:
+        """
+        Atomically writes the checkpoint to `path`.
+
+        Parameters:
+            path (str): The destination file. A `.npz` suffix is not added.
+        """
+        header = {"version": FORMAT_VERSION, "kind": self.kind, "meta": self.meta};
+        payload = dict(self.arrays);
+        payload["__header__"] = np.frombuffer(json.dumps(header).encode(), dtype=np.uint8);
+        tmp = f"{path}.tmp";
+        with open(tmp, "wb") as f:
+            np.savez(f, **payload);
+            f.flush();
+            os.fsync(f.fileno());
+        os.replace(tmp, path);
+
+    @classmethod
+    def load(cls, path: str, kind: str | None = None) -> "Checkpoint":
+        """
+        Reads a checkpoint written by `save`.
+
+        Parameters:
+            path (str): The checkpoint file.
+            kind (str | None): If given, the expected `kind` of the checkpoint.
+
+        Raises:
+            ValueError: If the file has an unknown version or a different `kind`.
+
+        Returns:
+            Checkpoint: The loaded checkpoint.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(data["__header__"].tobytes().decode());
+            arrays = {name: data[name] for name in data.files if name != "__header__"};
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {header['version']}");
+        if kind is not None and header["kind"] != kind:
+            raise ValueError(f"Checkpoint was written by {header['kind']}, not {kind}");
+        return cls(header["kind"], arrays, header["meta"]);
+
+
+class Checkpointer:
+    """
+    `Checkpointer` tells a search when to snapshot itself and where.
+
+    A search saves a checkpoint every `every` iterations, or every `interval` seconds (checked only on
+    those iterations), and once more when it stops early on its budget. On start, it resumes from `path`
+    if the file exists and `resume` is True.
+
+    Attributes:
+        path (str): The checkpoint file.
+        every (int): Iterations between two checks.
+        interval (float | None): Minimum seconds between two saves. When `None`, every check saves.
+        resume (bool): Whether to resume from an existing checkpoint.
+        remove_on_finish (bool): Whether to delete the checkpoint when the search solves or exhausts.
+    """
+    def __init__(self,  path: str,
+                        every: int = 10000,
+                        interval: float | None = None,
+                        resume: bool = True,
+                        remove_on_finish: bool = False):
+        if every < 1:
+            raise ValueError("every must be a positive integer");
+        self.path = path;
+        self.every = every;
+        self.interval = interval;
+        self.resume = resume;
+        self.remove_on_finish = remove_on_finish;
+        self._last = time.monotonic();
+
+    def due(self, iteration: int) -> bool:
+        """
+        Returns True if the search should save a checkpoint at `iteration`.
+        """
+        if iteration == 0 or iteration % self.every != 0:
+            return False;
+        if self.interval is None:
+            return True;
+        return time.monotonic() - self._last >= self.interval;
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        checkpoint.save(self.path);
+        self._last = time.monotonic();
+
+    def load(self, kind: str) -> Checkpoint | None:
+        """
+        Returns the checkpoint to resume from, or `None` if there is none or `resume` is False.
+        """
+        if not self.resume or not os.path.exists(self.path):
+            return None;
+        return Checkpoint.load(self.path, kind);
+
+    def finish(self) -> None:
+        """
+        Called by the search when it solved or exhausted its frontier.
+        """
+        if self.remove_on_finish and os.path.exists(self.path):
+            os.remove(self.path);
+
+
+def pack_rng(rng) -> tuple[np.ndarray, dict[str, Any]]:
+    """
+    Packs the state of `rng` (a `random.Random` or the `random` module) into an array and metadata.
+
+    Returns:
+        tuple[np.ndarray, dict]: The Mersenne Twister state words and the remaining scalar fields.
+    """
+    version, internal, gauss = rng.getstate();
+    return np.array(internal, dtype=np.uint32), {"version": version, "gauss": gauss};
+
+
+def unpack_rng(rng, words: np.ndarray, meta: dict[str, Any]) -> None:
+    """
+    Restores into `rng` a state packed by `pack_rng`.
+    """
+    rng.setstate((meta["version"], tuple(int(w) for w in words), meta["gauss"]));
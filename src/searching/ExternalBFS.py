@@ -0,0 +1,337 @@
+""" src/searching/ExternalBFS.py
+External-memory breadth-first search over states packed into 64-bit integers.
+Methods:
+    -   external_bfs
+        Enumerates the layers of a state space, keeping every layer on disk.
+
+The visited set of a full enumeration (all 181,440 states of the 8-puzzle, regions of the 15-puzzle,
+the states of a pattern database) does not have to fit in memory: only the bounded buffers of the current
+step do. Each layer is a file of sorted, distinct `uint64` keys. A layer is expanded in blocks read through
+a memory map; the successors are sorted and written out as runs of at most `run_size` keys, and the runs
+are merged k-way into the next layer, dropping the keys found in the previous two layers. In a graph whose
+moves are all reversible, as those of the sliding puzzles, the successors of layer `d` lie in layers
+`d - 1`, `d` and `d + 1`, so no other layer is needed for duplicate detection (frontier search with
+delayed duplicate detection).
+
+Files are raw little-endian `uint64` arrays named `layer-DDDD.u64` and `run-DDDD-RRRR.u64`. Since the
+layers are on disk, a checkpoint after a layer only holds its depth and the counters: a resumed search
+expands the last complete layer again, from the files.
+"""
+
+import  logging;
+import  os;
+import  shutil;
+import  tempfile;
+import  numpy as np;
+from    typing                  import Any, Callable;
+from    .SearchStats            import SearchStats, resolve_stats;
+from    .SearchResult           import SearchResult, SearchStatus;
+from    .Progress               import ProgressReporter, as_progress;
+from    .Budget                 import SearchBudget;
+from    .Checkpoint             import Checkpoint, Checkpointer;
+
+__all__ = ["external_bfs"];
+
+logger = logging.getLogger(__name__);
+
+KEY = np.dtype("<u8");
+"""The on-disk type of the keys."""
+
+
+def _layer_path(directory: str, depth: int) -> str:
+    return os.path.join(directory, f"layer-{depth:04d}.u64");
+
+
+def _open(path: str) -> np.ndarray:
+    """
+    Maps a file of keys read-only. Empty files, which `np.memmap` rejects, give an empty array.
+    """
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=KEY);
+    return np.memmap(path, dtype=KEY, mode="r");
+
+
+def _drop(chunk: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """
+    Returns the keys of the sorted `chunk` not in the sorted `keys`. `keys` may be a memory map: the
+    binary searches only touch the pages they need.
+    """
+    if len(keys) == 0 or len(chunk) == 0:
+        return chunk;
+    i = np.searchsorted(keys, chunk);
+    found = keys[np.minimum(i, len(keys) - 1)] == chunk;
+    return chunk[~found];
+
+
+def _merge(runs: list[np.ndarray], exclude: list[np.ndarray], out, block_size: int,
+           emit: Callable[[np.ndarray], bool]) -> int:
+    """
+    Merges sorted runs of keys into `out`, without duplicates and without the keys of the sorted
+    `exclude` arrays.
+
+    Every step loads the next `block_size` keys of each run and writes out the keys up to the smallest
+    last key of the blocks of unfinished runs, so at least one block is consumed per step and no key
+    written later can be smaller. The excluded arrays are scanned with cursors, in step with the output.
+
+    Parameters:
+        runs (list[np.ndarray]): Sorted arrays of distinct keys.
+        exclude (list[np.ndarray]): Sorted arrays of keys to leave out.
+        out (file): The binary file the merged keys are appended to.
+        block_size (int): The number of keys loaded per run and step.
+        emit (Callable): Called with every merged chunk before it is written; stops the merge when it
+            returns True.
+
+    Returns:
+        int: The number of keys written.
+    """
+    cursors = [0] * len(runs);
+    skip = [0] * len(exclude);
+    written = 0;
+    while True:
+        live = [i for i, run in enumerate(runs) if cursors[i] < len(run)];
+        if not live:
+            return written;
+        blocks = {i: np.asarray(runs[i][cursors[i]:cursors[i] + block_size]) for i in live};
+        bounded = [blocks[i][-1] for i in live if cursors[i] + len(blocks[i]) < len(runs[i])];
+        limit = min(bounded) if bounded else None;
+
+        parts = [];
+        for i, block in blocks.items():
+            n = len(block) if limit is None else int(np.searchsorted(block, limit, side="right"));
+            parts.append(block[:n]);
+            cursors[i] += n;
+        chunk = np.unique(np.concatenate(parts));
+
+        #   The cursors advance to the last merged key, even when a layer drops the whole chunk
+        last = chunk[-1];
+        for j, keys in enumerate(exclude):
+            end = skip[j] + int(np.searchsorted(keys[skip[j]:], last, side="right"));
+            chunk = _drop(chunk, keys[skip[j]:end]);
+            skip[j] = end;
+
+        if len(chunk) == 0:
+            continue;
+        stop = emit(chunk);
+        chunk.astype(KEY, copy=False).tofile(out);
+        written += len(chunk);
+        if stop:
+            return written;
+
+
+def external_bfs(initial: int | np.ndarray,
+                 expand: Callable[[np.ndarray], np.ndarray],
+                 goal: int | None = None,
+                 max_depth: int | None = None,
+                 directory: str | None = None,
+                 keep_layers: bool = False,
+                 run_size: int = 1 << 22,
+                 block_size: int = 1 << 16,
+                 on_layer: Callable[[int, np.ndarray], None] | None = None,
+                 stats: SearchStats | None = None,
+                 progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                 budget: SearchBudget | None = None,
+                 checkpointer: Checkpointer | None = None) -> SearchResult:
+    """
+    Breadth-first search with the layers, and the runs they are merged from, on disk. Memory holds at
+    most about `run_size + len(runs) * block_size` keys, whatever the size of the state space.
+
+    Every move must be reversible (the state graph undirected): duplicates are only looked up in the two
+    previous layers.
+
+    Parameters:
+        initial (int | np.ndarray): The key, or keys, of the initial states.
+        expand (Callable): Maps a `uint64` array of keys to the array of the keys of their successors,
+            e.g. `SlidingPuzzle.expand_keys`.
+        goal (int | None): Stop when this key is reached. Enumerate the whole state space when `None`.
+        max_depth (int | None): The maximum depth of the layers. Unbounded when `None`.
+        directory (str | None): Where to write the files. A temporary directory, removed on return,
+            when `None`.
+        keep_layers (bool): Keep every layer file in `directory`, e.g. to build a pattern database from.
+            Otherwise, a layer is removed once it can no longer hold duplicates.
+        run_size (int): The maximum number of keys of a run, i.e. sorted in memory at once.
+        block_size (int): The number of keys expanded at once, and read per run in the merges.
+        on_layer (Callable | None): Called with the depth and the memory-mapped keys of every layer once
+            it is complete. The map is only valid during the call.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives progress updates, checked once per block.
+        budget (SearchBudget | None): Deadline, expansion, memory (of the in-memory buffers) and
+            cancellation limits, checked once per block.
+        checkpointer (Checkpointer | None): Saves the search after every complete layer (its `every` and
+            `interval` are not used), and resumes it from an existing checkpoint and the layer files of
+            `directory`: a layer interrupted by the budget, or by a crash, is expanded again. `on_layer`
+            is not called again for the layers completed before the resume.
+
+    Returns:
+        SearchResult: The `goal` with its depth as `cost` when it was reached. Otherwise, the first key of
+            the deepest layer with its depth as `cost`; `status` is `EXHAUSTED` when every reachable state
+            was enumerated. `iterations` is the number of layers expanded.
+
+    Raises:
+        ValueError: If `keep_layers` or `checkpointer` is set without a `directory`, `run_size` or
+            `block_size` is not positive, or the layers of a checkpoint are missing from `directory`.
+    """
+    if (keep_layers or checkpointer is not None) and directory is None:
+        raise ValueError("keep_layers and checkpointer need a directory");
+    if run_size < 1 or block_size < 1:
+        raise ValueError("run_size and block_size must be positive integers");
+
+    stats    = resolve_stats(stats, "external_bfs");
+    progress = as_progress(progress);
+
+    owned = directory is None;
+    directory = tempfile.mkdtemp(prefix="external_bfs-") if owned else directory;
+    os.makedirs(directory, exist_ok=True);
+
+    #   Resume from the last complete layer of a previous run, or start from the initial states
+    checkpoint = checkpointer.load("external_bfs") if checkpointer is not None else None;
+    status : SearchStatus | None = None;
+    if checkpoint is not None:
+        depth, expanded, deepest = _restore_external_bfs(checkpoint, directory, stats);
+    else:
+        layer = np.unique(np.atleast_1d(np.asarray(initial, dtype=np.uint64)));
+        layer.astype(KEY, copy=False).tofile(_layer_path(directory, 0));
+        deepest, depth, expanded = int(layer[0]), 0, 0;
+        status = SearchStatus.SOLVED if goal is not None and goal in layer else None;
+        if on_layer is not None:
+            on_layer(0, layer);
+        if stats is not None:
+            stats.update_max_frontier(len(layer));
+        del layer;
+    if stats is not None:
+        stats.start_timer();
+    if budget is not None:
+        budget.start();
+    if checkpointer is not None and checkpoint is None:
+        checkpointer.save(_snapshot_external_bfs(depth, expanded, deepest, stats));
+
+    def spill(buffer: list[np.ndarray], runs: list[str]) -> None:
+        path = os.path.join(directory, f"run-{depth + 1:04d}-{len(runs):04d}.u64");
+        np.unique(np.concatenate(buffer)).astype(KEY, copy=False).tofile(path);
+        runs.append(path);
+        buffer.clear();
+
+    def emit(chunk: np.ndarray) -> bool:
+        return goal is not None and bool(np.any(chunk == np.uint64(goal)));
+
+    try:
+        while status is None:
+            if max_depth is not None and depth >= max_depth:
+                status = SearchStatus.ITERATION_LIMIT;
+                break;
+
+            #   Expand the layer in blocks into sorted runs
+            current = _open(_layer_path(directory, depth));
+            runs : list[str] = [];
+            buffer : list[np.ndarray] = [];
+            buffered = 0;
+            for start in range(0, len(current), block_size):
+                if budget is not None:
+                    stop = budget.check(expanded, buffered * KEY.itemsize);
+                    if stop is not None:
+                        status = stop;
+                        break;
+                block = np.asarray(current[start:start + block_size]);
+                children = np.asarray(expand(block), dtype=np.uint64);
+                expanded += len(block);
+                if stats is not None:
+                    stats.nodes_expanded(len(block));
+                    stats.nodes_generated(len(children));
+                buffer.append(children);
+                buffered += len(children);
+                if buffered >= run_size:
+                    spill(buffer, runs);
+                    buffered = 0;
+                if progress is not None:
+                    progress.report(expanded, depth=depth, layer=len(current), runs=len(runs));
+            del current;
+            if status is not None:
+                for path in runs:
+                    os.remove(path);
+                break;
+            if buffer:
+                spill(buffer, runs);
+            if stats is not None:
+                stats.count("runs", len(runs));
+
+            #   Merge the runs into the next layer, without the keys of the two previous layers
+            maps = [_open(path) for path in runs];
+            exclude = [_open(_layer_path(directory, d)) for d in (depth, depth - 1) if d >= 0];
+            with open(_layer_path(directory, depth + 1), "wb") as out:
+                size = _merge(maps, exclude, out, block_size, emit);
+            del maps, exclude;
+            for path in runs:
+                os.remove(path);
+            if not keep_layers and depth >= 1:
+                os.remove(_layer_path(directory, depth - 1));
+            if size == 0:
+                status = SearchStatus.EXHAUSTED;
+                break;
+
+            depth += 1;
+            layer = _open(_layer_path(directory, depth));
+            deepest = int(layer[0]);
+            logger.debug("external_bfs: layer %d, %d states, %d runs", depth, size, len(runs));
+            if stats is not None:
+                stats.update_max_frontier(size);
+            if goal is not None and bool(np.any(layer == np.uint64(goal))):
+                #   The merge stopped at the goal: the layer is incomplete
+                status = SearchStatus.SOLVED;
+            else:
+                if on_layer is not None:
+                    on_layer(depth, layer);
+                if checkpointer is not None:
+                    checkpointer.save(_snapshot_external_bfs(depth, expanded, deepest, stats));
+            del layer;
+    finally:
+        if owned:
+            shutil.rmtree(directory, ignore_errors=True);
+
+    if checkpointer is not None and status in (SearchStatus.SOLVED, SearchStatus.EXHAUSTED):
+        checkpointer.finish();
+    if stats is not None:
+        stats.count("layers", depth + 1);
+        stats.finish();
+    if status is SearchStatus.SOLVED:
+        return SearchResult(goal, status, depth, stats, cost=depth);
+    return SearchResult(deepest, status, depth, stats, cost=depth);
+
+
+def _snapshot_external_bfs(depth: int, expanded: int, deepest: int, stats: SearchStats | None) -> Checkpoint:
+    """
+    Snapshots `external_bfs` once the layer `depth` is complete on disk.
+    """
+    return Checkpoint("external_bfs", meta={
+        "depth": depth, "expanded": expanded, "deepest": deepest,
+        "stats": stats.state_dict() if stats is not None else None,
+    });
+
+
+def _restore_external_bfs(checkpoint: Checkpoint, directory: str, stats: SearchStats | None) -> tuple[int, int, int]:
+    """
+    Inverse of `_snapshot_external_bfs`: restores `stats` in place, removes the runs of the interrupted
+    layer and returns the depth, the expanded states and the first key of the last complete layer.
+    """
+    meta = checkpoint.meta;
+    depth = meta["depth"];
+    for d in (depth, depth - 1):
+        if d >= 0 and not os.path.exists(_layer_path(directory, d)):
+            raise ValueError(f"The layer {d} of the checkpoint is missing from {directory}");
+    for name in os.listdir(directory):
+        if name.startswith("run-"):
+            os.remove(os.path.join(directory, name));
+    if stats is not None and meta["stats"] is not None:
+        stats.load_state_dict(meta["stats"]);
+    return depth, meta["expanded"], meta["deepest"];
+
+
+if __name__ == "__main__":
+    from    .puzzle.SlidingPuzzle   import SlidingPuzzle, p8_1;
+    logging.basicConfig(level=logging.INFO);
+
+    puzzle = SlidingPuzzle.from_string(p8_1);
+    widths = [];
+    stats = SearchStats("external_bfs");
+    result = external_bfs(puzzle.key(puzzle.goal), puzzle.expand_keys, run_size=1 << 14, block_size=1 << 12,
+                          on_layer=lambda d, keys: widths.append(len(keys)), stats=stats);
+    print(result, "states:", sum(widths), "depth:", result.cost, "widths:", widths);
+    print(external_bfs(puzzle.key(puzzle.start), puzzle.expand_keys, goal=puzzle.key(puzzle.goal)).cost);
@@ -0,0 +1,246 @@
+""" src/searching/GeneticSearch.py
+Genetic algorithm for the Sudoku game, on populations encoded as arrays.
+Methods:
+    -   genetic_algorithm
+        Evolves populations of complete assignments, optionally as islands spread across processes.
+
+A population is one (P, cells) array of complete assignments whose rows are permutations of 1..size
+keeping the fixed cells (see `Vectorized.fill_rows`). Every operator works on the whole array:
+    -   fitness: `Vectorized.conflicts` over columns and boxes, lower is better;
+    -   selection: tournaments drawn as a (P, k) index array, winners by `argmin`;
+    -   crossover: each row of a child comes from one of its two parents, so children stay valid;
+    -   mutation: a random row swap of free cells, applied to a random subset of the children;
+    -   elitism: the best individuals are copied unchanged into the next generation.
+
+With `islands > 1` several populations evolve independently and, every `migration_every` generations,
+the best individuals of each island replace the worst of the next one (ring topology). Islands evolve
+in parallel when `max_workers > 1` or an `executor` is given.
+"""
+
+import  logging;
+import  numpy as np;
+from    concurrent.futures  import Executor, ProcessPoolExecutor;
+from    typing              import Any, Callable;
+from    .sudoku.GameState   import GameState, SudokuBoard as Board;
+from    .sudoku.Board       import solved_board;
+from    .sudoku             import Vectorized;
+from    .SearchStats        import SearchStats, resolve_stats;
+from    .SearchResult       import SearchResult, SearchStatus;
+from    .Progress           import ProgressReporter, as_progress;
+from    .Budget             import SearchBudget;
+from    .SolutionCache      import SolutionCache;
+
+__all__ = ["genetic_algorithm"];
+
+logger = logging.getLogger(__name__);
+
+
+def genetic_algorithm(board: Board,
+                      population: int = 256,
+                      generations: int = 2000,
+                      elite: int = 8,
+                      tournament: int = 3,
+                      crossover_rate: float = 0.9,
+                      mutation_rate: float = 0.5,
+                      islands: int = 1,
+                      migration_every: int = 50,
+                      migrants: int = 4,
+                      max_workers: int = 1,
+                      executor: Executor | None = None,
+                      rng: np.random.Generator | None = None,
+                      stats: SearchStats | None = None,
+                      progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                      budget: SearchBudget | None = None,
+                      cache: SolutionCache | None = None) -> SearchResult:
+    """
+    Genetic algorithm over complete assignments of `board`.
+
+    Parameters:
+        board (Board): The board to solve.
+        population (int): The number of individuals per island.
+        generations (int): The maximum number of generations.
+        elite (int): The number of best individuals copied unchanged into the next generation.
+        tournament (int): The number of individuals per selection tournament.
+        crossover_rate (float): The probability that a child mixes the rows of its two parents,
+            instead of copying the first one.
+        mutation_rate (float): The probability that a child undergoes a random row swap.
+        islands (int): The number of populations.
+        migration_every (int): The number of generations between migrations.
+        migrants (int): The number of individuals sent by each island at each migration.
+        max_workers (int): The number of processes evolving the islands, when `executor` is `None`.
+        executor (Executor | None): An executor evolving the islands, instead of a private process pool.
+        rng (np.random.Generator | None): The random number generator. Islands use generators spawned from it.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+            Each evaluated individual counts as an expanded node.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion and cancellation limits. It is checked between
+            epochs: every `migration_every` generations with islands, every generation otherwise.
+        cache (SolutionCache | None): Answers repeated or equivalent boards without searching, and
+            stores new solutions.
+
+    Returns:
+        SearchResult: The solved state, or the fittest individual, with its conflicts as `cost`.
+            `iterations` is the number of generations.
+    """
+    if cache is not None:
+        solution = cache.get_board(board);
+        if solution is not None:
+            return SearchResult(GameState(solution), SearchStatus.SOLVED, 0, stats, cost=0);
+    rng = np.random.default_rng() if rng is None else rng;
+    params = {
+        "grid": board.grid, "fixed": board.fixed, "elite": min(elite, population), "tournament": tournament,
+        "crossover_rate": crossover_rate, "mutation_rate": mutation_rate,
+    };
+    rngs = rng.spawn(islands);
+    pops = [Vectorized.fill_rows(board.grid, board.fixed, r, population) for r in rngs];
+    fits = [_fitness(p, board.n) for p in pops];
+    epoch = migration_every if islands > 1 else 1;
+    status = SearchStatus.ITERATION_LIMIT;
+    generation = 0;
+
+    stats    = resolve_stats(stats, "genetic_algorithm");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+        stats.set_initial_heuristic(float(min(f.min() for f in fits)));
+    if budget is not None:
+        budget.start();
+
+    own_executor = executor is None and islands > 1 and max_workers > 1;
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=min(max_workers, islands));
+    try:
+        while True:
+            best_fit = min(int(f.min()) for f in fits);
+            if best_fit == 0:
+                status = SearchStatus.SOLVED;
+                break;
+            if generation >= generations:
+                break;
+            if budget is not None:
+                stop = budget.check(generation * population * islands, sum(p.nbytes for p in pops));
+                if stop is not None:
+                    status = stop;
+                    break;
+
+            #   Evolve every island for one epoch
+            n = min(epoch, generations - generation);
+            jobs = [(params, p, f, r, n) for p, f, r in zip(pops, fits, rngs)];
+            if executor is not None:
+                results = list(executor.map(_evolve, jobs));
+            else:
+                results = [_evolve(job) for job in jobs];
+            pops, fits, rngs, done = map(list, zip(*results));
+            generation += max(done);
+            if stats is not None:
+                stats.nodes_expanded(sum(done) * population);
+                stats.nodes_generated(sum(done) * (population - params["elite"]));
+
+            #   Ring migration: the best of island i replace the worst of island i + 1
+            if islands > 1 and migrants > 0:
+                _migrate(pops, fits, min(migrants, population));
+                if stats is not None:
+                    stats.count("migrations");
+
+            if progress is not None and generation % progress.every < n:
+                progress.report(generation, best=min(int(f.min()) for f in fits),
+                                mean=float(np.mean([f.mean() for f in fits])));
+    finally:
+        if own_executor:
+            executor.shutdown();
+
+    island = min(range(islands), key=lambda k: fits[k].min());
+    best = pops[island][int(np.argmin(fits[island]))];
+    best_fit = int(fits[island].min());
+    logger.debug("genetic_algorithm: %s after %d generations, best score %d", status.value, generation, best_fit);
+    if stats is not None:
+        stats.finish();
+    grid = best.reshape(board.size, board.size).astype(board.grid.dtype);
+    solution = Board(grid, board.fixed.copy());
+    if cache is not None and status is SearchStatus.SOLVED:
+        cache.put_board(board, solution);
+    return SearchResult(GameState(solution), status, generation, stats, cost=best_fit);
+
+
+def _fitness(population: np.ndarray, n: int) -> np.ndarray:
+    """
+    Returns the number of duplicated values in the columns and boxes of each individual of box size `n`.
+    """
+    g = Vectorized.geometry(n);
+    return Vectorized.conflicts(population, g.units[g.size:], n);
+
+
+def _evolve(job: tuple) -> tuple[np.ndarray, np.ndarray, np.random.Generator, int]:
+    """
+    Evolves one island for at most `generations` generations, stopping early when it solves the board.
+    Module level so it can run in a worker process.
+
+    Parameters:
+        job (tuple): `(params, population, fitness, rng, generations)`.
+
+    Returns:
+        tuple: The new population, its fitness, the advanced generator and the generations performed.
+    """
+    params, population, fitness, rng, generations = job;
+    size = len(population);
+    elite, k = params["elite"], params["tournament"];
+    swaps = Vectorized.row_swaps(params["fixed"]);
+    n = Vectorized.geometry_of(params["fixed"]).n;
+    done = 0;
+    for done in range(1, generations + 1):
+        children = size - elite;
+
+        #   Tournament selection of two parents per child
+        entrants = rng.integers(size, size=(2, children, k));
+        winners = np.take_along_axis(entrants, np.argmin(fitness[entrants], axis=2)[..., None], axis=2)[..., 0];
+        first, second = population[winners[0]], population[winners[1]];
+
+        #   Row-preserving uniform crossover: rows are whole permutations, so children stay valid
+        rows = rng.random((children, n * n)) < 0.5;
+        rows &= (rng.random(children) < params["crossover_rate"])[:, None];
+        offspring = np.where(np.repeat(rows, n * n, axis=1), second, first);
+
+        #   Mutation: one random row swap of free cells
+        if len(swaps):
+            mutants = np.flatnonzero(rng.random(children) < params["mutation_rate"]);
+            cells = swaps[rng.integers(len(swaps), size=len(mutants))];
+            a, b = cells[:, 0], cells[:, 1];
+            offspring[mutants, a], offspring[mutants, b] = offspring[mutants, b], offspring[mutants, a];
+
+        #   Elitism
+        if elite:
+            keep = np.argpartition(fitness, elite - 1)[:elite];
+            offspring = np.concatenate([population[keep], offspring]);
+        population, fitness = offspring, _fitness(offspring, n);
+        if fitness.min() == 0:
+            break;
+    return population, fitness, rng, done;
+
+
+def _migrate(populations: list[np.ndarray], fitness: list[np.ndarray], migrants: int) -> None:
+    """
+    Copies the `migrants` best individuals of each island over the worst ones of the next island, in place.
+    """
+    best = [np.argpartition(f, migrants - 1)[:migrants] for f in fitness];
+    emigrants = [(p[i].copy(), f[i].copy()) for p, f, i in zip(populations, fitness, best)];
+    for target in range(len(populations)):
+        individuals, scores = emigrants[target - 1];
+        worst = np.argpartition(fitness[target], -migrants)[-migrants:];
+        populations[target][worst] = individuals;
+        fitness[target][worst] = scores;
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO);
+
+    #   The solved board with 40 cells cleared
+    grid = Board.from_string(solved_board).grid.copy();
+    grid.ravel()[np.random.default_rng(0).choice(81, 40, replace=False)] = 0;
+    board = Board(grid, grid != 0);
+
+    result = genetic_algorithm(board, rng=np.random.default_rng(0), progress=lambda info: print(info));
+    print(result, result.cost);
+    print(result.state.board.grid);
+
+    result = genetic_algorithm(board, islands=4, max_workers=4, rng=np.random.default_rng(0));
+    print(result, result.cost);
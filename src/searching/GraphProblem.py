@@ -0,0 +1,73 @@
+""" src/searching/GraphProblem.py
+Adapter exposing path queries on a graph as a `SearchProblem`.
+
+Classes:
+    -   GraphProblem
+        Shortest path between two nodes of a `TGraph` (or of any object with an `adjacencyList()` method).
+"""
+
+from    typing  import Any, Callable;
+
+__all__ = ["GraphProblem"];
+
+
+class GraphProblem:
+    """
+    `GraphProblem` is a path query from `start` to `goal` on a graph.
+
+    States are the nodes of the graph and keys are their positions in the adjacency list. Step costs
+    come from `weight(u, v)` if given, else from the graph's `getWeight((u, v))` if it implements the
+    `Weighted` protocol, else they are 1.
+
+    Attributes:
+        adjacency (dict): The adjacency list of the graph.
+        start: The initial node.
+        goal: The goal node.
+    """
+    def __init__(self,  graph: Any,
+                        start: Any,
+                        goal: Any,
+                        weight: Callable[[Any, Any], float] | None = None,
+                        heuristic: Callable[[Any], float] | None = None):
+        """
+        Parameters:
+            graph: A `TGraph`, or any object with an `adjacencyList()` method.
+            start: The initial node.
+            goal: The goal node.
+            weight (Callable | None): The cost of the edge `(u, v)`.
+            heuristic (Callable | None): An admissible estimate of the cost from a node to `goal`.
+                Defaults to 0.
+
+        Raises:
+            ValueError: If `start` or `goal` is not a node of the graph.
+        """
+        self.adjacency = graph.adjacencyList();
+        for node in (start, goal):
+            if node not in self.adjacency:
+                raise ValueError(f"{node} is not a node of the graph");
+        self.start = start;
+        self.goal = goal;
+        self._index = {node: i for i, node in enumerate(self.adjacency)};
+        if weight is None and hasattr(graph, "getWeight"):
+            weight = lambda u, v: graph.getWeight((u, v));
+        self._weight = weight;
+        self._heuristic = heuristic;
+
+    def initial(self) -> Any:
+        return self.start;
+
+    def is_goal(self, state: Any) -> bool:
+        return state == self.goal;
+
+    def successors(self, state: Any) -> list[tuple[Any, float]]:
+        if self._weight is None:
+            return [(v, 1) for v in self.adjacency[state]];
+        return [(v, self._weight(state, v)) for v in self.adjacency[state]];
+
+    def heuristic(self, state: Any) -> float:
+        if self._heuristic is None:
+            return 0;
+        return self._heuristic(state);
+
+    def key(self, state: Any) -> int:
+        return self._index[state];
@@ -0,0 +1,65 @@
+""" src/searching/Progress.py
+Rate-limited progress reporting for the search loops.
+
+Classes:
+    -   ProgressReporter
+        Calls a user function with the progress of a search at most once per time interval.
+
+Functions:
+    -   as_progress
+        Wraps a plain callable into a `ProgressReporter`.
+
+Search loops never write to stdout. They call `reporter.report(...)` only on iterations that are
+multiples of `reporter.every`, so the clock is read once every `every` iterations and the callback
+runs at most once per `interval` seconds.
+"""
+
+import  time;
+from    typing  import Any, Callable;
+
+__all__ = ["ProgressReporter", "as_progress"];
+
+
+class ProgressReporter:
+    """
+    `ProgressReporter` forwards the progress of a search to `callback`, rate-limited.
+
+    Attributes:
+        callback (Callable[[dict], None]): Receives a dictionary with `iteration`, `elapsed` and any
+            search-specific fields.
+        interval (float): The minimum number of seconds between two calls to `callback`.
+        every (int): Search loops only consult the reporter every `every` iterations.
+    """
+    def __init__(self, callback: Callable[[dict[str, Any]], None], interval: float = 1.0, every: int = 100):
+        if every < 1:
+            raise ValueError("every must be a positive integer");
+        self.callback = callback;
+        self.interval = interval;
+        self.every = every;
+        self._start = time.monotonic();
+        self._next = self._start;
+
+    def report(self, iteration: int, **info: Any) -> None:
+        """
+        Calls `callback` if at least `interval` seconds passed since the previous call.
+
+        Parameters:
+            iteration (int): The current iteration of the search.
+            **info: Search-specific fields, such as the frontier size.
+        """
+        now = time.monotonic();
+        if now < self._next:
+            return;
+        self._next = now + self.interval;
+        info["iteration"] = iteration;
+        info["elapsed"] = now - self._start;
+        self.callback(info);
+
+
+def as_progress(progress: ProgressReporter | Callable[[dict[str, Any]], None] | None) -> ProgressReporter | None:
+    """
+    Returns `progress` as a `ProgressReporter`, wrapping plain callables with the default rate limits.
+    """
+    if progress is None or isinstance(progress, ProgressReporter):
+        return progress;
+    return ProgressReporter(progress);
@@ -0,0 +1,790 @@
+""" src/searching/PuzzleSearch.py
+Implementation of search algorithms over `SearchProblem`s, such as the `SlidingPuzzle`.
+Methods:
+    -   ida_star
+        Iterative-deepening A*, optionally with a transposition table.
+    -   iterative_deepening
+        Iterative-deepening depth-first search, optionally with a transposition table.
+    -   rbfs
+        Recursive best-first search, in memory linear in the solution depth.
+    -   sma_star
+        Simplified memory-bounded A*, holding at most a configured number of nodes.
+    -   ara_star
+        Anytime repairing A*: a generator of improving solutions with their suboptimality bounds.
+"""
+
+import  heapq;
+import  itertools;
+import  logging;
+import  math;
+from    typing                      import TYPE_CHECKING, Any, Callable, Iterator;
+from    .SearchProblem              import SearchProblem;
+from    .SearchStats                import SearchStats, resolve_stats;
+from    .SearchResult               import SearchResult, SearchStatus;
+from    .Progress                   import ProgressReporter, as_progress;
+from    .Budget                     import SearchBudget;
+
+if TYPE_CHECKING:
+    #   The table and the checkpoints are NumPy-backed: they are only imported by the callers that use them
+    from .TranspositionTable    import TranspositionTable;
+    from .Checkpoint            import Checkpoint, Checkpointer;
+
+logger = logging.getLogger(__name__);
+
+PATH_ENTRY_BYTES : int = 64;
+"""Estimated bytes per state on the current path of the depth-first searches, used for memory budgets."""
+
+
+class _Stop(Exception):
+    """
+    Unwinds the recursion of a depth-first search when its budget is exhausted.
+    """
+    def __init__(self, status: SearchStatus):
+        self.status = status;
+
+
+def _zero(state: Any) -> float:
+    return 0;
+
+
+def _iterative_deepening(problem: SearchProblem,
+                         heuristic: Callable[[Any], float],
+                         name: str,
+                         stats: SearchStats | None,
+                         progress: ProgressReporter | Callable[[dict[str, Any]], None] | None,
+                         budget: SearchBudget | None,
+                         table: "TranspositionTable | None",
+                         checkpointer: "Checkpointer | None" = None) -> SearchResult:
+    """
+    Cost-bounded depth-first searches with increasing thresholds (IDA*; plain iterative deepening when
+    `heuristic` is zero). See `ida_star` for the parameters.
+
+    With a `checkpointer`, every node on the current path has a frame `[child index, minimum, bound]`:
+    the successor being searched, and the next-threshold candidate and cost-to-go bound over the
+    successors before it. The frames are the whole state of an iteration, so a checkpoint holds them, and
+    a resumed search replays the path from the child indices without searching the subtrees already done.
+    """
+    key = problem.key;
+    start = problem.initial();
+    path : list[Any] = [start];
+    on_path : set[int] = {key(start)};
+    frames : list[list[float]] = [];
+    best : list[Any] = [start];
+    best_cursor : list[int] = [];
+    best_h : float = heuristic(start);
+    expanded : int = 0;
+    threshold : float = best_h;
+    iterations : int = 0;
+    resume : list[list[float]] | None = None;
+
+    stats    = resolve_stats(stats, name);
+    progress = as_progress(progress);
+
+    #   Resume from a previous checkpoint
+    if checkpointer is not None:
+        checkpoint = checkpointer.load(name);
+        if checkpoint is not None:
+            resume, best_cursor, best_h, threshold, iterations, expanded = _restore_iterative_deepening(
+                checkpoint, table, stats);
+            best = _replay(problem, start, best_cursor);
+
+    if stats is not None:
+        stats.start_timer();
+        if resume is None:
+            stats.set_initial_heuristic(best_h);
+    if budget is not None:
+        budget.start();
+
+    def snapshot(done: int) -> "Checkpoint":
+        return _snapshot_iterative_deepening(name, frames, best_cursor, best_h, threshold, iterations, done,
+                                             table, stats);
+
+    def search(state: Any, g: float, threshold: float, resume: list[list[float]] | None) -> float:
+        """
+        Returns -1 if a goal was found below `state` (left on `path`), otherwise the smallest f-value
+        that exceeded `threshold`. With `resume`, the frames of `state` and of its descendants on a
+        checkpointed path, `state` was already expanded: its search continues from the frame.
+        """
+        nonlocal expanded, best, best_cursor, best_h;
+        state_key = key(state);
+        if resume:
+            first, minimum, bound = resume[0];
+            first = int(first);
+            successors = problem.successors(state);
+            frame = [first, minimum, bound];
+            frames.append(frame);
+        else:
+            h = heuristic(state);
+            if h < best_h:
+                best, best_cursor, best_h = list(path), [int(f[0]) for f in frames], h;
+            if table is not None:
+                stored = table.probe(state_key);
+                if stored is not None and stored > h:
+                    h = stored;
+            f = g + h;
+            if f > threshold:
+                return f;
+            if problem.is_goal(state):
+                return -1;
+
+            expanded += 1;
+            successors = problem.successors(state);
+            if stats is not None:
+                stats.node_expanded(h);
+                stats.nodes_generated(len(successors));
+                stats.update_max_frontier(len(path));
+            first = 0;
+            minimum = math.inf;     #   Next threshold candidate, over the searched successors
+            bound = math.inf;       #   Admissible cost-to-go bound, over all successors
+
+            #   Frames are only kept for checkpoints, and only brought up to date before descending. A
+            #   checkpoint is taken once the node is expanded, so a resumed search does not expand it again
+            if checkpointer is not None:
+                frame = [first, minimum, bound];
+                frames.append(frame);
+                if checkpointer.due(expanded):
+                    checkpointer.save(snapshot(expanded));
+            if budget is not None and expanded % budget.check_every == 0:
+                stop = budget.check(expanded, len(path) * PATH_ENTRY_BYTES);
+                if stop is not None:
+                    raise _Stop(stop);
+            if progress is not None and expanded % progress.every == 0:
+                progress.report(expanded, threshold=threshold, depth=len(path));
+
+        child_resume = resume[1:] if resume else None;
+        for i in range(first, len(successors)):
+            child, cost = successors[i];
+            child_key = key(child);
+            if child_key in on_path:
+                #   Skipped to avoid cycles, but still bounds the cost-to-go of `state`
+                bound = min(bound, cost + heuristic(child));
+                continue;
+            if checkpointer is not None:
+                frame[0], frame[1], frame[2] = i, minimum, bound;
+            path.append(child);
+            on_path.add(child_key);
+            t = search(child, g + cost, threshold, child_resume);
+            child_resume = None;
+            if t < 0:
+                return -1;
+            path.pop();
+            on_path.discard(child_key);
+            if t < minimum:
+                minimum = t;
+        if checkpointer is not None:
+            frames.pop();
+        if table is not None:
+            table.store(state_key, min(bound, minimum - g), int(threshold - g));
+        return minimum;
+
+    status = SearchStatus.EXHAUSTED;
+    try:
+        while True:
+            if resume is None:
+                iterations += 1;
+                if stats is not None:
+                    stats.count("iterations");
+            logger.debug("%s: iteration %d, threshold %s, %d expanded", name, iterations, threshold, expanded);
+            t = search(start, 0, threshold, resume);
+            resume = None;
+            if t < 0:
+                status = SearchStatus.SOLVED;
+                break;
+            if t == math.inf:
+                break;
+            threshold = t;
+    except _Stop as stop:
+        status = stop.status;
+        #   The frames are left as they were when the budget ran out, after the last expansion
+        if checkpointer is not None:
+            checkpointer.save(snapshot(expanded));
+
+    if checkpointer is not None and status in (SearchStatus.SOLVED, SearchStatus.EXHAUSTED):
+        checkpointer.finish();
+    if stats is not None:
+        if table is not None:
+            stats.count("tt_hits", table.hits);
+            stats.count("tt_misses", table.misses);
+            stats.count("tt_overwrites", table.overwrites);
+        stats.finish();
+    if status is SearchStatus.SOLVED:
+        return SearchResult(path[-1], status, iterations, stats, path=list(path), cost=threshold);
+    return SearchResult(best[-1], status, iterations, stats, path=best);
+
+
+def _replay(problem: SearchProblem, start: Any, cursor: list[int]) -> list[Any]:
+    """
+    Returns the path from `start` following the successors of the given indices.
+    """
+    path = [start];
+    for i in cursor:
+        path.append(problem.successors(path[-1])[i][0]);
+    return path;
+
+
+def _snapshot_iterative_deepening(name: str, frames: list[list[float]], best_cursor: list[int], best_h: float,
+                                  threshold: float, iterations: int, expanded: int,
+                                  table: "TranspositionTable | None", stats: SearchStats | None) -> "Checkpoint":
+    """
+    Snapshots `_iterative_deepening` after the expansion of the node reached by the child indices of
+    `frames`, whose last frame is that of the node.
+    """
+    import numpy as np;
+    from .Checkpoint import Checkpoint;
+    arrays = {
+        "cursor": np.array([f[0] for f in frames], dtype=np.int64),
+        "minimum": np.array([f[1] for f in frames], dtype=np.float64),
+        "bound": np.array([f[2] for f in frames], dtype=np.float64),
+        "best": np.array(best_cursor, dtype=np.int64),
+    };
+    table_meta = None;
+    if table is not None:
+        arrays |= {"tt_keys": table.keys, "tt_bounds": table.bounds, "tt_depths": table.depths};
+        table_meta = {"capacity": table.capacity, "hits": table.hits, "misses": table.misses,
+                      "overwrites": table.overwrites};
+    return Checkpoint(name, arrays, {
+        "threshold": threshold, "iterations": iterations, "expanded": expanded, "best_h": best_h,
+        "table": table_meta, "stats": stats.state_dict() if stats is not None else None,
+    });
+
+
+def _restore_iterative_deepening(checkpoint: "Checkpoint", table: "TranspositionTable | None",
+                                 stats: SearchStats | None):
+    """
+    Inverse of `_snapshot_iterative_deepening`: restores `table` and `stats` in place and returns the
+    frames to resume from, the best path's child indices, its heuristic, the threshold, the iteration
+    and the expanded nodes.
+
+    Raises:
+        ValueError: If the checkpoint was saved with a table and `table` is `None` or of another capacity.
+    """
+    arrays, meta = checkpoint.arrays, checkpoint.meta;
+    if meta["table"] is not None:
+        if table is None or table.capacity != meta["table"]["capacity"]:
+            raise ValueError("The checkpoint needs a transposition table of capacity "
+                             f"{meta['table']['capacity']}");
+        table.keys[...], table.bounds[...], table.depths[...] = arrays["tt_keys"], arrays["tt_bounds"], arrays["tt_depths"];
+        table.hits, table.misses, table.overwrites = (meta["table"][k] for k in ("hits", "misses", "overwrites"));
+    if stats is not None and meta["stats"] is not None:
+        stats.load_state_dict(meta["stats"]);
+    resume = [[int(i), float(m), float(b)] for i, m, b in zip(arrays["cursor"], arrays["minimum"], arrays["bound"])];
+    return (resume, arrays["best"].tolist(), meta["best_h"], meta["threshold"], meta["iterations"],
+            meta["expanded"]);
+
+
+def ida_star(problem: SearchProblem,
+             stats: SearchStats | None = None,
+             progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+             budget: SearchBudget | None = None,
+             table: "TranspositionTable | None" = None,
+             checkpointer: "Checkpointer | None" = None) -> SearchResult:
+    """
+    Iterative-deepening A*: depth-first searches bounded by f = g + h, with the threshold raised to the
+    smallest f that exceeded it after each iteration.
+
+    Parameters:
+        problem (SearchProblem): The problem to solve. Its heuristic must be admissible, and its
+            successors must come in the same order every time when `checkpointer` is given.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, memory and cancellation limits.
+        table (TranspositionTable | None): Stores improved bounds of searched states, so that
+            transpositions and later iterations skip subtrees already known to fail.
+        checkpointer (Checkpointer | None): Saves the search every `every` expanded nodes and when it stops
+            on its budget, and resumes it from an existing checkpoint, in the middle of an iteration: the
+            threshold, the current path, the table and its counters are restored. A checkpoint saved with
+            a table must be resumed with a table of the same capacity.
+
+    Returns:
+        SearchResult: The goal state with the optimal `path` and `cost`, or, if the search stopped early,
+        the state with the lowest heuristic found and the path to it.
+    """
+    return _iterative_deepening(problem, problem.heuristic, "ida_star", stats, progress, budget, table, checkpointer);
+
+
+def iterative_deepening(problem: SearchProblem,
+                        stats: SearchStats | None = None,
+                        progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                        budget: SearchBudget | None = None,
+                        table: "TranspositionTable | None" = None,
+                        checkpointer: "Checkpointer | None" = None) -> SearchResult:
+    """
+    Iterative-deepening depth-first search: IDA* with a zero heuristic. The parameters and the result
+    are those of `ida_star`.
+    """
+    return _iterative_deepening(problem, _zero, "iterative_deepening", stats, progress, budget, table,
+                                checkpointer);
+
+
+def rbfs(problem: SearchProblem,
+         stats: SearchStats | None = None,
+         progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+         budget: SearchBudget | None = None) -> SearchResult:
+    """
+    Recursive best-first search. Explores the best child of each node while its backed-up f-value stays
+    below the best alternative of its ancestors, and unwinds, remembering the f-value of the abandoned
+    subtree, when it does not. Only the current path and the children of its nodes are kept, so memory
+    is linear in the solution depth, at the price of re-expanding abandoned subtrees.
+
+    Parameters:
+        problem (SearchProblem): The problem to solve. Its heuristic must be admissible.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, memory and cancellation limits.
+
+    Returns:
+        SearchResult: The goal state with the optimal `path` and `cost`, or, if the search stopped early,
+        the state with the lowest heuristic found and the path to it.
+    """
+    key, heuristic = problem.key, problem.heuristic;
+    start = problem.initial();
+    path : list[Any] = [start];
+    on_path : set[int] = {key(start)};
+    best : list[Any] = [start];
+    best_h : float = heuristic(start);
+    expanded : int = 0;
+    cost : float = 0;
+
+    stats    = resolve_stats(stats, "rbfs");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+        stats.set_initial_heuristic(best_h);
+    if budget is not None:
+        budget.start();
+
+    def search(state: Any, g: float, f: float, bound: float) -> float:
+        """
+        Returns -1 if a goal was found below `state` (left on `path`), otherwise the backed-up f-value of `state`.
+        """
+        nonlocal expanded, best, best_h, cost;
+        if problem.is_goal(state):
+            cost = g;
+            return -1;
+
+        expanded += 1;
+        if budget is not None and expanded % budget.check_every == 0:
+            stop = budget.check(expanded, len(path) * PATH_ENTRY_BYTES);
+            if stop is not None:
+                raise _Stop(stop);
+        if progress is not None and expanded % progress.every == 0:
+            progress.report(expanded, f=f, depth=len(path));
+
+        children : list[list] = [];
+        for child, step in problem.successors(state):
+            if key(child) in on_path:
+                continue;
+            h = heuristic(child);
+            if h < best_h:
+                best, best_h = path + [child], h;
+            #   Children inherit the backed-up value of their parent (pathmax)
+            children.append([max(g + step + h, f), g + step, child]);
+        if stats is not None:
+            stats.node_expanded(f - g);
+            stats.nodes_generated(len(children));
+            stats.update_max_frontier(len(path));
+        if not children:
+            return math.inf;
+
+        while True:
+            children.sort(key=lambda c: c[0]);
+            first = children[0];
+            if first[0] > bound:
+                return first[0];
+            alternative = children[1][0] if len(children) > 1 else math.inf;
+            child_key = key(first[2]);
+            path.append(first[2]);
+            on_path.add(child_key);
+            first[0] = search(first[2], first[1], first[0], min(bound, alternative));
+            if first[0] < 0:
+                return -1;
+            path.pop();
+            on_path.discard(child_key);
+
+    status = SearchStatus.EXHAUSTED;
+    try:
+        if search(start, 0, heuristic(start), math.inf) < 0:
+            status = SearchStatus.SOLVED;
+    except _Stop as stop:
+        status = stop.status;
+
+    if stats is not None:
+        stats.finish();
+    if status is SearchStatus.SOLVED:
+        return SearchResult(path[-1], status, expanded, stats, path=list(path), cost=cost);
+    return SearchResult(best[-1], status, expanded, stats, path=best);
+
+
+class _SMANode:
+    """
+    A node of the `sma_star` search tree.
+
+    Attributes:
+        state (Any): The state of the node.
+        g (float): The cost of the path from the root.
+        f (float): The backed-up f-value: the smallest f over the subtree and its forgotten parts.
+        depth (int): The depth of the node in the tree.
+        parent (_SMANode | None): The parent node.
+        children (list[_SMANode]): The children currently in memory.
+        forgotten (float): The smallest f-value of the children removed from memory, `inf` if none.
+        expanded (bool): Whether the successors of the node were generated at least once.
+        alive (bool): False once the node is removed from memory.
+    """
+    __slots__ = ("state", "g", "f", "depth", "parent", "children", "forgotten", "expanded", "alive");
+
+    def __init__(self, state: Any, g: float, f: float, depth: int, parent: "_SMANode | None"):
+        self.state = state;
+        self.g = g;
+        self.f = f;
+        self.depth = depth;
+        self.parent = parent;
+        self.children : list["_SMANode"] = [];
+        self.forgotten = math.inf;
+        self.expanded = False;
+        self.alive = True;
+
+    def open_f(self) -> float | None:
+        """
+        The priority of the node in the open list, or `None` if it has nothing to (re)generate.
+        """
+        if not self.expanded:
+            return self.f;
+        if self.forgotten < math.inf:
+            return self.forgotten;
+        return None;
+
+    def path(self) -> list[Any]:
+        node, states = self, [];
+        while node is not None:
+            states.append(node.state);
+            node = node.parent;
+        return states[::-1];
+
+
+def sma_star(problem: SearchProblem,
+             max_nodes: int = 1 << 16,
+             stats: SearchStats | None = None,
+             progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+             budget: SearchBudget | None = None) -> SearchResult:
+    """
+    Simplified memory-bounded A*. Behaves like A* until `max_nodes` nodes are in memory; then it forgets
+    the worst leaf (highest f, shallowest) and backs its f-value up into its parent, which regenerates the
+    forgotten children if they become the best option again. Finds an optimal solution whenever the path
+    to it fits in `max_nodes`; with less memory, it keeps thrashing until its budget runs out.
+    The tree may exceed `max_nodes` by the successors of one expansion, until they are forgotten.
+
+    Each expansion generates all the successors not already in memory, and only the parent state is
+    excluded to avoid cycles, so states can appear more than once in the tree.
+
+    Parameters:
+        problem (SearchProblem): The problem to solve. Its heuristic must be admissible.
+        max_nodes (int): The maximum number of tree nodes in memory.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, memory and cancellation limits.
+
+    Returns:
+        SearchResult: The goal state with the optimal `path` and `cost`, or, if the search stopped early,
+        the state with the lowest heuristic found and the path to it.
+    """
+    if max_nodes < 2:
+        raise ValueError("max_nodes must be at least 2");
+    key, heuristic = problem.key, problem.heuristic;
+    counter = itertools.count();
+    start = problem.initial();
+    root = _SMANode(start, 0, heuristic(start), 0, None);
+    best, best_h = root, root.f;
+    in_memory : int = 1;
+    expanded : int = 0;
+
+    #   Open list: lowest f first, deepest first among ties. Leaves: highest f first, shallowest first.
+    #   Both are lazy: entries are validated against the node when popped.
+    open_heap : list[tuple] = [(root.f, 0, next(counter), root)];
+    leaf_heap : list[tuple] = [];
+
+    def push_open(node: _SMANode) -> None:
+        f = node.open_f();
+        if f is not None:
+            heapq.heappush(open_heap, (f, -node.depth, next(counter), node));
+
+    def push_leaf(node: _SMANode) -> None:
+        heapq.heappush(leaf_heap, (-node.f, node.depth, next(counter), node));
+
+    def backup(node: _SMANode) -> None:
+        """
+        Recomputes the f-values of `node` and its ancestors from their children and forgotten children.
+        """
+        while node is not None and node.children:
+            f = min(min(c.f for c in node.children), node.forgotten);
+            if f == node.f:
+                break;
+            node.f = f;
+            node = node.parent;
+
+    stats    = resolve_stats(stats, "sma_star");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+        stats.set_initial_heuristic(root.f);
+    if budget is not None:
+        budget.start();
+
+    status = SearchStatus.EXHAUSTED;
+    goal : _SMANode | None = None;
+    while open_heap:
+        f, _, _, node = heapq.heappop(open_heap);
+        if not node.alive or node.open_f() != f:
+            continue;
+        if f == math.inf:
+            break;
+        if problem.is_goal(node.state):
+            goal = node;
+            status = SearchStatus.SOLVED;
+            break;
+
+        expanded += 1;
+        if budget is not None and expanded % budget.check_every == 0:
+            stop = budget.check(expanded, in_memory * PATH_ENTRY_BYTES);
+            if stop is not None:
+                status = stop;
+                break;
+        if progress is not None and expanded % progress.every == 0:
+            progress.report(expanded, f=f, nodes=in_memory);
+
+        #   Generate the successors that are not in memory: all of them on the first expansion,
+        #   the forgotten ones afterwards (their f is at least the smallest forgotten f)
+        floor = node.f if not node.expanded else node.forgotten;
+        present = {key(c.state) for c in node.children};
+        parent_key = key(node.parent.state) if node.parent is not None else None;
+        generated = 0;
+        for state, step in problem.successors(node.state):
+            k = key(state);
+            if k == parent_key or k in present:
+                continue;
+            h = heuristic(state);
+            if node.depth + 1 >= max_nodes - 1 and not problem.is_goal(state):
+                child_f = math.inf;         #   The path through it cannot fit in memory
+            else:
+                child_f = max(node.g + step + h, floor);
+            child = _SMANode(state, node.g + step, child_f, node.depth + 1, node);
+            node.children.append(child);
+            push_open(child);
+            push_leaf(child);
+            generated += 1;
+            if h < best_h:
+                best, best_h = child, h;
+        in_memory += generated;
+        node.expanded = True;
+        node.forgotten = math.inf;
+        if not node.children:
+            node.f = math.inf;
+        backup(node);
+        if stats is not None:
+            stats.node_expanded(node.f - node.g);
+            stats.nodes_generated(generated);
+            stats.update_max_frontier(in_memory);
+
+        #   Forget the worst leaves until the tree fits in memory again
+        while in_memory > max_nodes and leaf_heap:
+            _, _, _, victim = heapq.heappop(leaf_heap);
+            if not victim.alive or victim.children or victim.parent is None:
+                continue;
+            parent = victim.parent;
+            victim.alive = False;
+            parent.children.remove(victim);
+            parent.forgotten = min(parent.forgotten, victim.f);
+            in_memory -= 1;
+            if stats is not None:
+                stats.count("forgotten");
+            if not parent.children:
+                push_leaf(parent);
+            push_open(parent);
+
+    if stats is not None:
+        stats.finish();
+    if goal is not None:
+        return SearchResult(goal.state, status, expanded, stats, path=goal.path(), cost=goal.g);
+    return SearchResult(best.state, status, expanded, stats, path=best.path());
+
+
+def ara_star(problem: SearchProblem,
+             epsilon: float = 3.0,
+             decrement: float = 0.5,
+             stats: SearchStats | None = None,
+             progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+             budget: SearchBudget | None = None) -> Iterator[SearchResult]:
+    """
+    Anytime repairing A*. Runs weighted A* (f = g + epsilon * h) with a decreasing `epsilon`. Each pass
+    reuses the g-values and the open list of the previous one; only the states whose g-value improved
+    after they were expanded (the inconsistent states) are reopened, so later passes are much cheaper
+    than fresh searches.
+
+    The caller consumes solutions until it runs out of time, or breaks out of the loop:
+        for result in ara_star(problem, budget=SearchBudget(timeout=0.05)):
+            answer = result
+
+    Parameters:
+        problem (SearchProblem): The problem to solve. Its heuristic must be admissible.
+        epsilon (float): The initial weight of the heuristic, at least 1.
+        decrement (float): How much `epsilon` decreases after each pass.
+        stats (SearchStats | None): Collects the statistics of the whole run. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, memory and cancellation limits of the whole run.
+
+    Yields:
+        SearchResult: Each solution improving the cost or the bound, with its `path`, `cost` and suboptimality `bound`
+        (`cost <= bound * optimal cost`). The last one has `bound == 1` unless the run was stopped.
+        If the run ends before finding any solution, a single result with the stopping status and the
+        state with the lowest heuristic is yielded instead.
+    """
+    if epsilon < 1 or decrement <= 0:
+        raise ValueError("epsilon must be at least 1 and decrement positive");
+    key, heuristic = problem.key, problem.heuristic;
+    counter = itertools.count();
+    start = problem.initial();
+    k0 = key(start);
+
+    g : dict[int, float] = {k0: 0};
+    h : dict[int, float] = {k0: heuristic(start)};
+    states : dict[int, Any] = {k0: start};
+    parent : dict[int, int | None] = {k0: None};
+    open_set : set[int] = {k0};
+    closed : set[int] = set();
+    incons : set[int] = set();
+    heap : list[tuple[float, int, int]] = [];
+
+    incumbent : int | None = k0 if problem.is_goal(start) else None;
+    incumbent_g : float = 0 if incumbent is not None else math.inf;
+    best_key, best_h = k0, h[k0];
+    expanded : int = 0;
+
+    stats    = resolve_stats(stats, "ara_star");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+        stats.set_initial_heuristic(h[k0]);
+    if budget is not None:
+        budget.start();
+
+    def rebuild_heap() -> None:
+        heap.clear();
+        for k in open_set:
+            heap.append((g[k] + epsilon * h[k], next(counter), k));
+        heapq.heapify(heap);
+
+    def path_to(k: int) -> list[Any]:
+        keys = [];
+        while k is not None:
+            keys.append(k);
+            k = parent[k];
+        return [states[k] for k in reversed(keys)];
+
+    def suboptimality() -> float:
+        """
+        The proven bound of the incumbent: its cost over the smallest g + h among unexpanded states.
+        """
+        lower = min((g[k] + h[k] for k in itertools.chain(open_set, incons)), default=math.inf);
+        if lower == 0 or lower >= incumbent_g:
+            return 1.0;
+        return min(epsilon, incumbent_g / lower);
+
+    def improve_path() -> SearchStatus | None:
+        """
+        One weighted A* pass. Returns the stopping status if the budget ran out, `None` otherwise.
+        """
+        nonlocal expanded, incumbent, incumbent_g, best_key, best_h;
+        while heap:
+            f, _, k = heap[0];
+            if k not in open_set or f != g[k] + epsilon * h[k]:
+                heapq.heappop(heap);
+                continue;
+            if incumbent_g <= f:
+                return None;
+            heapq.heappop(heap);
+            open_set.discard(k);
+            closed.add(k);
+
+            expanded += 1;
+            if budget is not None and expanded % budget.check_every == 0:
+                stop = budget.check(expanded, len(g) * PATH_ENTRY_BYTES);
+                if stop is not None:
+                    return stop;
+            if progress is not None and expanded % progress.every == 0:
+                progress.report(expanded, epsilon=epsilon, open=len(open_set), incumbent=incumbent_g);
+
+            successors = problem.successors(states[k]);
+            if stats is not None:
+                stats.node_expanded(h[k]);
+                stats.nodes_generated(len(successors));
+                stats.update_max_frontier(len(open_set));
+            for child, step in successors:
+                ck = key(child);
+                new_g = g[k] + step;
+                if new_g >= g.get(ck, math.inf):
+                    continue;
+                g[ck] = new_g;
+                parent[ck] = k;
+                if ck not in states:
+                    states[ck] = child;
+                    h[ck] = heuristic(child);
+                    if h[ck] < best_h:
+                        best_key, best_h = ck, h[ck];
+                if problem.is_goal(child) and new_g < incumbent_g:
+                    incumbent, incumbent_g = ck, new_g;
+                if ck in closed:
+                    incons.add(ck);
+                else:
+                    open_set.add(ck);
+                    heapq.heappush(heap, (new_g + epsilon * h[ck], next(counter), ck));
+        return None;
+
+    rebuild_heap();
+    passes = 0;
+    status : SearchStatus | None = None;
+    last_cost, last_bound = math.inf, math.inf;
+    while True:
+        passes += 1;
+        status = improve_path();
+        if status is not None:
+            break;
+        if incumbent is None:
+            status = SearchStatus.EXHAUSTED;
+            break;
+        bound = suboptimality();
+        logger.debug("ara_star: pass %d, epsilon %s, cost %s, bound %s", passes, epsilon, incumbent_g, bound);
+        if incumbent_g < last_cost or bound < last_bound:
+            last_cost, last_bound = incumbent_g, bound;
+            yield SearchResult(states[incumbent], SearchStatus.SOLVED, expanded, stats,
+                               path=path_to(incumbent), cost=incumbent_g, bound=bound);
+        if bound <= 1.0:
+            break;
+        #   Next pass: lower epsilon, reopen the inconsistent states, forget the closed set
+        epsilon = max(1.0, epsilon - decrement);
+        open_set |= incons;
+        incons.clear();
+        closed.clear();
+        rebuild_heap();
+
+    if stats is not None:
+        stats.count("passes", passes);
+        stats.finish();
+    if incumbent is None:
+        yield SearchResult(states[best_key], status, expanded, stats, path=path_to(best_key));
+
+
+if __name__ == "__main__":
+    from    .puzzle.SlidingPuzzle   import SlidingPuzzle, p8_1, p8_hard;
+    from    .TranspositionTable     import TranspositionTable;
+    logging.basicConfig(level=logging.INFO);
+
+    for instance in (p8_1, p8_hard):
+        puzzle = SlidingPuzzle.from_string(instance);
+        for table in (None, TranspositionTable(1 << 16)):
+            stats = SearchStats("ida_star");
+            result = ida_star(puzzle, stats=stats, table=table);
+            print(result, "cost:", result.cost, "expanded:", stats.expanded_nodes, "table:", table is not None);
+
+        print(rbfs(puzzle), "cost:", rbfs(puzzle).cost);
+        print(sma_star(puzzle, max_nodes=1000), "cost:", sma_star(puzzle, max_nodes=1000).cost);
+        for result in ara_star(puzzle):
+            print(result, "cost:", result.cost, "bound:", result.bound);
@@ -0,0 +1,51 @@
+""" src/searching/SearchProblem.py
+Defines the protocol of the problems solved by the generic search algorithms.
+
+Protocols:
+----------
+    -   SearchProblem
+        A state space with an initial state, a goal test, weighted successors, a heuristic and integer keys.
+
+States are opaque to the algorithms: they only pass them back to the problem, and use `key(state)` to
+identify them in closed sets and transposition tables. Problems should use cheap immutable states, such
+as packed integers, since the algorithms create one per generated node.
+"""
+
+from typing import Protocol, Any, Iterable;
+
+__all__ = ["SearchProblem"];
+
+class SearchProblem(Protocol):
+    """
+    The `SearchProblem` protocol defines a state space searched by `PuzzleSearch`.
+    """
+    def initial(self) -> Any:
+        """
+        Returns the initial state.
+        """
+        ...;
+
+    def is_goal(self, state: Any) -> bool:
+        """
+        Returns True if `state` is a goal state.
+        """
+        ...;
+
+    def successors(self, state: Any) -> Iterable[tuple[Any, float]]:
+        """
+        Returns the successors of `state` as `(successor, step cost)` pairs.
+        """
+        ...;
+
+    def heuristic(self, state: Any) -> float:
+        """
+        Returns an admissible estimate of the cost from `state` to the nearest goal.
+        """
+        ...;
+
+    def key(self, state: Any) -> int:
+        """
+        Returns a non-negative integer identifying `state`. Keys of distinct states must differ; keys
+        fitting in 64 bits can be stored in NumPy-backed tables.
+        """
+        ...;
@@ -0,0 +1,67 @@
+""" src/searching/SearchResult.py
+Summary values returned by the search entry points.
+
+Classes:
+    -   SearchStatus
+        How a search ended.
+    -   SearchResult
+        The final state of a search together with how it ended.
+"""
+
+from    enum    import Enum;
+from    typing  import Any;
+
+__all__ = ["SearchStatus", "SearchResult"];
+
+
+class SearchStatus(Enum):
+    """
+    `SearchStatus` tells why a search returned.
+    """
+    SOLVED          = "solved";
+    EXHAUSTED       = "exhausted";          #   The frontier emptied without reaching a goal
+    ITERATION_LIMIT = "iteration_limit";    #   The iteration count of the entry point (e.g. `niter`) ran out
+    TIMEOUT         = "timeout";
+    NODE_LIMIT      = "node_limit";
+    MEMORY_LIMIT    = "memory_limit";
+    CANCELLED       = "cancelled";
+
+
+class SearchResult:
+    """
+    `SearchResult` summarizes a finished search.
+
+    Attributes:
+        state (Any): The goal state, or the best state reached when the search stopped early.
+        status (SearchStatus): Why the search returned.
+        iterations (int): The number of iterations performed.
+        stats (SearchStats | None): The statistics of the search, if they were enabled.
+        path (list | None): The states from the initial state to `state`, for searches that track paths.
+        cost (float | None): The cost of `path`.
+        bound (float | None): For suboptimal searches, a proven factor such that `cost <= bound * optimal cost`.
+    """
+    def __init__(self, state: Any, status: SearchStatus, iterations: int, stats = None,
+                 path: list | None = None, cost: float | None = None, bound: float | None = None):
+        self.state = state;
+        self.status = status;
+        self.iterations = iterations;
+        self.stats = stats;
+        self.path = path;
+        self.cost = cost;
+        self.bound = bound;
+
+    @property
+    def solved(self) -> bool:
+        """
+        True if `state` is a goal state.
+        """
+        return self.status is SearchStatus.SOLVED;
+
+    def __bool__(self) -> bool:
+        """
+        A result is truthy when the search found a goal state.
+        """
+        return self.solved;
+
+    def __repr__(self) -> str:
+        return f"SearchResult(status={self.status.value}, iterations={self.iterations})";
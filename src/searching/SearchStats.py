@@ -0,0 +1,443 @@
+""" src/searching/SearchStats.py
+Instrumentation for the search algorithms, mirroring `Puzzle::SearchStats` on the C++ side.
+
+Classes:
+    -   SearchStats
+        Counters, percentile timers, frontier high-water mark and branching factor of a search.
+    -   CSVSink, JSONLinesSink, CallbackSink
+        Destinations for the records emitted by a `SearchStats` object.
+
+Functions:
+    -   resolve_stats
+        Returns the stats object a search entry point should use, or `None` when stats are disabled.
+
+Every search entry point accepts a `stats: SearchStats | None` argument. When it is `None` (and the
+`SEARCHING_STATS` environment variable is unset) the search keeps the `None` and guards each hook with
+a single `if stats is not None`, so disabled stats cost nothing beyond that check.
+
+Setting `SEARCHING_STATS` profiles searches without editing the calling code:
+    SEARCHING_STATS=stats.csv       appends one CSV line per search
+    SEARCHING_STATS=stats.jsonl     appends one JSON object per search
+    SEARCHING_STATS=stderr          writes one JSON object per search to stderr
+"""
+
+import  csv;
+import  io;
+import  json;
+import  math;
+import  os;
+import  random;
+import  sys;
+import  time;
+from    contextlib  import contextmanager;
+from    typing      import Any, Callable, Iterator;
+
+__all__ = ["SearchStats", "CSVSink", "JSONLinesSink", "CallbackSink", "resolve_stats"];
+
+STATS_ENV : str = "SEARCHING_STATS";
+"""Name of the environment variable that enables stats for every search entry point."""
+
+CSV_FIELDS : tuple[str, ...] = (
+    "name", "expanded_nodes", "generated_nodes", "branching_factor", "max_frontier", "initial_heuristic",
+    "average_heuristic", "search_time", "nodes_per_second", "counters", "timers",
+);
+"""The columns of the CSV records, in the order of `SearchStats.as_dict`. `counters` and `timers` are JSON."""
+
+
+class CSVSink:
+    """
+    Appends each stats record as a line of a CSV file, with the fixed columns of `CSV_FIELDS`. The header
+    is written when the file is created. Counters and timers vary between searches, so each is a single
+    column holding a JSON object rather than one column per key.
+
+    Attributes:
+        path (str): The path of the CSV file.
+    """
+    def __init__(self, path: str):
+        self.path = path;
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Writes `record` as a CSV line.
+
+        Raises:
+            ValueError: If `record` has a key outside `CSV_FIELDS`, or the existing file has another header.
+        """
+        row = _csv_row(record);
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0;
+        if not new_file:
+            with open(self.path, newline="") as f:
+                header = next(csv.reader(f), []);
+            if header != list(CSV_FIELDS):
+                raise ValueError(f"CSVSink: {self.path} has columns {header}, expected {list(CSV_FIELDS)}");
+        with open(self.path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS);
+            if new_file:
+                writer.writeheader();
+            writer.writerow(row);
+
+    def close(self) -> None:
+        return;
+
+
+class JSONLinesSink:
+    """
+    Appends each stats record as one JSON object per line.
+
+    Attributes:
+        path (str | None): The path of the file, or `None` to write to `stream`.
+        stream: An open text stream, used when `path` is `None`.
+    """
+    def __init__(self, path: str | None = None, stream = None):
+        if path is None and stream is None:
+            raise ValueError("JSONLinesSink needs a path or a stream");
+        self.path = path;
+        self.stream = stream;
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Writes `record` as a single JSON line.
+        """
+        line = json.dumps(record, default=str) + "\n";
+        if self.path is not None:
+            with open(self.path, "a") as f:
+                f.write(line);
+        else:
+            self.stream.write(line);
+            self.stream.flush();
+
+    def close(self) -> None:
+        return;
+
+
+class CallbackSink:
+    """
+    Passes each stats record to a user supplied function.
+
+    Attributes:
+        callback (Callable[[dict], None]): The function receiving the records.
+    """
+    def __init__(self, callback: Callable[[dict[str, Any]], None]):
+        self.callback = callback;
+
+    def write(self, record: dict[str, Any]) -> None:
+        self.callback(record);
+
+    def close(self) -> None:
+        return;
+
+
+class SearchStats:
+    """
+    Statistics of a single search run.
+
+    Attributes:
+        name (str): A label for the search, included in every emitted record.
+        sinks (list): The sinks receiving the record when the search finishes.
+        counters (dict[str, int]): Free-form named counters.
+        expanded_nodes (int): Number of expanded nodes.
+        generated_nodes (int): Number of generated successors.
+        max_frontier (int): The largest frontier size observed.
+        initial_heuristic (float | None): The heuristic value of the initial state.
+        search_time (float): Wall-clock duration of the search, in seconds.
+
+    Methods:
+        Timing control
+            start_timer()
+            stop_timer()
+            timer(name: str)
+
+        Metrics updates
+            node_expanded(heuristic: float | None = None)
+            nodes_expanded(n: int, total_heuristic: float | None = None)
+            nodes_generated(n: int)
+            update_max_frontier(size: int)
+            count(name: str, n: int = 1)
+
+        Reporting
+            percentile(name: str, q: float) -> float
+            as_dict() -> dict
+            csv_header() -> str
+            csv_line() -> str
+            emit()
+            finish()
+
+        Checkpointing
+            state_dict() -> dict
+            load_state_dict(state: dict)
+    """
+    def __init__(self, name: str = "search", sinks: list | None = None, max_samples: int = 4096):
+        """
+        Parameters:
+            name (str): A label for the search.
+            sinks (list | None): Sinks (`CSVSink`, `JSONLinesSink`, `CallbackSink` or any object with
+                a `write(record)` method) receiving the record on `finish()`.
+            max_samples (int): The number of samples retained per timer. Beyond it, samples are kept by
+                reservoir sampling so percentiles stay representative with bounded memory.
+        """
+        self.name = name;
+        self.sinks = list(sinks) if sinks is not None else [];
+        self.max_samples = max_samples;
+
+        self.counters : dict[str, int] = {};
+        self.expanded_nodes : int = 0;
+        self.generated_nodes : int = 0;
+        self.max_frontier : int = 0;
+        self.initial_heuristic : float | None = None;
+        self.search_time : float = 0.0;
+
+        self._total_heuristic : float = 0.0;
+        self._heuristic_count : int = 0;
+        self._samples : dict[str, list[float]] = {};
+        self._seen : dict[str, int] = {};
+        self._start : float | None = None;
+        self._elapsed : float = 0.0;
+        self._rng = random.Random(0);
+
+    #   Timing control
+    def start_timer(self) -> None:
+        """
+        Starts the wall-clock timer of the search.
+        """
+        self._start = time.perf_counter();
+
+    def stop_timer(self) -> None:
+        """
+        Stops the wall-clock timer of the search and stores the elapsed time in `search_time`.
+        """
+        if self._start is not None:
+            self.search_time = self._elapsed + time.perf_counter() - self._start;
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Context manager timing its block and recording the duration as a sample of the timer `name`.
+        """
+        start = time.perf_counter();
+        try:
+            yield;
+        finally:
+            self.record(name, time.perf_counter() - start);
+
+    def record(self, name: str, value: float) -> None:
+        """
+        Records `value` as a sample of the timer `name`.
+        """
+        samples = self._samples.setdefault(name, []);
+        seen = self._seen.get(name, 0) + 1;
+        self._seen[name] = seen;
+        if len(samples) < self.max_samples:
+            samples.append(value);
+        else:
+            j = self._rng.randrange(seen);
+            if j < self.max_samples:
+                samples[j] = value;
+
+    #   Metrics updates
+    def node_expanded(self, heuristic: float | None = None) -> None:
+        """
+        Counts one expanded node, optionally with its heuristic value.
+        """
+        self.expanded_nodes += 1;
+        if heuristic is not None:
+            self._total_heuristic += heuristic;
+            self._heuristic_count += 1;
+
+    def nodes_expanded(self, n: int, total_heuristic: float | None = None) -> None:
+        """
+        Counts `n` expanded nodes at once, optionally with the sum of their heuristic values.
+        Used by the searches expanding whole layers of states.
+        """
+        self.expanded_nodes += n;
+        if total_heuristic is not None:
+            self._total_heuristic += total_heuristic;
+            self._heuristic_count += n;
+
+    def nodes_generated(self, n: int) -> None:
+        """
+        Counts `n` generated successors of the last expanded node.
+        """
+        self.generated_nodes += n;
+
+    def update_max_frontier(self, size: int) -> None:
+        """
+        Updates the frontier high-water mark.
+        """
+        if size > self.max_frontier:
+            self.max_frontier = size;
+
+    def set_initial_heuristic(self, h: float) -> None:
+        self.initial_heuristic = h;
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Adds `n` to the counter `name`.
+        """
+        self.counters[name] = self.counters.get(name, 0) + n;
+
+    #   Accessors
+    @property
+    def average_heuristic(self) -> float | None:
+        if self._heuristic_count == 0:
+            return None;
+        return self._total_heuristic / self._heuristic_count;
+
+    @property
+    def branching_factor(self) -> float:
+        """
+        The average number of successors generated per expanded node.
+        """
+        if self.expanded_nodes == 0:
+            return 0.0;
+        return self.generated_nodes / self.expanded_nodes;
+
+    @property
+    def nodes_per_second(self) -> float:
+        if self.search_time <= 0.0:
+            return 0.0;
+        return self.expanded_nodes / self.search_time;
+
+    def percentile(self, name: str, q: float) -> float:
+        """
+        Returns the `q`-th percentile (0 to 100, nearest rank) of the timer `name`.
+
+        Raises:
+            KeyError: If no sample was recorded for `name`.
+        """
+        samples = sorted(self._samples[name]);
+        rank = max(1, math.ceil(q / 100 * len(samples)));
+        return samples[rank - 1];
+
+    #   Reporting
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns the statistics as a JSON-serializable dictionary.
+        """
+        timers = {};
+        for name, samples in self._samples.items():
+            timers[name] = {
+                "count": self._seen[name],
+                "p50": self.percentile(name, 50),
+                "p90": self.percentile(name, 90),
+                "p99": self.percentile(name, 99),
+                "max": max(samples),
+            };
+        return {
+            "name": self.name,
+            "expanded_nodes": self.expanded_nodes,
+            "generated_nodes": self.generated_nodes,
+            "branching_factor": self.branching_factor,
+            "max_frontier": self.max_frontier,
+            "initial_heuristic": self.initial_heuristic,
+            "average_heuristic": self.average_heuristic,
+            "search_time": self.search_time,
+            "nodes_per_second": self.nodes_per_second,
+            "counters": dict(self.counters),
+            "timers": timers,
+        };
+
+    def csv_header(self) -> str:
+        return ",".join(CSV_FIELDS);
+
+    def csv_line(self) -> str:
+        line = io.StringIO();
+        csv.DictWriter(line, fieldnames=CSV_FIELDS, lineterminator="").writerow(_csv_row(self.as_dict()));
+        return line.getvalue();
+
+    def emit(self) -> None:
+        """
+        Writes the current record to every sink.
+        """
+        if not self.sinks:
+            return;
+        record = self.as_dict();
+        for sink in self.sinks:
+            sink.write(record);
+
+    def finish(self) -> None:
+        """
+        Stops the timer and emits the record. Search entry points call this once, when they return.
+        """
+        self.stop_timer();
+        self.emit();
+
+    #   Checkpointing
+    def state_dict(self) -> dict[str, Any]:
+        """
+        Returns the counters of the search as a JSON-serializable dictionary, for checkpoints.
+        Timer samples are not included.
+        """
+        self.stop_timer();
+        return {
+            "expanded_nodes": self.expanded_nodes,
+            "generated_nodes": self.generated_nodes,
+            "max_frontier": self.max_frontier,
+            "initial_heuristic": self.initial_heuristic,
+            "search_time": self.search_time,
+            "total_heuristic": self._total_heuristic,
+            "heuristic_count": self._heuristic_count,
+            "counters": dict(self.counters),
+        };
+
+    def load_state_dict(self, state: dict[str, Any]) -> None:
+        """
+        Restores counters saved by `state_dict`. The time already spent is added to `search_time`.
+        """
+        self.expanded_nodes = state["expanded_nodes"];
+        self.generated_nodes = state["generated_nodes"];
+        self.max_frontier = state["max_frontier"];
+        self.initial_heuristic = state["initial_heuristic"];
+        self.search_time = self._elapsed = state["search_time"];
+        self._total_heuristic = state["total_heuristic"];
+        self._heuristic_count = state["heuristic_count"];
+        self.counters = dict(state["counters"]);
+
+    def __str__(self) -> str:
+        return "\n".join([
+            "Search Statistics:",
+            "------------------",
+            f"Expanded nodes:    {self.expanded_nodes}",
+            f"Generated nodes:   {self.generated_nodes}",
+            f"Branching factor:  {self.branching_factor:.2f}",
+            f"Search time:       {self.search_time:.4f}s",
+            f"Max frontier size: {self.max_frontier}",
+        ]);
+
+
+def _csv_row(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns `record` as a row of the `CSV_FIELDS` columns, with nested values (counters, timers) as JSON.
+    """
+    unknown = set(record) - set(CSV_FIELDS);
+    if unknown:
+        raise ValueError(f"CSVSink: record keys {sorted(unknown)} are not CSV columns");
+    return {key: json.dumps(value, sort_keys=True) if isinstance(value, dict) else value
+            for key, value in record.items()};
+
+
+def resolve_stats(stats: SearchStats | None, name: str = "search") -> SearchStats | None:
+    """
+    Returns the stats object a search entry point should use.
+
+    If `stats` is given, it is returned unchanged. Otherwise a new `SearchStats` is created when the
+    `SEARCHING_STATS` environment variable is set, and `None` is returned when it is not.
+
+    Parameters:
+        stats (SearchStats | None): The stats object passed by the caller.
+        name (str): The label of the search, used for stats created from the environment.
+
+    Returns:
+        SearchStats | None: The stats object to update, or `None` if stats are disabled.
+    """
+    if stats is not None:
+        return stats;
+    target = os.environ.get(STATS_ENV);
+    if not target:
+        return None;
+    if target == "stderr":
+        sink = JSONLinesSink(stream=sys.stderr);
+    elif target.endswith(".csv"):
+        sink = CSVSink(target);
+    else:
+        sink = JSONLinesSink(target);
+    return SearchStats(name, sinks=[sink]);
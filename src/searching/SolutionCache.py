@@ -0,0 +1,215 @@
+""" src/searching/SolutionCache.py
+Content-addressed cache of solved puzzles, with LRU eviction and an optional persistent store.
+
+Classes:
+    -   SolutionCache
+        In-memory LRU of `key -> solution` bytes, backed by an optional SQLite file shared across processes.
+
+Functions:
+    -   canonical_form
+        Symmetry-reduced form of a Sudoku grid and the transform that maps it back.
+
+Sudoku boards are looked up twice: first by their exact key (`SudokuBoard.key()`), which costs one
+dictionary access, then by their canonical form. The canonical form is the smallest grid, byte-wise,
+among the 72 images of the board under transposition and band/stack permutations, after relabeling the
+digits in order of first appearance. Equivalent puzzles therefore share one cache entry, and a cached
+canonical solution is mapped back through the inverse transform.
+
+Boards of box size `n` have `2 * (n!)^2` such images (1152 for 16x16 boards). Beyond
+`SYMMETRY_MAX_BOX` the image table gets too large, and boards are only looked up by their exact key.
+"""
+
+import  os;
+import  sqlite3;
+import  threading;
+from    collections     import OrderedDict;
+from    itertools       import permutations;
+
+import  numpy as np;
+
+from    .sudoku.Board   import SudokuBoard;
+
+__all__ = ["SolutionCache", "canonical_form"];
+
+SYMMETRY_MAX_BOX : int = 4;
+"""The largest box size whose boards are also looked up by their canonical form."""
+
+_SYMMETRIES : dict[int, np.ndarray] = {};
+
+
+def _symmetries(n: int = 3) -> np.ndarray:
+    """
+    Returns the (2 * (n!)^2, n^4) index arrays of the grid symmetries of box size `n` used by
+    `canonical_form`, built on first use. Row `s` maps a flattened grid `g` to its image `g[_symmetries(n)[s]]`.
+    """
+    if n not in _SYMMETRIES:
+        size = n * n;
+        cells = np.arange(size * size).reshape(size, size);
+        images = [];
+        for grid in (cells, cells.T):
+            for bands in permutations(range(n)):
+                rows = np.concatenate([np.arange(n * b, n * b + n) for b in bands]);
+                for stacks in permutations(range(n)):
+                    cols = np.concatenate([np.arange(n * s, n * s + n) for s in stacks]);
+                    images.append(grid[rows][:, cols].ravel());
+        _SYMMETRIES[n] = np.array(images, dtype=np.intp);
+    return _SYMMETRIES[n];
+
+
+def canonical_form(grid: np.ndarray) -> tuple[bytes, np.ndarray, np.ndarray]:
+    """
+    Returns the canonical form of a size x size grid (size = n * n, n <= 15).
+
+    Parameters:
+        grid (np.ndarray): A size x size grid, 0 for empty cells.
+
+    Returns:
+        tuple[bytes, np.ndarray, np.ndarray]: The canonical grid as one byte per cell, the cell permutation
+        `perm` and the digit relabeling `labels` (indexed by digit, `labels[0] == 0`) such that
+        `canonical = labels[grid.ravel()[perm]]`.
+    """
+    size = grid.shape[0];
+    cells = size * size;
+    perms = _symmetries(int(round(size ** 0.5)));
+    images = grid.ravel().astype(np.uint8)[perms];                                 # (S, cells)
+    #   Position of the first occurrence of each digit, `cells` if the digit is absent
+    present = images[:, :, None] == np.arange(1, size + 1, dtype=np.uint8);         # (S, cells, size)
+    first = np.where(present.any(axis=1), present.argmax(axis=1), cells);          # (S, size)
+    #   Digits are relabeled 1..size in order of first appearance
+    ranks = np.argsort(np.argsort(first, axis=1, kind="stable"), axis=1) + 1;      # (S, size)
+    labels = np.zeros((len(perms), size + 1), dtype=np.uint8);
+    labels[:, 1:] = ranks;
+    relabeled = np.take_along_axis(labels, images.astype(np.intp), axis=1);
+    keys = [row.tobytes() for row in relabeled];
+    best = min(range(len(keys)), key=keys.__getitem__);
+    return keys[best], perms[best], labels[best];
+
+
+class SolutionCache:
+    """
+    `SolutionCache` maps puzzle keys to solutions.
+
+    The in-memory layer is an LRU bounded to `maxsize` entries. When `path` is given, entries are also
+    written to a SQLite database (WAL mode), which any number of worker processes can share; misses in
+    memory fall through to it.
+
+    Attributes:
+        maxsize (int): The maximum number of in-memory entries.
+        path (str | None): The SQLite file of the persistent layer.
+        symmetry (bool): Whether Sudoku boards are also looked up by their canonical form.
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+
+    Methods:
+        Generic keys
+            get(key: bytes) -> bytes | None
+            put(key: bytes, value: bytes)
+
+        Sudoku boards
+            get_board(board: SudokuBoard) -> SudokuBoard | None
+            put_board(board: SudokuBoard, solution: SudokuBoard)
+    """
+    def __init__(self, maxsize: int = 65536, path: str | None = None, symmetry: bool = True):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer");
+        self.maxsize = maxsize;
+        self.path = path;
+        self.symmetry = symmetry;
+        self.hits = 0;
+        self.misses = 0;
+        self._lru : OrderedDict[bytes, bytes] = OrderedDict();
+        self._lock = threading.Lock();
+        self._db : sqlite3.Connection | None = None;
+        self._db_pid : int | None = None;
+
+    #   Persistent layer
+    def _connection(self) -> sqlite3.Connection | None:
+        """
+        Returns the SQLite connection of this process, reopening it after a fork.
+        """
+        if self.path is None:
+            return None;
+        if self._db is None or self._db_pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False);
+            db.execute("PRAGMA journal_mode=WAL");
+            db.execute("PRAGMA synchronous=NORMAL");
+            db.execute("CREATE TABLE IF NOT EXISTS solutions (key BLOB PRIMARY KEY, value BLOB NOT NULL)");
+            self._db, self._db_pid = db, os.getpid();
+        return self._db;
+
+    def close(self) -> None:
+        if self._db is not None and self._db_pid == os.getpid():
+            self._db.close();
+        self._db = None;
+
+    #   Generic keys
+    def _remember(self, key: bytes, value: bytes) -> None:
+        self._lru[key] = value;
+        self._lru.move_to_end(key);
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False);
+
+    def get(self, key: bytes) -> bytes | None:
+        """
+        Returns the value cached for `key`, or `None`. Does not update `hits` nor `misses`.
+        """
+        with self._lock:
+            value = self._lru.get(key);
+            if value is not None:
+                self._lru.move_to_end(key);
+                return value;
+            db = self._connection();
+            if db is None:
+                return None;
+            row = db.execute("SELECT value FROM solutions WHERE key = ?", (key,)).fetchone();
+            if row is None:
+                return None;
+            self._remember(key, row[0]);
+            return row[0];
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """
+        Caches `value` under `key`, in memory and in the persistent layer.
+        """
+        with self._lock:
+            self._remember(key, value);
+            db = self._connection();
+            if db is not None:
+                db.execute("INSERT OR IGNORE INTO solutions (key, value) VALUES (?, ?)", (key, value));
+
+    #   Sudoku boards
+    def get_board(self, board: SudokuBoard) -> SudokuBoard | None:
+        """
+        Returns the cached solution of `board`, or `None`.
+        """
+        value = self.get(b"raw:" + board.key());
+        if value is None and self.symmetry and board.n <= SYMMETRY_MAX_BOX:
+            canonical, perm, labels = canonical_form(board.grid);
+            value = self.get(b"can:" + canonical);
+            if value is not None:
+                #   Map the canonical solution back: solution[perm] = labels^-1[canonical solution]
+                inverse = np.empty(board.size + 1, dtype=np.uint8);
+                inverse[labels] = np.arange(board.size + 1, dtype=np.uint8);
+                solution = np.empty(board.grid.size, dtype=np.uint8);
+                solution[perm] = inverse[np.frombuffer(value, dtype=np.uint8)];
+                value = solution.tobytes();
+                self._remember(b"raw:" + board.key(), value);
+        if value is None:
+            self.misses += 1;
+            return None;
+        self.hits += 1;
+        grid = np.frombuffer(value, dtype=np.uint8).reshape(board.size, board.size).astype(board.grid.dtype);
+        return SudokuBoard(grid, board.fixed.copy());
+
+    def put_board(self, board: SudokuBoard, solution: SudokuBoard) -> None:
+        """
+        Caches `solution` as the solution of `board`, and of every board equivalent to it.
+        """
+        value = solution.key();
+        self.put(b"raw:" + board.key(), value);
+        if self.symmetry and board.n <= SYMMETRY_MAX_BOX:
+            canonical, perm, labels = canonical_form(board.grid);
+            self.put(b"can:" + canonical, labels[np.frombuffer(value, dtype=np.uint8)[perm]].tobytes());
+
+    def __len__(self) -> int:
+        return len(self._lru);
@@ -0,0 +1,229 @@
+""" src/searching/SolveService.py
+asyncio front-end for solving puzzles in a process pool, with request batching and deduplication.
+
+Classes:
+    -   SolveService
+        `await service.solve(puzzle)` from any number of concurrent tasks.
+
+Functions:
+    -   solve_sudoku
+        The default solver: solves a Sudoku given as a string and returns `(status, board string)`.
+
+Concurrent requests arriving within `batch_window` seconds of each other are grouped and sent to the
+pool as a few large jobs instead of one job per request, which amortizes the inter-process overhead.
+Requests for a puzzle that is already being solved wait on the same result instead of solving it again,
+and with a `SolutionCache`, puzzles solved before are answered without reaching the pool at all.
+Everything runs locally: the only moving parts are an `asyncio.Queue`, a batching task and a
+`concurrent.futures.ProcessPoolExecutor`.
+"""
+
+import  asyncio;
+import  logging;
+import  os;
+from    concurrent.futures  import Executor, ProcessPoolExecutor;
+from    typing              import Any, Callable, Hashable;
+
+from    .sudoku.Board       import SudokuBoard;
+from    .SudokuSearch       import random_walk;
+from    .SearchResult       import SearchStatus;
+from    .SolutionCache      import SolutionCache;
+
+__all__ = ["SolveService", "solve_sudoku"];
+
+logger = logging.getLogger(__name__);
+
+
+def solve_sudoku(puzzle: str, niter: int = 100000) -> tuple[str, str]:
+    """
+    Solves a Sudoku board given in the format of `SudokuBoard.from_string`.
+
+    Parameters:
+        puzzle (str): The board to solve.
+        niter (int): The iteration limit of the search.
+
+    Returns:
+        tuple[str, str]: The `SearchStatus` value of the search and the final board, as a string.
+    """
+    result = random_walk(SudokuBoard.from_string(puzzle), niter=niter);
+    return result.status.value, result.state.board.to_string();
+
+
+def sudoku_key(puzzle: str) -> str:
+    """
+    Returns `puzzle` with normalized whitespace, so differently formatted copies of a board share one key.
+    Separators are dropped when every value is a single digit, and kept otherwise (16x16 and larger boards).
+    """
+    values = puzzle.split();
+    return "".join(values) if all(len(v) == 1 for v in values) else " ".join(values);
+
+
+def _solve_batch(solver: Callable[[Any], Any], puzzles: list[Any]) -> list[tuple[bool, Any]]:
+    """
+    Runs in a worker process. Solves each puzzle and returns `(True, result)` or `(False, exception)`,
+    so one failing puzzle does not fail its whole batch.
+    """
+    results = [];
+    for puzzle in puzzles:
+        try:
+            results.append((True, solver(puzzle)));
+        except Exception as e:
+            results.append((False, e));
+    return results;
+
+
+class SolveService:
+    """
+    `SolveService` solves puzzles submitted concurrently from asyncio tasks.
+
+    Usage:
+        async with SolveService() as service:
+            status, board = await service.solve(puzzle)
+
+    Attributes:
+        solver (Callable): A picklable, module-level function solving one puzzle in a worker process.
+        key (Callable): Maps a puzzle to a hashable key; requests with equal keys are solved once.
+        batch_window (float): Seconds the batcher waits for more requests after the first one.
+        max_batch (int): The maximum number of distinct puzzles per batch.
+        max_workers (int): The number of worker processes.
+        cache (SolutionCache | None): Solutions of Sudoku boards, checked before a puzzle is queued.
+    """
+    def __init__(self,  solver: Callable[[Any], Any] = solve_sudoku,
+                        key: Callable[[Any], Hashable] = sudoku_key,
+                        batch_window: float = 0.005,
+                        max_batch: int = 64,
+                        max_workers: int | None = None,
+                        executor: Executor | None = None,
+                        cache: SolutionCache | None = None):
+        """
+        Parameters:
+            solver (Callable): The function solving one puzzle. Must be picklable.
+            key (Callable): Maps a puzzle to a hashable deduplication key.
+            batch_window (float): Seconds to wait for more requests once a batch is started.
+            max_batch (int): The maximum number of puzzles per batch.
+            max_workers (int | None): The size of the process pool. Defaults to the CPU count.
+            executor (Executor | None): An executor to use instead of a private process pool.
+                It is not shut down by `close()`.
+            cache (SolutionCache | None): Answers puzzles solved before, in the parent process, and stores
+                new solutions. Puzzles and results must be in the formats of `solve_sudoku`. Use a
+                `path` to share it with other services.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be a positive integer");
+        self.solver = solver;
+        self.key = key;
+        self.batch_window = batch_window;
+        self.max_batch = max_batch;
+        self.max_workers = max_workers or os.cpu_count() or 1;
+        self.cache = cache;
+
+        self._executor = executor;
+        self._owns_executor = executor is None;
+        self._queue : asyncio.Queue | None = None;
+        self._inflight : dict[Hashable, asyncio.Future] = {};
+        self._batcher : asyncio.Task | None = None;
+        self._dispatches : set[asyncio.Task] = set();
+
+    async def start(self) -> None:
+        """
+        Starts the process pool and the batching task. Called by `async with` and by the first `solve`.
+        """
+        if self._batcher is not None:
+            return;
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers);
+        self._queue = asyncio.Queue();
+        self._batcher = asyncio.create_task(self._batch_loop());
+
+    async def close(self) -> None:
+        """
+        Waits for the dispatched batches, stops the batching task and shuts down the private pool.
+        """
+        if self._batcher is None:
+            return;
+        self._batcher.cancel();
+        try:
+            await self._batcher;
+        except asyncio.CancelledError:
+            pass;
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True);
+        for future in self._inflight.values():
+            if not future.done():
+                future.cancel();
+        self._inflight.clear();
+        self._batcher = None;
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True);
+            self._executor = None;
+
+    async def __aenter__(self) -> "SolveService":
+        await self.start();
+        return self;
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close();
+
+    async def solve(self, puzzle: Any) -> Any:
+        """
+        Solves `puzzle`, sharing the work with any identical puzzle already in flight.
+
+        Parameters:
+            puzzle (Any): The puzzle, in the format expected by `solver`.
+
+        Raises:
+            Exception: Whatever `solver` raised for this puzzle.
+
+        Returns:
+            Any: The value returned by `solver`.
+        """
+        await self.start();
+        if self.cache is not None:
+            solution = self.cache.get_board(SudokuBoard.from_string(puzzle));
+            if solution is not None:
+                return SearchStatus.SOLVED.value, solution.to_string();
+        k = self.key(puzzle);
+        future = self._inflight.get(k);
+        if future is None:
+            future = asyncio.get_running_loop().create_future();
+            self._inflight[k] = future;
+            self._queue.put_nowait((k, puzzle));
+        #   Shielded: a cancelled caller must not cancel the result other callers share
+        return await asyncio.shield(future);
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop();
+        while True:
+            batch = [await self._queue.get()];
+            deadline = loop.time() + self.batch_window;
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time();
+                if timeout <= 0:
+                    break;
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout));
+                except asyncio.TimeoutError:
+                    break;
+            #   Split the batch so every worker gets a share of it
+            chunks = min(len(batch), self.max_workers);
+            for c in range(chunks):
+                task = asyncio.create_task(self._dispatch(batch[c::chunks]));
+                self._dispatches.add(task);
+                task.add_done_callback(self._dispatches.discard);
+
+    async def _dispatch(self, batch: list[tuple[Hashable, Any]]) -> None:
+        loop = asyncio.get_running_loop();
+        try:
+            results = await loop.run_in_executor(self._executor, _solve_batch, self.solver, [p for _, p in batch]);
+        except Exception as e:
+            logger.debug("batch of %d puzzles failed: %r", len(batch), e);
+            results = [(False, e)] * len(batch);
+        for (k, puzzle), (ok, value) in zip(batch, results):
+            future = self._inflight.pop(k, None);
+            if future is None or future.done():
+                continue;
+            if ok:
+                if self.cache is not None and value[0] == SearchStatus.SOLVED.value:
+                    self.cache.put_board(SudokuBoard.from_string(puzzle), SudokuBoard.from_string(value[1]));
+                future.set_result(value);
+            else:
+                future.set_exception(value);
@@ -3,76 +3,415 @@ Implementation of local search algorithms for the Sudoku game.
 Methods:
     -   random_walk
         Local search where the next state is chosen randomly from the neighbors of the current state.
+    -   beam_search
+        Beam search over complete assignments, scoring each layer in one vectorized call.
+    -   stochastic_beam_search
+        Beam search sampling each layer with Boltzmann probabilities of the scores.
+    -   hill_climbing
+        Steepest-ascent or first-improvement hill climbing over row swaps, with sideways moves and restarts.
 """
 
+import  logging;
 import  random;
-from    sudoku.GameState    import GameState, SudokuBoard as Board;
-from    sudoku.Board        import b_1, solved_board;
+import  numpy as np;
+from    typing              import Any, Callable;
+from    .sudoku.GameState   import GameState, SudokuBoard as Board;
+from    .sudoku.Board       import b_1, solved_board;
+from    .SearchStats        import SearchStats, resolve_stats;
+from    .SearchResult       import SearchResult, SearchStatus;
+from    .Progress           import ProgressReporter, as_progress;
+from    .Budget             import SearchBudget;
+from    .Checkpoint         import Checkpoint, Checkpointer, pack_rng, unpack_rng;
+from    .SolutionCache      import SolutionCache;
+from    .sudoku             import Vectorized;
+from    .                   import BeamSearch;
 
-def random_walk(board: Board, niter: int = 1000) -> GameState:
+logger = logging.getLogger(__name__);
+
+STATE_OVERHEAD : int = 256;
+"""Estimated bytes of a `GameState` on top of its grid and fixed arrays, used for frontier memory budgets."""
+
+def random_walk(board: Board,
+                niter: int = 1000,
+                stats: SearchStats | None = None,
+                progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                budget: SearchBudget | None = None,
+                rng: random.Random | None = None,
+                checkpointer: Checkpointer | None = None,
+                cache: SolutionCache | None = None) -> SearchResult:
     """
     Local Search where the next state is chosen randomly from the neighbors of the current state.
     
     Parameters:
         board (Board): The current state of the game.
         niter (int): The maximum number of iterations.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, frontier memory and cancellation limits.
+        rng (random.Random | None): The random number generator. Defaults to the `random` module.
+        checkpointer (Checkpointer | None): Saves the search periodically and when it stops on its budget,
+            and resumes it from an existing checkpoint. Resumed states have no `history` nor `parent`.
+        cache (SolutionCache | None): Answers repeated or equivalent boards without searching, and
+            stores new solutions.
     
     Returns:
-        GameState: The final state of the game.
+        SearchResult: The solved state, or the most filled-in state reached, with the status of the search.
     """
+    #   Answer from the cache
+    if cache is not None:
+        solution = cache.get_board(board);
+        if solution is not None:
+            return SearchResult(GameState(solution), SearchStatus.SOLVED, 0, stats);
+    
     #   Initialize the state
+    rng         : random.Random     = random if rng is None else rng;
     state       : GameState         = GameState(board);
-    visited     : set[GameState]    = set();
+    visited     : set[bytes]        = set();
     frontier    : list[GameState]   = [state];
+    best        : GameState         = state;
+    status      : SearchStatus      = SearchStatus.ITERATION_LIMIT;
+    start       : int               = 0;
+    i           : int               = 0;
     
     #   Add the initial state to the visited set
-    visited.add(state);
+    visited.add(board.key());
+    
+    #   Statistics and progress are only touched when enabled
+    stats    = resolve_stats(stats, "random_walk");
+    progress = as_progress(progress);
     
-    #   Add the initial state to the frontier
-    frontier.append(state);
+    #   Resume from a previous checkpoint
+    if checkpointer is not None:
+        checkpoint = checkpointer.load("random_walk");
+        if checkpoint is not None:
+            state, frontier, visited, best, start = _restore_random_walk(checkpoint, board, rng, stats);
+    
+    if stats is not None:
+        stats.start_timer();
+    if budget is not None:
+        budget.start();
+        state_bytes = board.grid.nbytes + board.fixed.nbytes + STATE_OVERHEAD;
     
     #   Local search with random walk as next state
-    for i in range(niter):
+    for i in range(start, niter):
+        if checkpointer is not None and checkpointer.due(i):
+            checkpointer.save(_snapshot_random_walk(i, state, frontier, visited, best, rng, stats));
+        
         #   Is solved?
         if state.board.is_solved():
-            print("Solved!");
-            print(state.board.grid);
+            status = SearchStatus.SOLVED;
             break;
         
         #   Check if the frontier is empty
         if len(frontier) == 0:
-            print("Frontier is empty");
+            status = SearchStatus.EXHAUSTED;
             break;
         
+        #   Check the budget, amortized over `check_every` iterations
+        if budget is not None and i % budget.check_every == 0:
+            stop = budget.check(i, len(frontier) * state_bytes);
+            if stop is not None:
+                status = stop;
+                if checkpointer is not None:
+                    checkpointer.save(_snapshot_random_walk(i, state, frontier, visited, best, rng, stats));
+                break;
+        
         #   Get a random state from the frontier
-        state = random.choice(frontier);
+        state = rng.choice(frontier);
         
         #   Get the neighbors of the state
         neighbors = state.get_neighbors(state.board);
         
         #   Remove the state from the frontier
         frontier.remove(state);
+        if state.moves > best.moves:
+            best = state;
         
         #   Add the neighbors to the frontier
         for neighbor in neighbors:
-            if neighbor not in visited:
+            key = neighbor.board.key();
+            if key not in visited:
                 frontier.append(neighbor);
-                visited.add(neighbor);
+                visited.add(key);
         
-        if i % 100 == 0:
-            print("Iteration: ", i);
+        if stats is not None:
+            stats.node_expanded();
+            stats.nodes_generated(len(neighbors));
+            stats.update_max_frontier(len(frontier));
         
-    #   Return the final state
-    print(f"Iterations: {i}");
-    return state;
+        if progress is not None and i % progress.every == 0:
+            progress.report(i, frontier=len(frontier));
+    else:
+        if state.board.is_solved():
+            status = SearchStatus.SOLVED;
+        i = niter;
+    
+    #   Return the final state, or the best one if the search stopped early
+    logger.debug("random_walk: %s after %d iterations", status.value, i);
+    if checkpointer is not None and status in (SearchStatus.SOLVED, SearchStatus.EXHAUSTED):
+        checkpointer.finish();
+    if cache is not None and status is SearchStatus.SOLVED:
+        cache.put_board(board, state.board);
+    if stats is not None:
+        stats.finish();
+    return SearchResult(state if status is SearchStatus.SOLVED else best, status, i, stats);
+
+def beam_search(board: Board,
+                width: int = 16,
+                max_layers: int = 1000,
+                patience: int | None = 50,
+                stochastic: bool = False,
+                temperature: float = 1.0,
+                rng: np.random.Generator | None = None,
+                stats: SearchStats | None = None,
+                progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                budget: SearchBudget | None = None,
+                cache: SolutionCache | None = None) -> SearchResult:
+    """
+    Beam search over complete assignments of `board`.
+
+    States are (cells,) grids whose rows are permutations of 1..size that keep the fixed cells; the successors
+    of a state swap two free cells of one of its rows. The score of a state is its number of duplicated
+    values in columns and boxes (rows have none), computed for a whole layer by `Vectorized.conflicts`.
+    The initial layer holds `width` random assignments.
+
+    Parameters:
+        board (Board): The board to solve.
+        width (int): The number of states kept per layer.
+        max_layers (int): The maximum number of layers.
+        patience (int | None): Stop after this many layers without improving the best score.
+        stochastic (bool): Sample each layer instead of keeping its best states.
+        temperature (float): The temperature of the sampling, in conflicts.
+        rng (np.random.Generator | None): The random number generator.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, frontier memory and cancellation limits.
+        cache (SolutionCache | None): Answers repeated or equivalent boards without searching, and
+            stores new solutions.
+
+    Returns:
+        SearchResult: The solved state, or the assignment with the fewest conflicts, with its conflicts as `cost`.
+    """
+    if cache is not None:
+        solution = cache.get_board(board);
+        if solution is not None:
+            return SearchResult(GameState(solution), SearchStatus.SOLVED, 0, stats, cost=0);
+    rng = np.random.default_rng() if rng is None else rng;
+    swaps = Vectorized.row_swaps(board.fixed);
+    g = Vectorized.geometry(board.n);
+    units = g.units[g.size:];
+    result = BeamSearch.beam_search(
+        Vectorized.fill_rows(board.grid, board.fixed, rng, width),
+        expand=lambda layer: Vectorized.apply_swaps(layer, swaps),
+        score=lambda grids: Vectorized.conflicts(grids, units, g.n),
+        width=width, max_layers=max_layers, patience=patience, stochastic=stochastic,
+        temperature=temperature, rng=rng,
+        stats=stats,
+        progress=progress, budget=budget);
+    grid = result.state.reshape(board.size, board.size).astype(board.grid.dtype);
+    result.state = GameState(Board(grid, board.fixed.copy()));
+    if cache is not None and result.status is SearchStatus.SOLVED:
+        cache.put_board(board, result.state.board);
+    return result;
+
+def stochastic_beam_search(board: Board, width: int = 16, temperature: float = 1.0, **kwargs) -> SearchResult:
+    """
+    Stochastic beam search over complete assignments of `board`. See `beam_search` for the parameters.
+    """
+    return beam_search(board, width, stochastic=True, temperature=temperature, **kwargs);
+
+def hill_climbing(board: Board,
+                  niter: int = 100000,
+                  first_improvement: bool = False,
+                  max_sideways: int = 100,
+                  restarts: int | None = None,
+                  rng: np.random.Generator | None = None,
+                  stats: SearchStats | None = None,
+                  progress: ProgressReporter | Callable[[dict[str, Any]], None] | None = None,
+                  budget: SearchBudget | None = None,
+                  cache: SolutionCache | None = None) -> SearchResult:
+    """
+    Hill climbing over complete assignments of `board`, as in `beam_search`: rows are permutations of
+    1..size keeping the fixed cells, and a move swaps two free cells of a row.
+
+    Every step scores all the moves at once with `Vectorized.RowSwapScorer`, from the column and box
+    counts of the current assignment, and applies one of them in place: the best move (steepest ascent,
+    ties broken at random) or a random improving move (first improvement). When no move improves, up to
+    `max_sideways` consecutive moves that keep the score are allowed; past that, or at a strict local
+    minimum, the search restarts from a new random assignment.
+
+    Parameters:
+        board (Board): The board to solve.
+        niter (int): The maximum number of steps, over all restarts.
+        first_improvement (bool): Apply a random improving move instead of the best one.
+        max_sideways (int): The maximum number of consecutive sideways moves.
+        restarts (int | None): The maximum number of restarts. Unlimited when `None`.
+        rng (np.random.Generator | None): The random number generator.
+        stats (SearchStats | None): Collects the statistics of the search. Disabled when `None`.
+        progress (ProgressReporter | Callable | None): Receives rate-limited progress updates.
+        budget (SearchBudget | None): Deadline, expansion, frontier memory and cancellation limits.
+        cache (SolutionCache | None): Answers repeated or equivalent boards without searching, and
+            stores new solutions.
+
+    Returns:
+        SearchResult: The solved state, or the assignment with the fewest conflicts, with its conflicts as
+            `cost`. `status` is `EXHAUSTED` when the restarts ran out.
+    """
+    if cache is not None:
+        solution = cache.get_board(board);
+        if solution is not None:
+            return SearchResult(GameState(solution), SearchStatus.SOLVED, 0, stats, cost=0);
+    rng = np.random.default_rng() if rng is None else rng;
+    scorer = Vectorized.RowSwapScorer(board.fixed);
+    scorer.reset(Vectorized.fill_rows(board.grid, board.fixed, rng)[0]);
+    best, best_score = scorer.grid.copy(), scorer.score;
+    status = SearchStatus.ITERATION_LIMIT;
+    sideways = 0;
+    restart = 0;
+    i = 0;
+
+    stats    = resolve_stats(stats, "hill_climbing");
+    progress = as_progress(progress);
+    if stats is not None:
+        stats.start_timer();
+        stats.set_initial_heuristic(scorer.score);
+    if budget is not None:
+        budget.start();
+
+    for i in range(niter):
+        if scorer.score == 0:
+            status = SearchStatus.SOLVED;
+            break;
+
+        if budget is not None and i % budget.check_every == 0:
+            stop = budget.check(i, scorer.grid.nbytes);
+            if stop is not None:
+                status = stop;
+                break;
+
+        #   Score every move of the current assignment
+        deltas = scorer.deltas();
+        if stats is not None:
+            stats.node_expanded(scorer.score);
+            stats.nodes_generated(len(deltas));
+        if len(deltas) == 0:
+            status = SearchStatus.EXHAUSTED;
+            break;
+
+        #   Choose a move: improving, else sideways while allowed, else restart
+        if first_improvement:
+            candidates = np.flatnonzero(deltas < 0);
+            if len(candidates) == 0:
+                candidates = np.flatnonzero(deltas == 0);
+        else:
+            candidates = np.flatnonzero(deltas == deltas.min());
+        delta = deltas[candidates[0]] if len(candidates) else 1;
+        if delta < 0:
+            sideways = 0;
+        elif delta == 0 and sideways < max_sideways:
+            sideways += 1;
+        else:
+            if restarts is not None and restart >= restarts:
+                status = SearchStatus.EXHAUSTED;
+                break;
+            restart += 1;
+            sideways = 0;
+            scorer.reset(Vectorized.fill_rows(board.grid, board.fixed, rng)[0]);
+            if stats is not None:
+                stats.count("restarts");
+            continue;
+        scorer.apply(int(candidates[rng.integers(len(candidates))]));
+
+        if scorer.score < best_score:
+            best, best_score = scorer.grid.copy(), scorer.score;
+
+        if progress is not None and i % progress.every == 0:
+            progress.report(i, score=scorer.score, best=best_score, restarts=restart);
+    else:
+        if scorer.score == 0:
+            status = SearchStatus.SOLVED;
+        i = niter;
+
+    logger.debug("hill_climbing: %s after %d steps and %d restarts, best score %d", status.value, i, restart, best_score);
+    if stats is not None:
+        stats.finish();
+    grid = best.reshape(board.size, board.size).astype(board.grid.dtype);
+    solution = Board(grid, board.fixed.copy());
+    if cache is not None and status is SearchStatus.SOLVED:
+        cache.put_board(board, solution);
+    return SearchResult(GameState(solution), status, i, stats, cost=best_score);
+
+def _pack_states(states: list[GameState], board: Board) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Packs the grids of `states`, boards of the size of `board`, into a (len(states), cells) array, and their
+    moves into an int32 array.
+    """
+    grids = np.empty((len(states), board.grid.size), dtype=Vectorized.geometry(board.n).dtype);
+    for row, s in enumerate(states):
+        grids[row] = s.board.grid.ravel();
+    return grids, np.array([s.moves for s in states], dtype=np.int32);
+
+def _unpack_states(grids: np.ndarray, moves: np.ndarray, board: Board) -> list[GameState]:
+    """
+    Inverse of `_pack_states`. The unpacked boards share the `fixed` mask and the dtype of `board`.
+    """
+    return [GameState(Board(grid.reshape(board.size, board.size).astype(board.grid.dtype), board.fixed), int(m))
+            for grid, m in zip(grids, moves)];
+
+def _snapshot_random_walk(iteration: int, state: GameState, frontier: list[GameState], visited: set[bytes],
+                          best: GameState, rng, stats: SearchStats | None) -> Checkpoint:
+    """
+    Snapshots `random_walk` at the start of `iteration`.
+    """
+    frontier_grids, frontier_moves = _pack_states(frontier, state.board);
+    current_grids, current_moves = _pack_states([state, best], state.board);
+    rng_words, rng_meta = pack_rng(rng);
+    visited_grids = np.frombuffer(b"".join(visited), dtype=frontier_grids.dtype).reshape(-1, frontier_grids.shape[1]);
+    return Checkpoint("random_walk",
+        arrays = {
+            "frontier": frontier_grids, "frontier_moves": frontier_moves,
+            "current": current_grids, "current_moves": current_moves,
+            "visited": visited_grids, "rng": rng_words,
+        },
+        meta = {
+            "iteration": iteration, "rng": rng_meta,
+            "stats": stats.state_dict() if stats is not None else None,
+        });
+
+def _restore_random_walk(checkpoint: Checkpoint, board: Board, rng, stats: SearchStats | None):
+    """
+    Inverse of `_snapshot_random_walk`: restores `rng` and `stats` in place and returns the search variables.
+    """
+    arrays, meta = checkpoint.arrays, checkpoint.meta;
+    frontier = _unpack_states(arrays["frontier"], arrays["frontier_moves"], board);
+    state, best = _unpack_states(arrays["current"], arrays["current_moves"], board);
+    visited = {row.tobytes() for row in arrays["visited"]};
+    unpack_rng(rng, arrays["rng"], meta["rng"]);
+    if stats is not None and meta["stats"] is not None:
+        stats.load_state_dict(meta["stats"]);
+    return state, frontier, visited, best, meta["iteration"];
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO);
+    
     #   Solved board for testing
     board = Board.from_string(solved_board);
-    state = random_walk(board, niter=1000);
-    print(state.board.grid);
+    result = random_walk(board, niter=1000);
+    print(result);
+    print(result.state.board.grid);
     
     #   Random board for testing
     board = Board.from_string(b_1);
-    state = random_walk(board, niter=1000);
-    print(state.board.grid);
\ No newline at end of file
+    result = random_walk(board, niter=1000, progress=lambda info: print(info));
+    print(result);
+    print(result.state.board.grid);
+    
+    #   Beam searches on the solved board with 30 cells cleared
+    grid = Board.from_string(solved_board).grid.copy();
+    grid.ravel()[np.random.default_rng(0).choice(81, 30, replace=False)] = 0;
+    board = Board(grid, grid != 0);
+    for search in (beam_search, stochastic_beam_search):
+        result = search(board, rng=np.random.default_rng(0));
+        print(search.__name__, result, result.cost);
+    result = hill_climbing(board, rng=np.random.default_rng(0));
+    print("hill_climbing", result, result.cost);
@@ -0,0 +1,108 @@
+""" src/searching/TableCache.py
+Precomputed lookup tables (peer indices, move tables, heuristic lookups), built on first use and cached on disk.
+Functions:
+    -   cached
+        Returns the named tables, from memory, from the cache file, or built and saved.
+    -   cache_dir
+        The directory of the cache files, if the disk cache is enabled.
+    -   clear
+        Forgets the tables held in memory and, optionally, removes the cache files.
+
+A set of tables is a dictionary of NumPy arrays saved as `<name>-v<FORMAT_VERSION>.<version>.npz`, where
+`version` is bumped by the module building the tables whenever their content changes, so stale files are
+never read. Files are written to a temporary name and renamed, so processes building the same tables at
+the same time (e.g. the workers of a pool) never read a partial file. The directory is
+`$SEARCHING_CACHE_DIR`, else `$XDG_CACHE_HOME/searching`, else `~/.cache/searching`; setting
+`SEARCHING_CACHE_DIR` to an empty string keeps the tables in memory only. A cache that cannot be read or
+written is skipped silently: the tables are then built in memory.
+"""
+
+import  logging;
+import  os;
+import  zipfile;
+from    typing  import Callable;
+
+__all__ = ["cached", "cache_dir", "clear"];
+
+logger = logging.getLogger(__name__);
+
+FORMAT_VERSION : int = 1;
+
+_tables : dict[tuple[str, int], dict] = {};
+
+
+def cache_dir() -> str | None:
+    """
+    Returns the directory of the cache files, or `None` if the disk cache is disabled.
+    """
+    directory = os.environ.get("SEARCHING_CACHE_DIR");
+    if directory is not None:
+        return directory or None;
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache");
+    return os.path.join(base, "searching");
+
+
+def _path(directory: str, name: str, version: int) -> str:
+    return os.path.join(directory, f"{name}-v{FORMAT_VERSION}.{version}.npz");
+
+
+def cached(name: str, build: Callable[[], dict], version: int = 1) -> dict:
+    """
+    Returns the tables `name`: built by `build()` the first time they are needed, then read from memory in
+    this process and from the cache file in the next ones.
+
+    Parameters:
+        name (str): The name of the tables, unique among the callers, e.g. `sudoku-geometry-3`.
+        build (Callable): Returns the tables, a dictionary of NumPy arrays.
+        version (int): The version of the content of the tables.
+
+    Returns:
+        dict[str, np.ndarray]: The tables. They are shared by all the callers and must not be modified.
+    """
+    key = (name, version);
+    tables = _tables.get(key);
+    if tables is not None:
+        return tables;
+
+    #   NumPy is only imported by the first table lookup, not by importing the package
+    import numpy as np;
+
+    directory = cache_dir();
+    path = _path(directory, name, version) if directory is not None else None;
+    if path is not None and os.path.exists(path):
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                tables = {k: data[k] for k in data.files};
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile) as error:
+            logger.debug("TableCache: cannot read %s: %s", path, error);
+
+    if tables is None:
+        tables = build();
+        if path is not None:
+            tmp = f"{path}.{os.getpid()}.tmp";
+            try:
+                os.makedirs(directory, exist_ok=True);
+                with open(tmp, "wb") as f:
+                    np.savez(f, **tables);
+                os.replace(tmp, path);
+            except OSError as error:
+                logger.debug("TableCache: cannot write %s: %s", path, error);
+                if os.path.exists(tmp):
+                    os.remove(tmp);
+
+    for array in tables.values():
+        array.flags.writeable = False;
+    _tables[key] = tables;
+    return tables;
+
+
+def clear(files: bool = False) -> None:
+    """
+    Forgets the tables held in memory, and removes the cache files of this format version when `files`.
+    """
+    _tables.clear();
+    directory = cache_dir();
+    if files and directory is not None and os.path.isdir(directory):
+        for entry in os.listdir(directory):
+            if entry.endswith(".npz") and f"-v{FORMAT_VERSION}." in entry:
+                os.remove(os.path.join(directory, entry));
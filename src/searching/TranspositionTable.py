@@ -0,0 +1,121 @@
+""" src/searching/TranspositionTable.py
+Fixed-size transposition table for the iterative-deepening searches.
+
+Classes:
+    -   TranspositionTable
+        Open-addressed table of `key -> (bound, depth)` backed by NumPy arrays.
+
+The table is allocated once and never grows: memory use is `capacity * bytes_per_entry`, whatever the
+size of the state space. Keys hash to a bucket of two slots:
+    -   slot 0 is depth-preferred: it is only overwritten by an entry searched at least as deep,
+        so the results of expensive subtrees survive;
+    -   slot 1 is always-replace: it takes every entry slot 0 refuses, so recent results are kept too.
+
+In IDA*, `bound` is an improved admissible estimate of the cost-to-go of a state (the smallest f-value
+that exceeded the threshold below it, minus its g) and `depth` is the remaining threshold the state was
+searched with. Reusing the bound prunes subtrees already known to fail, both within an iteration (for
+transpositions) and across iterations.
+"""
+
+import  numpy as np;
+
+__all__ = ["TranspositionTable"];
+
+_GOLDEN : int = 0x9E3779B97F4A7C15;
+_MASK64 : int = (1 << 64) - 1;
+
+
+class TranspositionTable:
+    """
+    `TranspositionTable` stores improved bounds of states, indexed by their 64-bit keys.
+
+    Attributes:
+        capacity (int): The number of entries, a power of two (two per bucket).
+        keys (np.ndarray): (buckets, 2) uint64 array of stored keys.
+        bounds (np.ndarray): (buckets, 2) float64 array of stored bounds.
+        depths (np.ndarray): (buckets, 2) int32 array of stored depths, -1 for empty slots.
+        hits (int): Successful probes.
+        misses (int): Failed probes.
+        overwrites (int): Stores that evicted a different key.
+
+    Methods:
+        probe(key: int) -> float | None
+        store(key: int, bound: float, depth: int)
+        clear()
+    """
+    def __init__(self, capacity: int = 1 << 20):
+        """
+        Parameters:
+            capacity (int): The number of entries, rounded up to a power of two (at least 2).
+        """
+        buckets = 1 << max(0, (max(capacity, 2) // 2 - 1).bit_length());
+        self.capacity = 2 * buckets;
+        self._shift = 64 - (buckets.bit_length() - 1);
+        self.keys = np.zeros((buckets, 2), dtype=np.uint64);
+        self.bounds = np.zeros((buckets, 2), dtype=np.float64);
+        self.depths = np.full((buckets, 2), -1, dtype=np.int32);
+        self.hits = 0;
+        self.misses = 0;
+        self.overwrites = 0;
+        #   Flat views of the arrays: indexing a memoryview yields Python scalars, much faster than NumPy
+        #   scalar indexing in the probe/store hot path. Slot `s` of bucket `b` is at index `2 * b + s`.
+        self._keys = memoryview(self.keys.reshape(-1));
+        self._bounds = memoryview(self.bounds.reshape(-1));
+        self._depths = memoryview(self.depths.reshape(-1));
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the table arrays, in bytes.
+        """
+        return self.keys.nbytes + self.bounds.nbytes + self.depths.nbytes;
+
+    def _bucket(self, key: int) -> int:
+        if self._shift == 64:
+            return 0;
+        return ((key * _GOLDEN) & _MASK64) >> self._shift;
+
+    def probe(self, key: int) -> float | None:
+        """
+        Returns the bound stored for `key`, or `None` if the key is not in the table.
+        """
+        i = 2 * self._bucket(key);
+        keys, depths = self._keys, self._depths;
+        if keys[i] == key and depths[i] >= 0:
+            self.hits += 1;
+            return self._bounds[i];
+        if keys[i + 1] == key and depths[i + 1] >= 0:
+            self.hits += 1;
+            return self._bounds[i + 1];
+        self.misses += 1;
+        return None;
+
+    def store(self, key: int, bound: float, depth: int) -> None:
+        """
+        Stores `bound` for `key`, searched with the remaining depth `depth`.
+
+        The entry goes to the depth-preferred slot if it is empty, holds the same key, or holds a
+        shallower entry; otherwise it goes to the always-replace slot.
+        """
+        i = 2 * self._bucket(key);
+        keys, depths = self._keys, self._depths;
+        if depths[i] < 0 or keys[i] == key or depth >= depths[i]:
+            if depths[i + 1] >= 0 and keys[i + 1] == key:
+                depths[i + 1] = -1;
+        else:
+            i += 1;
+        if depths[i] >= 0 and keys[i] != key:
+            self.overwrites += 1;
+        keys[i] = key;
+        self._bounds[i] = bound;
+        depths[i] = depth;
+
+    def clear(self) -> None:
+        """
+        Empties the table without releasing its memory.
+        """
+        self.depths.fill(-1);
+        self.hits = self.misses = self.overwrites = 0;
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.depths >= 0));
@@ -0,0 +1,60 @@
+""" src/searching/__init__.py
+The `searching` package: search algorithms, the Sudoku and sliding puzzle problems, and their tools.
+
+Importing the package loads nothing else: its submodules are imported the first time one of them, or one
+of the names below, is accessed (module `__getattr__`), so a worker process or a command line tool only
+pays for the modules it uses. NumPy is not imported before a module needing it is.
+
+Subpackages:
+    -   sudoku
+        The Sudoku board, its vectorized and propagation kernels, and the puzzle generator.
+    -   puzzle
+        The sliding puzzles (8-puzzle, 15-puzzle, ...), with their move and heuristic tables.
+
+Names exported lazily, by module:
+    -   PuzzleSearch: ida_star, iterative_deepening, rbfs, sma_star, ara_star
+    -   ExternalBFS: external_bfs
+    -   BeamSearch: beam_search, stochastic_beam_search
+    -   CSP: SudokuCSP, ColoringCSP, backtracking_search, min_conflicts
+    -   GeneticSearch: genetic_algorithm
+    -   SearchResult, Budget, Progress: SearchStatus, SearchBudget, CancellationToken, ProgressReporter
+    -   puzzle.SlidingPuzzle, sudoku.Board: SlidingPuzzle, SudokuBoard
+The modules named like their main class (`CSP`, `SearchStats`, `SearchResult`, `GraphProblem`,
+`TranspositionTable`, `Checkpoint`, `SolutionCache`, `SolveService`, ...) are accessed as modules.
+"""
+
+import  importlib;
+
+_EXPORTS : dict[str, str] = {
+    "ida_star": "PuzzleSearch", "iterative_deepening": "PuzzleSearch", "rbfs": "PuzzleSearch",
+    "sma_star": "PuzzleSearch", "ara_star": "PuzzleSearch",
+    "external_bfs": "ExternalBFS",
+    "beam_search": "BeamSearch", "stochastic_beam_search": "BeamSearch",
+    "SudokuCSP": "CSP", "ColoringCSP": "CSP", "backtracking_search": "CSP", "min_conflicts": "CSP",
+    "genetic_algorithm": "GeneticSearch",
+    "SearchStatus": "SearchResult", "SearchBudget": "Budget", "CancellationToken": "Budget",
+    "ProgressReporter": "Progress",
+    "SlidingPuzzle": "puzzle.SlidingPuzzle", "SudokuBoard": "sudoku.Board",
+};
+
+_SUBMODULES : frozenset[str] = frozenset({
+    "sudoku", "puzzle", "BeamSearch", "Budget", "CSP", "Checkpoint", "ExternalBFS", "GeneticSearch",
+    "GraphProblem", "Progress", "PuzzleSearch", "SearchProblem", "SearchResult", "SearchStats",
+    "SolutionCache", "SolveService", "SudokuSearch", "TableCache", "TranspositionTable",
+});
+
+__all__ = sorted(_EXPORTS);
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__);
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name);
+        globals()[name] = value;
+        return value;
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}");
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES);
@@ -0,0 +1,206 @@
+"""
+    src/searching/puzzle/SlidingPuzzle.py
+    Definition of the N-puzzle (8-puzzle, 15-puzzle, ...) as a `SearchProblem`.
+"""
+
+from    functools   import lru_cache;
+
+#   Pre-defined instances
+p8_1 : str = "5 0 2 6 4 8 1 7 3";
+"""The instance solved by `8PuzzleSolver/src/main.cpp`."""
+
+p8_hard : str = "8 6 7 2 5 4 3 0 1";
+"""One of the two hardest 8-puzzle instances (31 moves)."""
+
+p15_1 : str = "1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15";
+"""A 15-puzzle one move away from the goal."""
+
+p15_korf_1 : str = "14 13 15 7 11 12 9 5 6 0 2 1 4 8 10 3";
+"""The first of Korf's 100 random 15-puzzle instances (57 moves)."""
+
+
+@lru_cache(maxsize=None)
+def _tables(size: int) -> tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...]]:
+    """
+    Returns the move table (the neighbor positions of each blank position) and the heuristic table (the
+    Manhattan distance of each tile from each position) of the `size x size` board, built once per size
+    and shared by its puzzles.
+    """
+    cells = size * size;
+    moves = [];
+    for pos in range(cells):
+        row, col = divmod(pos, size);
+        moves.append(tuple(r * size + c for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                           if 0 <= r < size and 0 <= c < size));
+    distance = [(0,) * cells];
+    for tile in range(1, cells):
+        row, col = divmod(tile - 1, size);
+        distance.append(tuple(abs(row - p // size) + abs(col - p % size) for p in range(cells)));
+    return tuple(moves), tuple(distance);
+
+
+class SlidingPuzzle:
+    """
+    A `SlidingPuzzle` on a `size x size` board. The goal is `1, 2, ..., size*size - 1, 0`, as in
+    `Puzzle::State::isGoal`.
+
+    States are packed integers: tile `tiles[i]` occupies bits `[bits * (i + 1), bits * (i + 2))` and
+    the blank position occupies the lowest `bits` bits. `key(state)` drops the blank position, so keys
+    of the 8- and 15-puzzle fit in 64 bits.
+
+    Attributes:
+        size (int): The number of rows (and columns) of the board.
+        cells (int): `size * size`.
+        bits (int): The number of bits per packed cell.
+        moves (tuple): The neighbor positions of each blank position.
+        distance (tuple): The Manhattan distance of each tile from each position.
+        start (int): The packed initial state.
+        goal (int): The packed goal state.
+
+    Methods:
+        Packing
+            pack(tiles: list[int]) -> int
+            unpack(state: int) -> list[int]
+
+        SearchProblem
+            initial() -> int
+            is_goal(state: int) -> bool
+            successors(state: int) -> list[tuple[int, int]]
+            heuristic(state: int) -> int
+            key(state: int) -> int
+
+        Vectorized
+            expand_keys(keys: np.ndarray) -> np.ndarray
+
+        Validation
+            is_solvable() -> bool
+
+        Static initializers
+            from_string(puzzle_str: str)
+    """
+    def __init__(self, tiles: list[int]):
+        """
+        Given the tiles of the initial state, row by row with 0 for the blank, creates a new `SlidingPuzzle`.
+
+        Parameters:
+            tiles (list[int]): The `size * size` tiles of the initial state.
+
+        Raises:
+            ValueError: If `tiles` is not a permutation of `0, ..., size * size - 1` for some `size`.
+        """
+        size = int(round(len(tiles) ** 0.5));
+        if size < 2 or size * size != len(tiles) or sorted(tiles) != list(range(len(tiles))):
+            raise ValueError("Tiles must be a permutation of 0, ..., n*n - 1 for some n >= 2");
+        self.size = size;
+        self.cells = size * size;
+        self.bits = max(4, (self.cells - 1).bit_length());
+        self.mask = (1 << self.bits) - 1;
+        self.moves, self.distance = _tables(size);
+
+        self.start = self.pack(list(tiles));
+        self.goal = self.pack(list(range(1, self.cells)) + [0]);
+
+    @classmethod
+    def from_string(cls, puzzle_str: str) -> "SlidingPuzzle":
+        """
+        Given the tiles separated by whitespace, row by row with 0 for the blank, creates a new `SlidingPuzzle`.
+        """
+        return cls([int(t) for t in puzzle_str.split()]);
+
+    #   Packing
+    def pack(self, tiles: list[int]) -> int:
+        """
+        Packs `tiles` (row by row, 0 for the blank) into a state.
+        """
+        state = 0;
+        for i in reversed(range(self.cells)):
+            state = (state << self.bits) | tiles[i];
+        return (state << self.bits) | tiles.index(0);
+
+    def unpack(self, state: int) -> list[int]:
+        """
+        Inverse of `pack`.
+        """
+        state >>= self.bits;
+        tiles = [];
+        for _ in range(self.cells):
+            tiles.append(state & self.mask);
+            state >>= self.bits;
+        return tiles;
+
+    #   SearchProblem
+    def initial(self) -> int:
+        return self.start;
+
+    def is_goal(self, state: int) -> bool:
+        return state == self.goal;
+
+    def successors(self, state: int) -> list[tuple[int, int]]:
+        """
+        Returns the states reached by sliding a tile into the blank, each with cost 1.
+        """
+        bits = self.bits;
+        blank = state & self.mask;
+        tiles = state >> bits;
+        result = [];
+        for pos in self.moves[blank]:
+            tile = (tiles >> (bits * pos)) & self.mask;
+            moved = tiles - (tile << (bits * pos)) + (tile << (bits * blank));
+            result.append(((moved << bits) | pos, 1));
+        return result;
+
+    def heuristic(self, state: int) -> int:
+        """
+        Returns the sum of the Manhattan distances of the tiles to their goal positions.
+        """
+        bits, mask, distance = self.bits, self.mask, self.distance;
+        state >>= bits;
+        h = 0;
+        for pos in range(self.cells):
+            h += distance[state & mask][pos];
+            state >>= bits;
+        return h;
+
+    def key(self, state: int) -> int:
+        return state >> self.bits;
+
+    #   Vectorized
+    def expand_keys(self, keys: "np.ndarray") -> "np.ndarray":
+        """
+        Returns the keys of the successors of the states with the given keys, as a `uint64` array in no
+        particular order. The blank of each key is the position of its zero tile, so keys are states of
+        their own and whole layers expand in a few NumPy operations (see `ExternalBFS`).
+        """
+        #   Imported here: the other searches over puzzles do not need NumPy
+        import numpy as np;
+        keys = np.asarray(keys, dtype=np.uint64);
+        bits, mask, size = self.bits, np.uint64(self.mask), self.size;
+        blank = np.zeros(len(keys), dtype=np.int64);
+        for pos in range(self.cells):
+            blank[((keys >> np.uint64(bits * pos)) & mask) == 0] = pos;
+        row, col = np.divmod(blank, size);
+
+        children = [];
+        for delta, valid in ((-size, row > 0), (size, row < size - 1), (-1, col > 0), (1, col < size - 1)):
+            k, b = keys[valid], blank[valid];
+            to, at = ((b + delta) * bits).astype(np.uint64), (b * bits).astype(np.uint64);
+            tile = (k >> to) & mask;
+            children.append(k - (tile << to) + (tile << at));
+        return np.concatenate(children);
+
+    #   Validation
+    def is_solvable(self) -> bool:
+        """
+        Returns True if the goal is reachable from the initial state (inversion parity test).
+        """
+        tiles = self.unpack(self.start);
+        values = [t for t in tiles if t != 0];
+        inversions = sum(1 for i in range(len(values)) for j in range(i + 1, len(values)) if values[i] > values[j]);
+        if self.size % 2 == 1:
+            return inversions % 2 == 0;
+        blank_row_from_bottom = self.size - tiles.index(0) // self.size;
+        return (inversions + blank_row_from_bottom) % 2 == 1;
+
+    def __str__(self) -> str:
+        tiles = self.unpack(self.start);
+        return "\n".join(" ".join(f"{t:2d}" for t in tiles[r * self.size:(r + 1) * self.size]) for r in range(self.size));
@@ -0,0 +1,19 @@
+""" src/searching/puzzle/__init__.py
+The sliding puzzles: the module `SlidingPuzzle` (the `SlidingPuzzle` problem class and sample instances),
+imported on first access. The class itself is `searching.puzzle.SlidingPuzzle.SlidingPuzzle`, also
+exported as `searching.SlidingPuzzle`.
+"""
+
+import  importlib;
+
+_SUBMODULES : frozenset[str] = frozenset({"SlidingPuzzle"});
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__);
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}");
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES);
@@ -7,14 +7,14 @@ import numpy as np;
 
 #   Pre-defined boards
 b_1 : str = "\
-5 3 0 0 7 0 5 0 3\n\
+5 3 0 0 7 0 0 0 0\n\
 6 0 0 1 9 5 0 0 0\n\
 0 9 8 0 0 0 0 6 0\n\
 8 0 0 0 6 0 0 0 3\n\
 4 0 0 8 0 3 0 0 1\n\
 7 0 0 0 2 0 0 0 6\n\
 0 6 0 0 0 0 2 8 0\n\
-5 0 0 4 1 9 0 0 5\n\
+0 0 0 4 1 9 0 0 5\n\
 0 0 0 0 8 0 0 7 9\n";
 
 solved_board : str = "\
@@ -28,13 +28,29 @@ solved_board : str = "\
 2 8 7 4 1 9 6 3 5\n\
 3 4 5 2 8 6 1 7 9\n";
 
+def box_size(size: int) -> int | None:
+    """
+    Returns `n` such that `size == n * n` with `n >= 2`, or `None` if there is none.
+    """
+    n = int(round(size ** 0.5));
+    return n if n >= 2 and n * n == size else None;
+
+def value_dtype(size: int) -> type:
+    """
+    Returns the smallest unsigned integer dtype holding the values 0..size.
+    """
+    return np.uint8 if size < 256 else np.uint16;
+
 class SudokuBoard:
     """
-    A `SudokuBoard` representation state.
+    A `SudokuBoard` representation state, on a `size x size` grid made of `n x n` boxes
+    (9x9 for `n = 3`, 16x16 for `n = 4`, 25x25 for `n = 5`).
     
     Attributes:
-        grid (np.ndarray): 9x9 NumPy array of values
-        fixed (np.ndarray): 9x9 NumPy array of booleans
+        grid (np.ndarray): size x size NumPy array of values, 0 for empty cells
+        fixed (np.ndarray): size x size NumPy array of booleans
+        n (int): The box size
+        size (int): The number of rows, columns, boxes and values, `n * n`
         
     Methods:
         Validation of the board
@@ -51,6 +67,7 @@ class SudokuBoard:
             get_col(col_idx: int) -> np.ndarray
             get_box(box_idx: int) -> np.ndarray
             get_empty_cells() -> list[tuple[int, int]]
+            key() -> bytes
         
         Setter
             set_value(row: int, col: int, value: int)
@@ -59,25 +76,31 @@ class SudokuBoard:
             from_string(board_str: str)
             from_file(file_path: str)
         
+        Serialization
+            to_string() -> str
+        
     """
     def __init__(self, grid: np.ndarray | list[int], fixed: np.ndarray | list[bool]):
         """
-        Given a 9x9 `grid` of integers and a 9x9 `fixed` array of booleans,
-        creates a new `SudokuBoard` instance.
+        Given a `size x size` `grid` of integers and a `size x size` `fixed` array of booleans, where
+        `size = n * n`, creates a new `SudokuBoard` instance.
         
         Parameters:
-            grid (np.ndarray | list[int]): 9x9 NumPy array of values
-            fixed (np.ndarray | list[bool]): 9x9 NumPy array of booleans
+            grid (np.ndarray | list[int]): size x size NumPy array of values
+            fixed (np.ndarray | list[bool]): size x size NumPy array of booleans
             
         Raises:
-            ValueError: If `grid` and `fixed` are not 9x9 NumPy arrays
+            ValueError: If `grid` and `fixed` are not size x size NumPy arrays for the same square `size`
         """
         if isinstance(grid, list): grid = np.array(grid);
         if isinstance(fixed, list): fixed = np.array(fixed);
-        if grid.shape != (9, 9) or fixed.shape != (9, 9):
-            raise ValueError("Grid and fixed must be 9x9 NumPy arrays");
+        n = box_size(grid.shape[0]) if grid.ndim == 2 else None;
+        if n is None or grid.shape != (n * n, n * n) or fixed.shape != grid.shape:
+            raise ValueError("Grid and fixed must be size x size NumPy arrays, with size = n * n");
         self.grid = grid;
         self.fixed = fixed;
+        self.n = n;
+        self.size = n * n;
     
     def is_row_valid(self, row_index: int) -> bool:
         """
@@ -102,9 +125,9 @@ class SudokuBoard:
         """
         conflicts = set()
         # Check rows
-        for i in range(9):
+        for i in range(self.size):
             seen = {}
-            for j in range(9):
+            for j in range(self.size):
                 val = self.grid[i][j]
                 if val == 0:
                     continue
@@ -120,17 +143,32 @@ class SudokuBoard:
         """
         Given a string representation of a Sudoku board, creates a new `SudokuBoard` instance.
         
+        The values are separated by whitespace, row by row, 0 for empty cells. 9x9 boards may also be
+        given as 81 digits without separators.
+        
         Parameters:
             board_str (str): A string representation of a Sudoku board.
             
         Returns:
             SudokuBoard: A new `SudokuBoard` instance.
         """
-        board_str = board_str.replace(" ", "").replace("\n", "")
-        grid = np.array([int(board_str[i * 9 + j]) for i in range(9) for j in range(9)]).reshape(9, 9)
+        values = board_str.split()
+        if box_size(int(round(len(values) ** 0.5))) is None or len(values) == 1:
+            values = list("".join(values))
+        side = int(round(len(values) ** 0.5))
+        grid = np.array([int(v) for v in values], dtype=value_dtype(side)).reshape(side, side)
         fixed = (grid != 0);
         return cls(grid, fixed)
 
+    def to_string(self) -> str:
+        """
+        Returns the board in the format read by `from_string`: one line per row, values separated by spaces.
+        
+        Returns:
+            str: The string representation of the board.
+        """
+        return "".join(" ".join(str(v) for v in row) + "\n" for row in self.grid);
+
     def set_value(self, row: int, col: int, value: int) -> None:
         """
         Sets the value of a cell in the board.
@@ -168,16 +206,17 @@ class SudokuBoard:
 
     def get_box(self, box_idx: int) -> np.ndarray:
         """
-        Returns a box (3x3 sub-matrix) of the Sudoku board as a numpy array.
+        Returns a box (n x n sub-matrix) of the Sudoku board as a numpy array.
         
         Parameters:
             box_idx (int): The index of the box to retrieve.
         Returns:
             np.ndarray: The box of the Sudoku board.
         """
-        start_row = (box_idx // 3) * 3
-        start_col = (box_idx % 3) * 3
-        return self.grid[start_row:start_row+3, start_col:start_col+3].flatten()
+        n = self.n
+        start_row = (box_idx // n) * n
+        start_col = (box_idx % n) * n
+        return self.grid[start_row:start_row+n, start_col:start_col+n].flatten()
 
     def get_empty_cells(self) -> list[tuple[int, int]]:
         """
@@ -187,7 +226,17 @@ class SudokuBoard:
         Returns:
             list[tuple[int, int]]: A list of tuples representing the coordinates of the empty cells.
         """
-        return [(i, j) for i in range(9) for j in range(9) if self.grid[i][j] == 0];
+        return [(i, j) for i in range(self.size) for j in range(self.size) if self.grid[i][j] == 0];
+    
+    def key(self) -> bytes:
+        """
+        Returns the grid packed row by row as `value_dtype(size)` values (81 bytes for 9x9 boards).
+        Two boards have the same key if and only if their grids are equal, so keys can be used in sets and dictionaries.
+        
+        Returns:
+            bytes: The packed grid.
+        """
+        return self.grid.astype(value_dtype(self.size)).tobytes();
     
     def get_conflicts(self, row: int, col: int) -> set[int]:
         """
@@ -201,7 +250,8 @@ class SudokuBoard:
         Returns:
             set[int]: A set of values that conflict with the value at the given row and column.
         """
-        row, col, box = self.get_row(row), self.get_column(col), self.get_box((row // 3) * 3 + (col // 3));
+        n = self.n
+        row, col, box = self.get_row(row), self.get_column(col), self.get_box((row // n) * n + (col // n));
         return set(row[row != 0]) | set(col[col != 0]) | set(box[box != 0]);
     
     def is_solved(self) -> bool:
@@ -212,16 +262,14 @@ class SudokuBoard:
         Returns:
             bool: True if the board is solved, False otherwise.
         """
-        values = set(range(1, 10));
+        values = set(range(1, self.size + 1));
         
-        for i in range(9):
-            for j in range(9):
-                if self.grid[i][j] == 0:
-                    return (i, j);
-
-                if len(self.get_conflicts(i, j) - values) > 0:
-                    print(self.get_conflicts(i, j) - values);
-                    return False;
+        if (self.grid == 0).any():
+            return False;
+        
+        for i in range(self.size):
+            if set(self.get_row(i)) != values or set(self.get_column(i)) != values or set(self.get_box(i)) != values:
+                return False;
         return True
     
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
-from sudoku.Board import SudokuBoard;
+from .Board import SudokuBoard;
 from copy import deepcopy
+import logging
+
+logger = logging.getLogger(__name__);
 
 class GameState:
     """
@@ -26,11 +29,14 @@ class GameState:
         self.parent = parent
     
     def get_neighbors(self, board: SudokuBoard) -> list[SudokuBoard]:
-        pos : tuple[int, int] = board.get_empty_cells()[0];
-        print(pos);
+        empty : list[tuple[int, int]] = board.get_empty_cells();
+        if not empty:
+            return [];
+        pos : tuple[int, int] = empty[0];
         conflicts : list[int] = board.get_conflicts(pos[0], pos[1]);
-        possible_values : set[int] = set(range(1, 10)) - set(conflicts);
-        print(possible_values);
+        possible_values : set[int] = set(range(1, board.size + 1)) - set(conflicts);
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("expanding %s with candidates %s", pos, possible_values);
         neighbors : list[SudokuBoard] = [];
         for value in possible_values:
             new_board = deepcopy(board);
@@ -51,12 +57,12 @@ class GameState:
         return len(board.get_conflicting_cells());
     
 b_1 : str = "\
-5 3 0 0 7 0 5 0 3\n\
+5 3 0 0 7 0 0 0 0\n\
 6 0 0 1 9 5 0 0 0\n\
 0 9 8 0 0 0 0 6 0\n\
 8 0 0 0 6 0 0 0 3\n\
 4 0 0 8 0 3 0 0 1\n\
 7 0 0 0 2 0 0 0 6\n\
 0 6 0 0 0 0 2 8 0\n\
-5 0 0 4 1 9 0 0 5\n\
+0 0 0 4 1 9 0 0 5\n\
 0 0 0 0 8 0 0 7 9\n";
\ No newline at end of file
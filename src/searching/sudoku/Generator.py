@@ -0,0 +1,216 @@
+"""
+    src/searching/sudoku/Generator.py
+    Generation of unique Sudoku puzzles with difficulty grades.
+
+    Puzzles are made in batches, in three steps:
+        -   full grids: one seed grid is drawn by randomized backtracking from an empty board, then every
+            grid of the batch is a random validity-preserving transform of it (value relabeling, row
+            permutations within bands, band permutations, the same for columns, and transposition);
+        -   clue removal: at each step, every puzzle of the batch tries to remove its next clue, in a random
+            order. The trial puzzles are propagated together (`Propagation.propagate`): a trial solved by
+            propagation has a unique solution. Stalled trials are checked by the batched solution counter
+            `Propagation.count_solutions`, bounded to `max_nodes` nodes each, and kept only if it proves
+            them unique;
+        -   grading: by the propagation rules needed to solve the puzzle, then by the number of branching
+            nodes needed to prove its solution unique.
+    `generate` spreads batches over worker processes.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor;
+
+import numpy as np;
+
+from .Board      import SudokuBoard;
+from .         import Vectorized, Propagation;
+
+DIFFICULTIES : tuple[str, ...] = ("easy", "medium", "hard", "expert");
+"""Grades, from `grade`: solved by naked singles; also needs hidden singles; needs at most
+`HARD_NODES` branching nodes; needs more."""
+
+HARD_NODES : int = 16;
+
+
+def random_grids(count: int, rng: np.random.Generator, n: int = 3) -> np.ndarray:
+    """
+    Returns `count` random full grids of box size `n`, as a (count, cells) array.
+    """
+    g = Vectorized.geometry(n);
+    size = g.size;
+    empty = np.full(g.cells, g.full_mask, dtype=g.mask_dtype);
+    seed = Propagation.search(empty, n, rng=rng)[0][0].reshape(size, size);
+
+    #   Row (and column) orders: bands in random order, rows in random order within each band
+    def orders() -> np.ndarray:
+        bands = rng.permuted(np.tile(np.arange(n), (count, 1)), axis=1);                   # (count, n)
+        within = rng.permuted(np.tile(np.arange(n), (count * n, 1)), axis=1).reshape(count, n, n);
+        return (bands[:, :, None] * n + within).reshape(count, size);
+
+    rows, cols = orders(), orders();
+    grids = seed[rows[:, :, None], cols[:, None, :]];                                       # (count, size, size)
+    transpose = rng.random(count) < 0.5;
+    grids[transpose] = grids[transpose].transpose(0, 2, 1);
+    labels = np.zeros((count, size + 1), dtype=g.dtype);
+    labels[:, 1:] = rng.permuted(np.tile(g.digits, (count, 1)), axis=1);
+    return np.take_along_axis(labels, grids.reshape(count, -1).astype(np.intp), axis=1);
+
+
+def count_solutions(grids: np.ndarray, n: int = 3, limit: int = 2, max_nodes: int | None = None) -> np.ndarray:
+    """
+    Returns the number of solutions of each of `grids`, counting up to `limit`; -1 for the grids whose
+    `max_nodes` ran out first.
+    """
+    return Propagation.count_solutions(Propagation.candidate_masks(grids, n), n, limit, max_nodes)[0];
+
+
+def make_puzzles(solutions: np.ndarray,
+                 rng: np.random.Generator,
+                 n: int = 3,
+                 min_clues: int = 0,
+                 max_nodes: int = 64) -> np.ndarray:
+    """
+    Removes clues from `solutions` while their puzzles keep a unique solution.
+
+    Parameters:
+        solutions (np.ndarray): The (N, cells) full grids.
+        rng (np.random.Generator): The random number generator of the removal orders.
+        n (int): The box size of the grids.
+        min_clues (int): Stop removing clues from a puzzle at this many clues.
+        max_nodes (int): The node budget of the solution counter for puzzles propagation cannot solve.
+            With 0, only removals keeping the puzzle solvable by propagation are made, which gives
+            easy and medium puzzles quickly.
+
+    Returns:
+        np.ndarray: The (N, cells) puzzles, 0 for empty cells.
+    """
+    g = Vectorized.geometry(n);
+    puzzles = Vectorized.encode(solutions, n).copy();
+    count = len(puzzles);
+    order = rng.permuted(np.tile(np.arange(g.cells), (count, 1)), axis=1);
+    clues = np.full(count, g.cells);
+    for step in range(g.cells):
+        trying = np.flatnonzero(clues > min_clues);
+        if len(trying) == 0:
+            break;
+        trials = puzzles[trying];
+        trials[np.arange(len(trying)), order[trying, step]] = 0;
+        masks = Propagation.candidate_masks(trials, n);
+        status = Propagation.propagate(masks, n);
+        unique = status == Propagation.SOLVED;
+        stalled = np.flatnonzero(status == Propagation.STALLED);
+        if max_nodes > 0 and len(stalled):
+            unique[stalled] = Propagation.count_solutions(masks[stalled], n, 2, max_nodes)[0] == 1;
+        accepted = trying[unique];
+        puzzles[accepted] = trials[unique];
+        clues[accepted] -= 1;
+    return puzzles;
+
+
+def grade(puzzles: np.ndarray, n: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Grades unique puzzles by the techniques needed to solve them.
+
+    Parameters:
+        puzzles (np.ndarray): The puzzles, in any shape accepted by `Vectorized.encode`.
+        n (int): The box size of the puzzles.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The (N,) grades (indices into `DIFFICULTIES`) and the (N,)
+        branching node counts (1 for puzzles solved by propagation).
+    """
+    masks = Propagation.candidate_masks(puzzles, n);
+    naked = Propagation.propagate(masks.copy(), n, hidden=False);
+    nodes = Propagation.count_solutions(masks, n, limit=2)[1];
+    grades = np.where(nodes <= 1, 1, np.where(nodes <= HARD_NODES, 2, 3)).astype(np.int8);
+    grades[naked == Propagation.SOLVED] = 0;
+    return grades, nodes;
+
+
+def _generate_batch(job: tuple) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Generates and grades one batch. Module level so it can run in a worker process.
+    """
+    count, n, seed, min_clues, max_nodes = job;
+    rng = np.random.default_rng(seed);
+    solutions = random_grids(count, rng, n);
+    puzzles = make_puzzles(solutions, rng, n, min_clues, max_nodes);
+    return puzzles, solutions, grade(puzzles, n)[0];
+
+
+def generate(count: int,
+             n: int = 3,
+             difficulty: str | None = None,
+             min_clues: int = 0,
+             max_nodes: int = 64,
+             batch: int = 256,
+             max_workers: int = 1,
+             executor: Executor | None = None,
+             seed: int | None = None,
+             max_rounds: int = 100) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """
+    Generates `count` puzzles with a unique solution.
+
+    Parameters:
+        count (int): The number of puzzles.
+        n (int): The box size of the puzzles.
+        difficulty (str | None): Keep only puzzles of this grade (one of `DIFFICULTIES`).
+        min_clues (int): Stop removing clues at this many clues.
+        max_nodes (int): The node budget of the uniqueness checks (see `make_puzzles`).
+        batch (int): The number of puzzles generated together.
+        max_workers (int): The number of processes, when `executor` is `None`.
+        executor (Executor | None): An executor generating the batches, instead of a private process pool.
+        seed (int | None): The seed of the batch generators, for reproducible output.
+        max_rounds (int): Give up after this many rounds of batches when `difficulty` is rare.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, list[str]]: The (count, cells) puzzles, their solutions and their grades.
+
+    Raises:
+        ValueError: If `difficulty` is not one of `DIFFICULTIES`.
+    """
+    if difficulty is not None and difficulty not in DIFFICULTIES:
+        raise ValueError(f"difficulty must be one of {DIFFICULTIES}");
+    seeds = np.random.SeedSequence(seed);
+    own_executor = executor is None and max_workers > 1;
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers);
+    puzzles, solutions, grades = [], [], [];
+    found = 0;
+    try:
+        for _ in range(max_rounds):
+            if found >= count:
+                break;
+            jobs = [(batch, n, s, min_clues, max_nodes)
+                    for s in seeds.spawn(max(1, min(max_workers, -(-(count - found) // batch))))];
+            results = executor.map(_generate_batch, jobs) if executor is not None else map(_generate_batch, jobs);
+            for p, s, g in results:
+                keep = np.ones(len(p), dtype=bool) if difficulty is None else g == DIFFICULTIES.index(difficulty);
+                puzzles.append(p[keep]);
+                solutions.append(s[keep]);
+                grades.extend(DIFFICULTIES[i] for i in g[keep]);
+                found += int(keep.sum());
+    finally:
+        if own_executor:
+            executor.shutdown();
+    cells = Vectorized.geometry(n).cells;
+    return (np.concatenate(puzzles)[:count] if puzzles else np.empty((0, cells), dtype=np.uint8),
+            np.concatenate(solutions)[:count] if solutions else np.empty((0, cells), dtype=np.uint8),
+            grades[:count]);
+
+
+def to_boards(grids: np.ndarray, n: int = 3) -> list[SudokuBoard]:
+    """
+    Returns the `SudokuBoard`s of generated puzzles, with their clues as fixed cells.
+    """
+    size = n * n;
+    return [SudokuBoard(grid.reshape(size, size).copy(), grid.reshape(size, size) != 0) for grid in grids];
+
+
+if __name__ == "__main__":
+    import time;
+
+    start = time.perf_counter();
+    puzzles, solutions, grades = generate(1000, seed=0);
+    elapsed = time.perf_counter() - start;
+    print(f"{len(puzzles)} puzzles in {elapsed:.2f}s ({60 * len(puzzles) / elapsed:.0f} per minute)");
+    print({d: grades.count(d) for d in DIFFICULTIES}, "mean clues", (puzzles != 0).sum(axis=1).mean());
+    print(to_boards(puzzles[:1])[0].to_string());
@@ -0,0 +1,294 @@
+"""
+    src/searching/sudoku/Vectorized.py
+    Vectorized operations over batches of Sudoku grids.
+
+    Grids of box size `n` (`size = n * n` values, `cells = size * size`) are encoded as rows of a
+    (N, cells) array, cells in row-major order, 0 for empty cells. Every function works on a whole batch
+    with a constant number of NumPy calls, so scoring a layer of a search costs about as much as scoring a
+    single board with per-object Python code. The index tables of each box size are built once, by
+    `geometry(n)`, and cached on disk by `TableCache`.
+"""
+
+from functools import lru_cache;
+
+import numpy as np;
+
+from .Board         import box_size, value_dtype;
+from ..TableCache   import cached;
+
+GEOMETRY_VERSION : int = 1;
+"""The version of the cached index tables: bump it when `_tables` changes."""
+
+
+class Geometry:
+    """
+    `Geometry` holds the index tables of the grids of box size `n`.
+
+    Attributes:
+        n (int): The box size.
+        size (int): The number of rows, columns, boxes and values, `n * n`.
+        cells (int): The number of cells, `size * size`.
+        dtype (type): The value dtype of the encoded grids.
+        units (np.ndarray): The (3 * size, size) flat cell indices of the rows, then the columns, then the boxes.
+        row, col, box (np.ndarray): The (cells,) row, column and box of each cell.
+        peers (np.ndarray): The (cells, 3 * size - 2 * n - 1) cells sharing a unit with each cell.
+        digits (np.ndarray): The values 1..size.
+        mask_dtype (type): The dtype of candidate bitmasks, bit `v - 1` standing for value `v`.
+        full_mask (int): The candidate bitmask of all the values.
+    """
+    def __init__(self, n: int):
+        self.n = n;
+        self.size = size = n * n;
+        self.cells = size * size;
+        self.dtype = value_dtype(size);
+        tables = cached(f"sudoku-geometry-{n}", lambda: _tables(n), GEOMETRY_VERSION);
+        self.row, self.col, self.box = tables["row"], tables["col"], tables["box"];
+        self.units, self.peers = tables["units"], tables["peers"];
+        self.digits = np.arange(1, size + 1, dtype=self.dtype);
+        self.mask_dtype = np.uint16 if size <= 16 else np.uint32 if size <= 32 else np.uint64;
+        self.full_mask = (1 << size) - 1;
+
+
+def _tables(n: int) -> dict[str, np.ndarray]:
+    """
+    Builds the index tables of the grids of box size `n` (see `Geometry`).
+    """
+    size = n * n;
+    cells = np.arange(size * size);
+    row, col = cells // size, cells % size;
+    box = (row // n) * n + col // n;
+    units = np.concatenate([
+        np.argsort(row, kind="stable").reshape(size, size),
+        np.argsort(col, kind="stable").reshape(size, size),
+        np.argsort(box, kind="stable").reshape(size, size)]).astype(np.intp);
+    shared = ((row[:, None] == row) | (col[:, None] == col) | (box[:, None] == box));
+    np.fill_diagonal(shared, False);
+    peers = np.nonzero(shared)[1].reshape(len(cells), -1).astype(np.intp);
+    return {"row": row, "col": col, "box": box, "units": units, "peers": peers};
+
+
+@lru_cache(maxsize=None)
+def geometry(n: int = 3) -> Geometry:
+    """
+    Returns the `Geometry` of box size `n`, built on first use.
+    """
+    return Geometry(n);
+
+
+def geometry_of(board: np.ndarray) -> Geometry:
+    """
+    Returns the `Geometry` of a single `size x size` grid or mask.
+    """
+    n = box_size(np.shape(board)[0]);
+    if n is None:
+        raise ValueError(f"{np.shape(board)} is not the shape of a Sudoku grid");
+    return geometry(n);
+
+
+def __getattr__(name: str):
+    """
+    The tables of the 9x9 grids, `UNITS` and `DIGITS`, built on first access rather than on import.
+    """
+    if name == "UNITS":
+        return geometry(3).units;
+    if name == "DIGITS":
+        return geometry(3).digits;
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}");
+
+
+def encode(grids, n: int = 3) -> np.ndarray:
+    """
+    Returns `grids` (one grid, a list of grids, or an array of shape (N, size, size) or (N, cells)) as a
+    (N, cells) array of the value dtype of box size `n`.
+    """
+    g = geometry(n);
+    return np.asarray(grids, dtype=g.dtype).reshape(-1, g.cells);
+
+
+def unit_counts(grids: np.ndarray, units: np.ndarray | None = None, n: int = 3) -> np.ndarray:
+    """
+    Returns the (N, len(units), size) array counting, for each grid and unit, the occurrences of each value.
+    `units` defaults to all the units of box size `n`.
+    """
+    g = geometry(n);
+    units = g.units if units is None else units;
+    values = encode(grids, n)[:, units];                                          # (N, U, size)
+    count, u = values.shape[:2];
+    #   One bincount over all (grid, unit, value) triples; value 0 (empty) is counted, then dropped
+    stride = g.size + 1;
+    bins = values + np.arange(0, count * u * stride, stride, dtype=np.intp).reshape(count, u, 1);
+    return np.bincount(bins.ravel(), minlength=count * u * stride).reshape(count, u, stride)[:, :, 1:];
+
+
+def conflicts(grids: np.ndarray, units: np.ndarray | None = None, n: int = 3) -> np.ndarray:
+    """
+    Returns, for each grid, the number of duplicated values over `units` (all rows, columns and boxes
+    by default): the sum over the units of the filled cells minus the distinct values. A complete grid
+    is solved if and only if its score is 0.
+
+    Parameters:
+        grids (np.ndarray): The grids to score, in any shape accepted by `encode`.
+        units (np.ndarray | None): The units to check, as rows of flat cell indices.
+        n (int): The box size of the grids.
+
+    Returns:
+        np.ndarray: The (N,) int array of scores.
+    """
+    counts = unit_counts(grids, units, n);
+    return np.maximum(counts - 1, 0).sum(axis=(1, 2));
+
+
+def fill_rows(grid: np.ndarray, fixed: np.ndarray, rng: np.random.Generator, count: int = 1) -> np.ndarray:
+    """
+    Returns `count` complete assignments of `grid`: the fixed cells are kept and the missing values of
+    each row are placed in its free cells in random order. Rows are therefore permutations of 1..size.
+
+    Parameters:
+        grid (np.ndarray): The size x size board.
+        fixed (np.ndarray): The size x size mask of fixed cells.
+        rng (np.random.Generator): The random number generator.
+        count (int): The number of assignments.
+
+    Returns:
+        np.ndarray: The (count, cells) assignments.
+    """
+    g = geometry_of(grid);
+    grid, fixed = np.asarray(grid), np.asarray(fixed, dtype=bool);
+    out = np.tile(np.where(fixed, grid, 0).astype(g.dtype).reshape(1, g.cells), (count, 1));
+    for r in range(g.size):
+        free = np.flatnonzero(~fixed[r]);
+        missing = np.setdiff1d(g.digits, grid[r][fixed[r]]);
+        if len(free) == 0:
+            continue;
+        if len(missing) != len(free):
+            raise ValueError(f"Row {r} repeats a fixed value");
+        out[:, r * g.size + free] = rng.permuted(np.tile(missing, (count, 1)), axis=1);
+    return out;
+
+
+def row_swaps(fixed: np.ndarray) -> np.ndarray:
+    """
+    Returns the (S, 2) flat cell indices of every pair of free cells sharing a row.
+    Swapping such a pair keeps rows permutations of 1..size and fixed cells untouched.
+    """
+    g = geometry_of(fixed);
+    fixed = np.asarray(fixed, dtype=bool);
+    pairs = [];
+    for r in range(g.size):
+        free = r * g.size + np.flatnonzero(~fixed[r]);
+        i, j = np.triu_indices(len(free), k=1);
+        pairs.append(np.stack([free[i], free[j]], axis=1));
+    return np.concatenate(pairs).astype(np.intp);
+
+
+def apply_swaps(grids: np.ndarray, swaps: np.ndarray) -> np.ndarray:
+    """
+    Returns the (N * S, cells) array of every grid with every swap applied: row `n * S + s` is grid `n`
+    with the cells of `swaps[s]` exchanged.
+    """
+    grids = np.atleast_2d(grids);
+    count, s = len(grids), len(swaps);
+    out = np.repeat(grids, s, axis=0);
+    rows = np.arange(count * s);
+    a, b = np.tile(swaps[:, 0], count), np.tile(swaps[:, 1], count);
+    out[rows, a], out[rows, b] = out[rows, b], out[rows, a];
+    return out;
+
+
+class RowSwapScorer:
+    """
+    `RowSwapScorer` scores every row swap of a complete assignment at once, by delta evaluation.
+
+    The assignment keeps the value counts of its columns and boxes in a table. The change of `conflicts`
+    caused by a swap only depends on the counts of the (at most four) units it touches, so the deltas of
+    all swaps are two gathers from the table: no successor grid is ever built.
+
+    Attributes:
+        swaps (np.ndarray): The (S, 2) flat cell indices of the swaps, from `row_swaps(fixed)`.
+        grid (np.ndarray): The (cells,) current assignment.
+        counts (np.ndarray): The (2 * size + 1, size + 1) value counts of its columns, then its boxes. The
+            last row is a dummy unit standing for a box shared by both cells of a swap, which the swap
+            leaves unchanged.
+        score (int): Its number of duplicated values in columns and boxes.
+
+    Methods:
+        reset(grid: np.ndarray)
+        deltas() -> np.ndarray
+        apply(move: int) -> int
+    """
+    def __init__(self, fixed: np.ndarray):
+        """
+        Parameters:
+            fixed (np.ndarray): The size x size mask of fixed cells.
+        """
+        g = self.geometry = geometry_of(fixed);
+        size, stride = g.size, g.size + 1;
+        self._dummy = 2 * size;
+        self.swaps = row_swaps(fixed);
+        a, b = self.swaps[:, 0], self.swaps[:, 1];
+        col, box = g.col, g.box;
+        box_a = np.where(box[a] == box[b], self._dummy, size + box[a]);
+        box_b = np.where(box[a] == box[b], self._dummy, size + box[b]);
+        #   Offsets in the flattened count table of the units touched by each swap: the cell `a` side
+        #   loses its value and gains the value of `b` in units `(col[a], box_a)`, and conversely
+        self._units = stride * np.stack([col[a], box_a, col[b], box_b], axis=1);                # (S, 4)
+        self._leaving = np.stack([a, a, b, b], axis=1);                                        # (S, 4)
+        self._entering = np.stack([b, b, a, a], axis=1);
+        self.grid = np.zeros(g.cells, dtype=g.dtype);
+        self.counts = np.zeros((2 * size + 1, stride), dtype=np.int32);
+        self.score = 0;
+        #   `counts >= 2` and `counts >= 1`, flattened: whether a value leaving / entering a unit removes
+        #   / adds a duplicate. The dummy unit stays all zeros.
+        self._dup = np.zeros(self.counts.size, dtype=np.int8);
+        self._occ = np.zeros(self.counts.size, dtype=np.int8);
+        #   Python views for the scalar updates of `apply`, much faster than NumPy scalar indexing
+        self._swap_list = self.swaps.tolist();
+        self._unit_list = self._units.tolist();
+        self._counts = memoryview(self.counts.reshape(-1));
+        self._dup_view = memoryview(self._dup);
+        self._occ_view = memoryview(self._occ);
+        self._grid = memoryview(self.grid);
+
+    def reset(self, grid: np.ndarray) -> None:
+        """
+        Makes `grid` (a complete assignment) the current assignment.
+        """
+        g = self.geometry;
+        self.grid = encode(grid, g.n)[0].copy();
+        self._grid = memoryview(self.grid);
+        self.counts.fill(0);
+        self.counts[:-1, 1:] = unit_counts(self.grid, g.units[g.size:], g.n)[0];
+        self._dup[:] = (self.counts >= 2).ravel();
+        self._occ[:] = (self.counts >= 1).ravel();
+        self.score = int(np.maximum(self.counts - 1, 0).sum());
+
+    def deltas(self) -> np.ndarray:
+        """
+        Returns the (S,) change of `score` caused by each swap.
+        """
+        grid = self.grid;
+        lost = self._dup.take(self._units + grid.take(self._leaving)).sum(axis=1, dtype=np.int16);
+        added = self._occ.take(self._units + grid.take(self._entering)).sum(axis=1, dtype=np.int16);
+        return added - lost;
+
+    def apply(self, move: int) -> int:
+        """
+        Applies swap `move` to the current assignment and returns the change of `score`.
+        """
+        a, b = self._swap_list[move];
+        grid, counts, dup, occ = self._grid, self._counts, self._dup_view, self._occ_view;
+        va, vb = grid[a], grid[b];
+        delta = 0;
+        dummy = self._dummy * (self.geometry.size + 1);
+        for unit, leaving, entering in zip(self._unit_list[move], (va, va, vb, vb), (vb, vb, va, va)):
+            if unit == dummy:
+                continue;
+            i, j = unit + leaving, unit + entering;
+            delta += occ[j] - dup[i];
+            counts[i] -= 1;
+            counts[j] += 1;
+            dup[i], occ[i] = counts[i] >= 2, counts[i] >= 1;
+            dup[j], occ[j] = counts[j] >= 2, counts[j] >= 1;
+        grid[a], grid[b] = vb, va;
+        self.score += delta;
+        return delta;
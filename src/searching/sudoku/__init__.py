@@ -0,0 +1,19 @@
+""" src/searching/sudoku/__init__.py
+The Sudoku problem: `Board` (the board and sample instances), `GameState`, `Vectorized` (batched grid
+kernels), `Propagation` (bit-parallel constraint propagation) and `Generator` (graded puzzles).
+Submodules are imported on first access.
+"""
+
+import  importlib;
+
+_SUBMODULES : frozenset[str] = frozenset({"Board", "GameState", "Vectorized", "Propagation", "Generator"});
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__);
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}");
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES);
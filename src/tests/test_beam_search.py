@@ -0,0 +1,23 @@
+import  numpy as np;
+from    searching                   import BeamSearch, SudokuSearch;
+from    searching.SearchResult      import SearchStatus;
+from    searching.sudoku.Board      import SudokuBoard, b_1;
+
+
+def test_sample_at_tiny_temperature_fills_the_beam_with_the_best():
+    scores = np.array([5.0, 0.0, 9.0, 1.0, 3.0, 0.0, 7.0]);
+    chosen = BeamSearch._sample(scores, 4, 1e-6, np.random.default_rng(0));
+    assert len(chosen) == len(set(chosen.tolist())) == 4;
+    assert sorted(scores[chosen].tolist()) == [0.0, 0.0, 1.0, 3.0];
+
+def test_sample_keeps_distinct_indices():
+    scores = np.random.default_rng(1).random(100);
+    chosen = BeamSearch._sample(scores, 10, 0.5, np.random.default_rng(2));
+    assert len(set(chosen.tolist())) == 10;
+
+def test_stochastic_beam_search_at_tiny_temperature():
+    board = SudokuBoard.from_string(b_1);
+    #   The weights of all but the best states underflow to 0: this used to raise in `rng.choice`
+    result = SudokuSearch.stochastic_beam_search(board, temperature=0.001, rng=np.random.default_rng(0));
+    assert result.status in (SearchStatus.SOLVED, SearchStatus.ITERATION_LIMIT);
+    assert result.cost >= 0;
@@ -0,0 +1,80 @@
+import  time;
+import  pytest;
+from    searching.Budget                import CancellationToken, SearchBudget;
+from    searching.Progress              import ProgressReporter;
+from    searching.PuzzleSearch          import ida_star;
+from    searching.SearchResult          import SearchStatus;
+from    searching.SearchStats           import SearchStats;
+from    searching.puzzle.SlidingPuzzle  import SlidingPuzzle, p8_hard;
+
+
+def test_no_limit_never_stops():
+    budget = SearchBudget();
+    budget.start();
+    assert budget.check(10 ** 9, 1 << 40) is None;
+
+def test_deadline_and_timeout_stop_with_timeout():
+    budget = SearchBudget(deadline=time.monotonic() - 1);
+    budget.start();
+    assert budget.check(0) is SearchStatus.TIMEOUT;
+
+    budget = SearchBudget(timeout=60);
+    budget.start();
+    assert budget.check(0) is None;
+    #   The earliest of the timeout and the deadline wins
+    budget = SearchBudget(timeout=60, deadline=time.monotonic() - 1);
+    budget.start();
+    assert budget.check(0) is SearchStatus.TIMEOUT;
+    budget = SearchBudget(timeout=0, deadline=time.monotonic() + 60);
+    budget.start();
+    assert budget.check(0) is SearchStatus.TIMEOUT;
+
+def test_timeout_counts_from_start():
+    budget = SearchBudget(timeout=0.05);
+    time.sleep(0.1);
+    budget.start();
+    assert budget.check(0) is None;
+
+def test_expansion_limit_stops_with_node_limit():
+    budget = SearchBudget(max_expansions=10);
+    budget.start();
+    assert budget.check(9) is None;
+    assert budget.check(10) is SearchStatus.NODE_LIMIT;
+
+def test_frontier_bytes_limit_stops_with_memory_limit():
+    budget = SearchBudget(max_frontier_bytes=100);
+    budget.start();
+    assert budget.check(10 ** 9, 100) is None;
+    assert budget.check(0, 101) is SearchStatus.MEMORY_LIMIT;
+
+def test_cancellation_stops_with_cancelled_before_the_other_limits():
+    token = CancellationToken();
+    budget = SearchBudget(deadline=time.monotonic() - 1, max_expansions=0, max_frontier_bytes=0, token=token);
+    budget.start();
+    assert budget.check(1, 1) is SearchStatus.TIMEOUT;
+    token.cancel();
+    assert token.cancelled and budget.check(1, 1) is SearchStatus.CANCELLED;
+
+def test_check_every_must_be_positive():
+    with pytest.raises(ValueError):
+        SearchBudget(check_every=0);
+
+def test_a_search_stops_early_on_a_cancelled_token():
+    puzzle = SlidingPuzzle.from_string(p8_hard);
+    token = CancellationToken();
+    seen = [];
+
+    #   The caller cancels from the progress callback, after the first report
+    def cancel(info):
+        seen.append(info["iteration"]);
+        token.cancel();
+
+    stats = SearchStats("ida_star");
+    result = ida_star(puzzle, stats=stats, progress=ProgressReporter(cancel, interval=0, every=100),
+                      budget=SearchBudget(token=token, check_every=1));
+    assert result.status is SearchStatus.CANCELLED;
+    assert seen == [100];
+    full = SearchStats("ida_star");
+    ida_star(puzzle, stats=full);
+    #   The search stops at the budget check following the report: one node later
+    assert stats.expanded_nodes == 101 < full.expanded_nodes;
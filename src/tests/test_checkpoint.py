@@ -0,0 +1,88 @@
+import  os;
+import  random;
+import  pytest;
+from    searching.Budget                import SearchBudget;
+from    searching.Checkpoint            import Checkpointer;
+from    searching.ExternalBFS           import external_bfs;
+from    searching.PuzzleSearch          import ida_star;
+from    searching.SearchResult          import SearchStatus;
+from    searching.SearchStats           import SearchStats;
+from    searching.SudokuSearch          import random_walk;
+from    searching.TranspositionTable    import TranspositionTable;
+from    searching.puzzle.SlidingPuzzle  import SlidingPuzzle, p8_hard;
+from    searching.sudoku.Board          import SudokuBoard, b_1;
+
+
+def test_resumed_random_walk_reproduces_the_uninterrupted_walk(tmp_path):
+    board = SudokuBoard.from_string(b_1);
+    expected = random_walk(board, niter=400, rng=random.Random(7));
+
+    checkpointer = Checkpointer(str(tmp_path / "walk.npz"), every=50);
+    stopped = random_walk(board, niter=400, rng=random.Random(7), checkpointer=checkpointer,
+                          budget=SearchBudget(max_expansions=170, check_every=1));
+    assert stopped.status is SearchStatus.NODE_LIMIT;
+    assert stopped.iterations < expected.iterations;
+
+    #   A fresh generator: its state is restored from the checkpoint
+    resumed = random_walk(board, niter=400, rng=random.Random(0), checkpointer=checkpointer);
+    assert resumed.status is expected.status;
+    assert resumed.iterations == expected.iterations;
+    assert resumed.state.moves == expected.state.moves;
+    assert (resumed.state.board.grid == expected.state.board.grid).all();
+
+@pytest.mark.parametrize("capacity", [None, 1 << 10])
+def test_ida_star_resumed_mid_iteration_matches_the_uninterrupted_search(tmp_path, capacity):
+    puzzle = SlidingPuzzle.from_string(p8_hard);
+    table = lambda: TranspositionTable(capacity) if capacity else None;
+    expected_stats = SearchStats("ida_star");
+    expected = ida_star(puzzle, stats=expected_stats, table=table());
+
+    #   Stopped three times, each run resuming from the checkpoint of the previous one
+    checkpointer = Checkpointer(str(tmp_path / "ida.npz"), every=1000);
+    for limit in (1500, 5000, 9000):
+        stopped = ida_star(puzzle, budget=SearchBudget(max_expansions=limit, check_every=1), table=table(),
+                           checkpointer=checkpointer, stats=SearchStats("ida_star"));
+        assert stopped.status is SearchStatus.NODE_LIMIT;
+    stats = SearchStats("ida_star");
+    resumed = ida_star(puzzle, table=table(), checkpointer=checkpointer, stats=stats);
+    assert resumed.status is SearchStatus.SOLVED;
+    assert resumed.path == expected.path and resumed.cost == expected.cost == 31;
+    assert resumed.iterations == expected.iterations;
+    assert stats.expanded_nodes == expected_stats.expanded_nodes;
+    assert stats.counters == expected_stats.counters;
+
+def test_ida_star_checkpoint_needs_its_table(tmp_path):
+    puzzle = SlidingPuzzle.from_string(p8_hard);
+    checkpointer = Checkpointer(str(tmp_path / "ida.npz"), every=1000);
+    ida_star(puzzle, budget=SearchBudget(max_expansions=2500), table=TranspositionTable(1 << 10),
+             checkpointer=checkpointer);
+    with pytest.raises(ValueError):
+        ida_star(puzzle, checkpointer=checkpointer);
+    with pytest.raises(ValueError):
+        ida_star(puzzle, table=TranspositionTable(1 << 12), checkpointer=checkpointer);
+
+def test_external_bfs_resumes_from_its_last_complete_layer(tmp_path):
+    puzzle = SlidingPuzzle.from_string(p8_hard);
+    expected_stats = SearchStats("external_bfs");
+    expected_widths = [];
+    expected = external_bfs(puzzle.key(puzzle.goal), puzzle.expand_keys, block_size=1 << 10, stats=expected_stats,
+                            on_layer=lambda d, keys: expected_widths.append(len(keys)));
+
+    directory = str(tmp_path / "layers");
+    checkpointer = Checkpointer(str(tmp_path / "bfs.npz"));
+    widths = [];
+    for limit in (3000, 40000):
+        stopped = external_bfs(puzzle.key(puzzle.goal), puzzle.expand_keys, block_size=1 << 10, directory=directory,
+                               budget=SearchBudget(max_expansions=limit), checkpointer=checkpointer,
+                               stats=SearchStats("external_bfs"), on_layer=lambda d, keys: widths.append(len(keys)));
+        assert stopped.status is SearchStatus.NODE_LIMIT;
+    #   A crashed run may leave the runs of the interrupted layer behind
+    open(os.path.join(directory, "run-9999-0000.u64"), "wb").close();
+
+    stats = SearchStats("external_bfs");
+    resumed = external_bfs(puzzle.key(puzzle.goal), puzzle.expand_keys, block_size=1 << 10, directory=directory,
+                           checkpointer=checkpointer, stats=stats, on_layer=lambda d, keys: widths.append(len(keys)));
+    assert resumed.status is SearchStatus.EXHAUSTED and resumed.cost == expected.cost == 31;
+    assert widths == expected_widths and sum(widths) == 181440;
+    assert stats.expanded_nodes == expected_stats.expanded_nodes == 181440;
+    assert not [f for f in os.listdir(directory) if f.startswith("run-")];
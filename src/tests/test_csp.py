@@ -0,0 +1,125 @@
+import  random;
+import  numpy as np;
+import  pytest;
+from    model.ConcreteDataTypes     import Kn;
+from    model.GraphGenerators       import to_graph;
+from    searching.Budget            import CancellationToken, SearchBudget;
+from    searching.CSP               import CSP, ColoringCSP, SudokuCSP, backtracking_search, min_conflicts;
+from    searching.SearchResult      import SearchStatus;
+from    searching.SearchStats       import SearchStats;
+from    searching.sudoku.Board      import SudokuBoard, b_1;
+
+
+def petersen():
+    return to_graph(10, np.array([(i, (i + 1) % 5) for i in range(5)] + [(i, i + 5) for i in range(5)]
+                                 + [(5 + i, 5 + (i + 2) % 5) for i in range(5)]));
+
+def proper(graph, coloring: dict) -> bool:
+    return all(coloring[u] != coloring[v] for u, neighbors in graph.adjacencyList().items() for v in neighbors);
+
+def less_than(size: int) -> CSP:
+    """
+    x0 < x1 < ... over the values 0..size-1, one variable per value.
+    """
+    csp = CSP(size, list(range(size)));
+    for x in range(size - 1):
+        csp.add_constraint(x, x + 1, lambda a, b: a < b);
+    return csp;
+
+
+def test_revise_prunes_unsupported_values():
+    csp = less_than(3);
+    domains = list(csp.domains);
+    assert csp.revise(domains, 0, 1) and domains[0] == 0b011;
+    assert not csp.revise(domains, 0, 1);
+    assert csp.revise(domains, 1, 0) and domains[1] == 0b110;
+
+    #   A difference only prunes against a fixed value
+    coloring = ColoringCSP(Kn(2), 3);
+    domains = list(coloring.domains);
+    assert not coloring.revise(domains, 0, 1);
+    domains[1] = 0b010;
+    assert coloring.revise(domains, 0, 1) and domains[0] == 0b101;
+
+def test_ac3_fixes_a_chain_and_detects_a_wipeout():
+    csp = less_than(4);
+    domains = list(csp.domains);
+    assert csp.ac3(domains);
+    assert domains == [1 << x for x in range(4)];
+    assert csp.is_consistent(domains);
+
+    #   Four pairwise different variables over three values are arc consistent until two are fixed
+    coloring = ColoringCSP(Kn(4), 3);
+    domains = list(coloring.domains);
+    assert coloring.ac3(domains) and domains == [0b111] * 4;
+    domains[0], domains[1] = 0b001, 0b010;
+    assert not coloring.ac3(domains, [(y, x) for x in (0, 1) for y in coloring.neighbors[x]]);
+
+def test_forward_check_chains_through_fixed_neighbors():
+    csp = ColoringCSP(Kn(3), 3);
+    domains = list(csp.domains);
+    domains[0] = 0b001;
+    assert csp.forward_check(domains, 0) and domains == [0b001, 0b110, 0b110];
+    domains[1] = 0b010;
+    assert csp.forward_check(domains, 1) and domains == [0b001, 0b010, 0b100];
+
+    triangle = CSP(3, [0, 1]);
+    triangle.add_different(0, 1);
+    triangle.add_different(1, 2);
+    triangle.add_different(0, 2);
+    domains = list(triangle.domains);
+    domains[0] = 0b01;
+    assert not triangle.forward_check(domains, 0);
+
+@pytest.mark.parametrize("inference", ["mac", "forward"])
+@pytest.mark.parametrize("lcv", [True, False])
+def test_backtracking_search_colors_graphs(inference, lcv):
+    graph = petersen();
+    result = backtracking_search(ColoringCSP(graph, 3), inference=inference, lcv=lcv);
+    assert result.status is SearchStatus.SOLVED and proper(graph, result.state);
+    assert set(result.state.values()) <= {0, 1, 2};
+    assert backtracking_search(ColoringCSP(graph, 2), inference=inference, lcv=lcv).status is SearchStatus.EXHAUSTED;
+    assert backtracking_search(ColoringCSP(Kn(4), 3), inference=inference, lcv=lcv).status is SearchStatus.EXHAUSTED;
+    result = backtracking_search(ColoringCSP(Kn(4), 4), inference=inference, lcv=lcv);
+    assert result.status is SearchStatus.SOLVED and sorted(result.state.values()) == [0, 1, 2, 3];
+
+def test_backtracking_search_rejects_unknown_inference():
+    with pytest.raises(ValueError):
+        backtracking_search(ColoringCSP(Kn(3), 3), inference="path");
+
+@pytest.mark.parametrize("inference", ["mac", "forward"])
+def test_sudoku_csp_solves_b_1(inference):
+    board = SudokuBoard.from_string(b_1);
+    stats = SearchStats("backtracking_search");
+    result = backtracking_search(SudokuCSP(board), inference=inference, stats=stats);
+    assert result.status is SearchStatus.SOLVED and result.state.is_solved();
+    assert (result.state.grid[board.fixed] == board.grid[board.fixed]).all();
+    assert stats.expanded_nodes == result.iterations - 1;
+
+def test_min_conflicts_colors_a_satisfiable_graph():
+    graph = petersen();
+    result = min_conflicts(ColoringCSP(graph, 3), max_steps=1000, rng=random.Random(0));
+    assert result.status is SearchStatus.SOLVED and result.cost == 0 and proper(graph, result.state);
+
+    result = min_conflicts(ColoringCSP(Kn(4), 3), max_steps=200, rng=random.Random(0));
+    assert result.status is SearchStatus.ITERATION_LIMIT and result.iterations == 200 and result.cost == 1;
+
+@pytest.mark.parametrize("budget, status", [
+    (lambda: SearchBudget(max_expansions=3, check_every=1), SearchStatus.NODE_LIMIT),
+    (lambda: SearchBudget(timeout=0, check_every=1), SearchStatus.TIMEOUT),
+    (lambda: SearchBudget(max_frontier_bytes=1, check_every=1), SearchStatus.MEMORY_LIMIT),
+])
+def test_budgets_stop_backtracking_search(budget, status):
+    board = SudokuBoard.from_string(b_1);
+    #   Without propagation beyond forward checking the search has to branch
+    board.grid.ravel()[:40] = 0;
+    board.fixed.ravel()[:40] = False;
+    result = backtracking_search(SudokuCSP(board), inference="forward", budget=budget());
+    assert result.status is status;
+    assert (result.state.grid[board.fixed] == board.grid[board.fixed]).all();
+
+def test_cancellation_stops_min_conflicts():
+    token = CancellationToken();
+    token.cancel();
+    result = min_conflicts(ColoringCSP(Kn(5), 4), rng=random.Random(0), budget=SearchBudget(token=token, check_every=1));
+    assert result.status is SearchStatus.CANCELLED and result.iterations == 0 and result.cost > 0;
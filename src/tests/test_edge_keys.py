@@ -0,0 +1,45 @@
+import  numpy as np;
+import  pytest;
+from    model.EdgeKeys  import MAX_ID, edge_contains, edge_difference, edge_intersection, edge_set, edge_union, pack_edges, unpack_edges;
+
+
+def as_set(edges: np.ndarray) -> set[tuple[int, int]]:
+    return {(min(u, v), max(u, v)) for u, v in np.asarray(edges).reshape(-1, 2).tolist()};
+
+def keys_as_set(keys: np.ndarray) -> set[tuple[int, int]]:
+    return {tuple(row) for row in unpack_edges(keys).tolist()};
+
+@pytest.fixture
+def edge_arrays() -> list[np.ndarray]:
+    rng = np.random.default_rng(0);
+    return [rng.integers(0, n, size=(m, 2)) for n, m in [(1, 0), (5, 30), (40, 300), (1000, 2000), (40, 300)]];
+
+
+def test_pack_round_trip_and_orientation():
+    edges = np.array([[0, 0], [3, 1], [1, 3], [MAX_ID, 0], [MAX_ID, MAX_ID - 1]]);
+    keys = pack_edges(edges);
+    assert keys[1] == keys[2];
+    assert unpack_edges(keys).tolist() == [[0, 0], [1, 3], [1, 3], [0, MAX_ID], [MAX_ID - 1, MAX_ID]];
+    assert (keys >= 0).all();
+
+@pytest.mark.parametrize("edges", [[[-1, 0]], [[0, MAX_ID + 1]]])
+def test_out_of_range_ids_are_rejected(edges):
+    with pytest.raises(ValueError):
+        pack_edges(np.array(edges));
+
+def test_edge_set_is_sorted_and_distinct(edge_arrays):
+    for edges in edge_arrays:
+        keys = edge_set(edges);
+        assert (np.diff(keys) > 0).all();
+        assert keys_as_set(keys) == as_set(edges);
+
+def test_set_operations_match_python_sets(edge_arrays):
+    sets = [as_set(edges) for edges in edge_arrays];
+    for a, sa in zip(edge_arrays, sets):
+        for b, sb in zip(edge_arrays, sets):
+            ka, kb = edge_set(a), edge_set(b);
+            assert keys_as_set(edge_union(ka, kb)) == sa | sb;
+            assert keys_as_set(edge_intersection(ka, kb)) == sa & sb;
+            assert keys_as_set(edge_difference(ka, kb)) == sa - sb;
+            assert edge_contains(ka, b).tolist() == [(min(u, v), max(u, v)) in sa for u, v in b.tolist()];
+    assert len(edge_union()) == 0;
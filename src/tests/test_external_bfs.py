@@ -0,0 +1,83 @@
+import  os;
+import  pytest;
+import  numpy as np;
+from    searching.ExternalBFS           import external_bfs;
+from    searching.SearchResult          import SearchStatus;
+from    searching.puzzle.SlidingPuzzle  import SlidingPuzzle, p8_1;
+
+
+def plain_layers(puzzle: SlidingPuzzle, start: int, max_depth: int | None = None) -> list[set[int]]:
+    """
+    The keys of the BFS layers from `start`, by depth.
+    """
+    seen = {puzzle.key(start)};
+    layers, frontier = [{puzzle.key(start)}], [start];
+    while frontier and (max_depth is None or len(layers) <= max_depth):
+        successors = [];
+        for state in frontier:
+            for successor, _ in puzzle.successors(state):
+                if puzzle.key(successor) not in seen:
+                    seen.add(puzzle.key(successor));
+                    successors.append(successor);
+        if successors:
+            layers.append({puzzle.key(s) for s in successors});
+        frontier = successors;
+    return layers;
+
+def external_layers(puzzle: SlidingPuzzle, start: int, **kwargs) -> tuple[list[set[int]], object]:
+    layers = [];
+    def collect(depth: int, keys: np.ndarray) -> None:
+        assert depth == len(layers) and (keys[1:] > keys[:-1]).all();
+        layers.append(set(keys.tolist()));
+    return layers, external_bfs(puzzle.key(start), puzzle.expand_keys, on_layer=collect, **kwargs);
+
+
+def test_8_puzzle_layers_match_plain_bfs():
+    puzzle = SlidingPuzzle.from_string(p8_1);
+    expected = plain_layers(puzzle, puzzle.goal);
+    #   Small runs and blocks, so every layer is merged from many runs
+    layers, result = external_layers(puzzle, puzzle.goal, run_size=1 << 12, block_size=1 << 10);
+    assert layers == expected;
+    assert result.status is SearchStatus.EXHAUSTED and result.cost == len(expected) - 1 == 31;
+
+def test_15_puzzle_layers_match_plain_bfs_to_a_depth():
+    puzzle = SlidingPuzzle(list(range(1, 16)) + [0]);
+    layers, result = external_layers(puzzle, puzzle.goal, max_depth=10, run_size=1 << 10, block_size=1 << 8);
+    assert layers == plain_layers(puzzle, puzzle.goal, max_depth=10);
+    assert result.cost == 10;
+
+def test_goal_depth_and_kept_layers(tmp_path):
+    puzzle = SlidingPuzzle.from_string(p8_1);
+    result = external_bfs(puzzle.key(puzzle.start), puzzle.expand_keys, goal=puzzle.key(puzzle.goal),
+                          directory=str(tmp_path), keep_layers=True);
+    assert result.status is SearchStatus.SOLVED;
+    depth = next(d for d, layer in enumerate(plain_layers(puzzle, puzzle.start)) if puzzle.key(puzzle.goal) in layer);
+    assert result.cost == depth == 17;
+    assert len([f for f in os.listdir(tmp_path) if f.startswith("layer-")]) == result.cost + 1;
+
+def king_moves(keys: np.ndarray, n: int = 20) -> np.ndarray:
+    """
+    The successors of the squares `keys` of an `n x n` board by king moves: unlike the sliding puzzles,
+    the graph is not bipartite, so successors also fall in their own layer.
+    """
+    row, col = np.divmod(keys.astype(np.int64), n);
+    children = [];
+    for dr, dc in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)):
+        r, c = row + dr, col + dc;
+        valid = (r >= 0) & (r < n) & (c >= 0) & (c < n);
+        children.append((r[valid] * n + c[valid]).astype(np.uint64));
+    return np.concatenate(children);
+
+@pytest.mark.parametrize("block_size", [1, 3, 8, 64])
+def test_non_bipartite_layers_match_plain_bfs(block_size):
+    expected, seen, frontier = [], {0}, [0];
+    while frontier:
+        expected.append(set(frontier));
+        frontier = sorted({int(k) for k in king_moves(np.array(frontier, dtype=np.uint64))} - seen);
+        seen.update(frontier);
+
+    layers = [];
+    result = external_bfs(0, king_moves, run_size=8, block_size=block_size,
+                          on_layer=lambda depth, keys: layers.append(set(keys.tolist())));
+    assert layers == expected;
+    assert result.status is SearchStatus.EXHAUSTED and result.cost == 19;
@@ -0,0 +1,105 @@
+import  itertools;
+import  numpy as np;
+import  pytest;
+from    searching.sudoku            import Generator, Propagation;
+from    searching.sudoku.Board      import SudokuBoard, b_1;
+
+#   Arto Inkala's "hardest Sudoku"
+hardest : str = "800000000003600000070090200050007000000045700000100030001000068008500010090000400";
+
+
+def band_orders(n: int) -> np.ndarray:
+    """
+    Every row order permuting the bands and the rows within each band, as a (n!^(n+1), n*n) array.
+    """
+    perms = list(itertools.permutations(range(n)));
+    return np.array([[band * n + row for band in bands for row in rows[band]]
+                     for bands in perms for rows in itertools.product(perms, repeat=n)]);
+
+def is_transform(grid: np.ndarray, seed: np.ndarray, orders: np.ndarray) -> bool:
+    """
+    Whether `grid` is `seed` under a relabeling, band-preserving row and column orders and maybe a transposition.
+    """
+    for target in (grid, grid.T):
+        columns = seed[:, orders];                                          # (rows, orders, cols)
+        #   The first row of the target fixes the relabeling of each (seed row, column order) pair
+        labels = np.zeros(columns.shape[:2] + (seed.shape[0] + 1,), dtype=seed.dtype);
+        np.put_along_axis(labels, columns.astype(np.intp), np.broadcast_to(target[0], columns.shape), axis=2);
+        relabeled = np.take_along_axis(labels[:, :, None, :], seed[:, orders].transpose(1, 0, 2)[None].astype(np.intp),
+                                       axis=3);                             # (rows, orders, seed rows, cols)
+        #   The target rows must be the relabeled seed rows in a band-preserving order
+        matches = (relabeled[:, :, None, :, :] == target[None, None, :, None, :]).all(axis=4);
+        found = matches.any(axis=3).all(axis=2);
+        for r, o in zip(*np.nonzero(found)):
+            if (orders == matches[r, o].argmax(axis=1)).all(axis=1).any():
+                return True;
+    return False;
+
+def consistent(puzzles: np.ndarray, solutions: np.ndarray) -> bool:
+    return bool(((puzzles == 0) | (puzzles == solutions)).all());
+
+
+def test_random_grids_transform_one_seed_grid(monkeypatch):
+    seeds = [];
+    original = Propagation.search;
+
+    def search(*args, **kwargs):
+        found = original(*args, **kwargs);
+        seeds.append(found[0][0].reshape(9, 9));
+        return found;
+
+    monkeypatch.setattr(Propagation, "search", search);
+    grids = Generator.random_grids(6, np.random.default_rng(0));
+    assert len(seeds) == 1;
+    masks = Propagation.candidate_masks(grids, 3);
+    assert (Propagation.propagate(masks, 3) == Propagation.SOLVED).all();
+    orders = band_orders(3);
+    assert all(is_transform(grid.reshape(9, 9), seeds[0], orders) for grid in grids);
+    #   The grids of another seed grid are not
+    other = Generator.random_grids(1, np.random.default_rng(1));
+    assert not is_transform(other[0].reshape(9, 9), seeds[0], orders);
+
+def test_generated_puzzles_have_one_solution_matching_their_grid():
+    puzzles, solutions, grades = Generator.generate(12, batch=12, seed=1);
+    assert len(puzzles) == len(solutions) == len(grades) == 12;
+    assert consistent(puzzles, solutions);
+    masks = Propagation.candidate_masks(puzzles, 3);
+    assert (Propagation.count_solutions(masks, 3, limit=2)[0] == 1).all();
+    assert all(Propagation.search(m, 3)[0][0].tolist() == s.tolist() for m, s in zip(masks, solutions));
+
+def test_generation_is_reproducible():
+    first = Generator.generate(4, batch=4, seed=2);
+    second = Generator.generate(4, batch=4, seed=2);
+    assert (first[0] == second[0]).all() and (first[1] == second[1]).all() and first[2] == second[2];
+
+@pytest.mark.parametrize("difficulty, min_clues, max_nodes", [("easy", 30, 0), ("medium", 0, 0), ("hard", 0, 64)])
+def test_puzzles_fit_the_requested_difficulty(difficulty, min_clues, max_nodes):
+    puzzles, solutions, grades = Generator.generate(6, difficulty=difficulty, min_clues=min_clues,
+                                                    max_nodes=max_nodes, batch=32, seed=3);
+    assert len(puzzles) == 6 and grades == [difficulty] * 6;
+    assert consistent(puzzles, solutions);
+    clues = (puzzles != 0).sum(axis=1);
+    assert (clues >= min_clues).all() and (clues < 81).all();
+    assert (Generator.grade(puzzles)[0] == Generator.DIFFICULTIES.index(difficulty)).all();
+
+def test_propagation_only_removals_stay_easy_or_medium():
+    grades = Generator.grade(Generator.generate(16, max_nodes=0, batch=16, seed=4)[0])[0];
+    assert (grades <= Generator.DIFFICULTIES.index("medium")).all();
+
+def test_unknown_difficulty_is_rejected():
+    with pytest.raises(ValueError):
+        Generator.generate(1, difficulty="fiendish");
+
+def test_grade_orders_an_easy_and_a_hard_puzzle():
+    easy = SudokuBoard.from_string(b_1).grid.ravel();
+    hard = np.array([int(c) for c in hardest], dtype=np.uint8);
+    grades, nodes = Generator.grade(np.stack([easy, hard]));
+    assert grades.tolist() == [Generator.DIFFICULTIES.index("easy"), Generator.DIFFICULTIES.index("expert")];
+    assert nodes[0] == 1 < Generator.HARD_NODES < nodes[1];
+
+def test_to_boards_round_trips():
+    puzzles, solutions, _ = Generator.generate(3, batch=3, seed=5);
+    for puzzle, board in zip(puzzles, Generator.to_boards(puzzles)):
+        assert (board.grid.ravel() == puzzle).all() and (board.fixed.ravel() == (puzzle != 0)).all();
+        assert (SudokuBoard.from_string(board.to_string()).grid.ravel() == puzzle).all();
+    assert all(board.is_solved() for board in Generator.to_boards(solutions));
@@ -0,0 +1,103 @@
+import  numpy as np;
+import  pytest;
+from    concurrent.futures          import ThreadPoolExecutor;
+from    searching.GeneticSearch     import _evolve, _fitness, _migrate, genetic_algorithm;
+from    searching.SearchResult      import SearchStatus;
+from    searching.SearchStats       import SearchStats;
+from    searching.sudoku            import Vectorized;
+from    searching.sudoku.Board      import SudokuBoard, b_1, solved_board;
+
+
+def cleared(count: int, seed: int) -> SudokuBoard:
+    grid = SudokuBoard.from_string(solved_board).grid.copy();
+    grid.ravel()[np.random.default_rng(seed).choice(81, count, replace=False)] = 0;
+    return SudokuBoard(grid, grid != 0);
+
+def direct_conflicts(individual: np.ndarray) -> int:
+    """
+    The duplicated values in the columns and boxes of a complete 9x9 assignment, counted one unit at a time.
+    """
+    grid = individual.reshape(9, 9);
+    units = [grid[:, c] for c in range(9)] + [grid[r:r + 3, c:c + 3].ravel() for r in (0, 3, 6) for c in (0, 3, 6)];
+    return sum(9 - len(set(unit.tolist())) for unit in units);
+
+def assert_valid(population: np.ndarray, board: SudokuBoard) -> None:
+    """
+    Every row of every individual is a permutation of 1..9, and the givens are kept.
+    """
+    grids = population.reshape(len(population), 9, 9);
+    assert (np.sort(grids, axis=2) == np.arange(1, 10)).all();
+    assert (grids[:, board.fixed] == board.grid[board.fixed]).all();
+
+def params(board: SudokuBoard, elite: int, crossover_rate: float = 1.0, mutation_rate: float = 1.0) -> dict:
+    return {"grid": board.grid, "fixed": board.fixed, "elite": elite, "tournament": 3,
+            "crossover_rate": crossover_rate, "mutation_rate": mutation_rate};
+
+
+def test_fitness_counts_the_conflicts_of_columns_and_boxes():
+    board = SudokuBoard.from_string(b_1);
+    population = Vectorized.fill_rows(board.grid, board.fixed, np.random.default_rng(0), 50);
+    assert _fitness(population, 3).tolist() == [direct_conflicts(p) for p in population];
+    assert _fitness(SudokuBoard.from_string(solved_board).grid.reshape(1, -1), 3).tolist() == [0];
+
+@pytest.mark.parametrize("elite", [0, 1, 8])
+def test_crossover_and_mutation_keep_rows_and_givens(elite):
+    board = SudokuBoard.from_string(b_1);
+    rng = np.random.default_rng(elite);
+    population = Vectorized.fill_rows(board.grid, board.fixed, rng, 64);
+    fitness = _fitness(population, 3);
+    best = fitness.min();
+    for _ in range(20):
+        population, fitness, rng, done = _evolve((params(board, elite), population, fitness, rng, 1));
+        assert done == 1 and len(population) == 64;
+        assert_valid(population, board);
+        assert (fitness == _fitness(population, 3)).all();
+        #   The elite carry the best individual over
+        if elite:
+            assert fitness.min() <= best;
+        best = fitness.min();
+
+def test_elite_zero_runs_without_elitism():
+    board = cleared(30, seed=1);
+    result = genetic_algorithm(board, population=64, generations=50, elite=0, rng=np.random.default_rng(1));
+    assert_valid(result.state.board.grid.reshape(1, -1), board);
+    assert result.cost == direct_conflicts(result.state.board.grid.ravel());
+
+def test_migration_replaces_the_worst_of_the_next_island():
+    rng = np.random.default_rng(2);
+    board = SudokuBoard.from_string(b_1);
+    pops = [Vectorized.fill_rows(board.grid, board.fixed, rng, 16) for _ in range(3)];
+    fits = [_fitness(p, 3) for p in pops];
+    before = [(p.copy(), f.copy()) for p, f in zip(pops, fits)];
+    _migrate(pops, fits, 2);
+    for target in range(3):
+        source_pop, source_fit = before[target - 1];
+        best = np.sort(source_fit)[:2];
+        worst = np.argsort(before[target][1], kind="stable")[-2:];
+        assert sorted(fits[target][worst].tolist()) == sorted(best.tolist());
+        assert all(any((ind == s).all() for s in source_pop) for ind in pops[target][worst]);
+        assert (fits[target] == _fitness(pops[target], 3)).all();
+
+@pytest.mark.parametrize("islands", [1, 3])
+def test_islands_in_process_match_a_thread_pool(islands):
+    board = SudokuBoard.from_string(b_1);
+    kwargs = dict(population=32, generations=40, islands=islands, migration_every=10, migrants=2);
+    stats = SearchStats("genetic_algorithm");
+    sequential = genetic_algorithm(board, rng=np.random.default_rng(3), stats=stats, **kwargs);
+    with ThreadPoolExecutor(max_workers=islands) as executor:
+        threaded = genetic_algorithm(board, rng=np.random.default_rng(3), executor=executor, **kwargs);
+    assert (sequential.state.board.grid == threaded.state.board.grid).all();
+    assert sequential.cost == threaded.cost and sequential.iterations == threaded.iterations == 40;
+    assert stats.counters.get("migrations", 0) == (4 if islands > 1 else 0);
+    assert stats.expanded_nodes == 40 * 32 * islands;
+
+def test_result_status_and_cost():
+    solved = genetic_algorithm(cleared(10, seed=4), population=64, rng=np.random.default_rng(4));
+    assert solved.status is SearchStatus.SOLVED and solved.cost == 0;
+    assert solved.state.board.is_solved();
+
+    board = SudokuBoard.from_string(b_1);
+    stopped = genetic_algorithm(board, population=32, generations=15, rng=np.random.default_rng(4));
+    assert stopped.status is SearchStatus.ITERATION_LIMIT and stopped.iterations == 15;
+    assert stopped.cost == direct_conflicts(stopped.state.board.grid.ravel()) > 0;
+    assert_valid(stopped.state.board.grid.reshape(1, -1), board);
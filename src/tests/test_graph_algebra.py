@@ -0,0 +1,63 @@
+import  numpy as np;
+import  pytest;
+from    model.GraphAlgebra                  import difference, disjoint_union, from_arrays, intersection, to_arrays, union;
+from    model.primitives.datatypes.TGraph   import TGraph, TNode;
+
+
+def random_graph(rng: np.random.Generator, values: int, count: int, edges: int) -> TGraph:
+    """
+    A graph of `count` nodes with values drawn from `0..values-1`, and `edges` random edges between them,
+    repeated edges and self-loops included.
+    """
+    nodes = [TNode(int(v), i) for i, v in enumerate(rng.choice(values, size=count, replace=False))];
+    pairs = rng.integers(0, count, size=(edges, 2));
+    return TGraph(nodes, [(nodes[u], nodes[v]) for u, v in pairs.tolist()]);
+
+def node_values(graph: TGraph) -> set:
+    return {node.value for node in graph.nodes};
+
+def edge_values(graph: TGraph) -> set[frozenset]:
+    return {frozenset((u.value, v.value)) for u, v in graph.edges};
+
+@pytest.fixture
+def pairs() -> list[tuple[TGraph, TGraph]]:
+    rng = np.random.default_rng(0);
+    return [(random_graph(rng, 30, 20, 40), random_graph(rng, 30, 20, 40)) for _ in range(20)];
+
+
+def test_arrays_round_trip(pairs):
+    for G, _ in pairs:
+        nodes, edges = to_arrays(G);
+        H = from_arrays(nodes, edges);
+        assert node_values(H) == node_values(G) and edge_values(H) == edge_values(G);
+
+def test_union_matches_sets(pairs):
+    for G, H in pairs:
+        result = union(G, H);
+        assert node_values(result) == node_values(G) | node_values(H);
+        assert edge_values(result) == edge_values(G) | edge_values(H);
+        assert len(result.edges) == len(edge_values(result));
+
+def test_intersection_matches_sets(pairs):
+    for G, H in pairs:
+        result = intersection(G, H);
+        assert node_values(result) == node_values(G) & node_values(H);
+        assert edge_values(result) == edge_values(G) & edge_values(H);
+
+def test_difference_matches_sets(pairs):
+    for G, H in pairs:
+        result = difference(G, H);
+        assert node_values(result) == node_values(G);
+        assert edge_values(result) == edge_values(G) - edge_values(H);
+
+def test_disjoint_union_keeps_graphs_apart(pairs):
+    for G, H in pairs:
+        result = disjoint_union(G, H);
+        offset = result.offsets[1];
+        assert result.offsets.tolist() == [0, len(G.nodes), len(G.nodes) + len(H.nodes)];
+        assert [result.values[i] for i in range(offset)] == [node.value for node in G.nodes];
+        relabeled = {frozenset(result.values[node.value] for node in edge) for edge in result.edges};
+        assert len(result.edges) == len(G.edges) + len(H.edges);
+        assert relabeled == edge_values(G) | edge_values(H);
+        for u, v in result.edges:
+            assert (u.value < offset) == (v.value < offset);
@@ -0,0 +1,65 @@
+import  numpy as np;
+import  pytest;
+from    model.GraphAnalytics                import component_sizes, connected_components, degree_histogram, degrees, reachable_counts;
+from    model.GraphGenerators               import edge_array, gnm, to_graph;
+from    model.primitives.datatypes.TGraph   import TGraph, TNode;
+from    model.primitives.datatypes.TNode    import getAdjacencyList;
+
+
+def reference_components(n: int, edges: np.ndarray) -> list[int]:
+    """
+    Union-find with path halving; every node is labeled by the smallest id of its component.
+    """
+    parent = list(range(n));
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]];
+            x = parent[x];
+        return x;
+    for u, v in edges.tolist():
+        ru, rv = find(u), find(v);
+        if ru != rv:
+            parent[max(ru, rv)] = min(ru, rv);
+    return [find(x) for x in range(n)];
+
+def random_edges(rng: np.random.Generator, n: int, m: int) -> np.ndarray:
+    return rng.integers(0, n, size=(m, 2));
+
+
+@pytest.mark.parametrize("n, m", [(1, 0), (10, 0), (50, 20), (500, 400), (500, 1500), (2000, 1000)])
+def test_components_match_union_find(n, m):
+    rng = np.random.default_rng(n + m);
+    for _ in range(5):
+        edges = random_edges(rng, n, m);
+        labels = connected_components(n, edges);
+        assert labels.tolist() == reference_components(n, edges);
+        sizes = component_sizes(labels);
+        assert sizes.sum() == n and (reachable_counts(n, edges) == sizes[labels]).all();
+
+def test_degrees_match_adjacency_list():
+    rng = np.random.default_rng(0);
+    edges = np.concatenate([random_edges(rng, 60, 200), [[3, 3], [4, 5], [5, 4]]]);
+    graph = to_graph(60, edges);
+    adjacency = {node.value: len(neighbors) for node, neighbors in getAdjacencyList(graph.edges).items()};
+    expected = [adjacency.get(i, 0) for i in range(60)];
+    assert degrees(60, edges).tolist() == expected;
+    assert degree_histogram(60, edges).tolist() == np.bincount(expected).tolist();
+    assert [graph.degree(node) for node in graph.nodes] == expected;
+    assert graph.maxdegree() == max(expected) and graph.mindegree() == min(expected);
+
+def test_tgraph_lookups_agree_on_duplicate_values():
+    a, b, c, d, again = TNode("a", 0), TNode("b", 1), TNode("c", 2), TNode("d", 3), TNode("a", 4);
+    graph = TGraph([a, b, c, d, again], [(a, b), (b, c), (again, d)]);
+    #   Both lookups map the value "a" to the same node of `arrays()`, whichever node is passed
+    assert graph.degree(a) == graph.degree(again) == 2;
+    assert graph.isReachable(a, d) and graph.isReachable(again, c);
+    with pytest.raises(ValueError):
+        graph.degree(TNode("z", 9));
+    with pytest.raises(ValueError):
+        graph.isReachable(a, TNode("z", 9));
+
+def test_tgraph_components():
+    graph = to_graph(8, edge_array(gnm(8, 0, seed=0)));
+    nodes, labels = graph.components();
+    assert len(set(labels.tolist())) == 8 and not graph.isReachable(nodes[0], nodes[1]);
+    assert graph.reachableCounts()[1].tolist() == [1] * 8;
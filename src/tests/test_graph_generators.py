@@ -0,0 +1,35 @@
+import  numpy as np;
+import  pytest;
+from    model.ConcreteDataTypes import Kn;
+from    model.EdgeKeys          import edge_set;
+from    model.GraphGenerators   import complete, edge_array, gnm, grid, random_regular;
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 52, 53, 60])
+def test_kn_has_integer_values_at_every_size(n):
+    graph = Kn(n);
+    assert [node.value for node in graph.nodes] == list(range(n));
+    assert len(graph.edges) == n * (n - 1) // 2;
+    assert len({frozenset((u.value, v.value)) for u, v in graph.edges}) == len(graph.edges);
+
+def test_negative_sizes_are_rejected():
+    with pytest.raises(ValueError, match="non-negative"):
+        Kn(-1);
+    with pytest.raises(ValueError, match="non-negative"):
+        edge_array(complete(-1));
+
+def test_chunks_cover_the_complete_graph():
+    edges = edge_array(complete(100, chunk_size=7));
+    assert len(edge_set(edges)) == len(edges) == 100 * 99 // 2;
+    assert (edges[:, 0] < edges[:, 1]).all();
+
+def test_gnm_draws_m_distinct_edges():
+    edges = edge_array(gnm(200, 1000, seed=0, chunk_size=64));
+    assert len(edges) == 1000 and len(edge_set(edges)) == 1000;
+    assert (edges[:, 0] != edges[:, 1]).all() and edges.min() >= 0 and edges.max() < 200;
+
+def test_grid_and_regular_degrees():
+    assert len(edge_array(grid((4, 5)))) == 4 * 4 + 3 * 5;
+    assert len(edge_array(grid((4, 5), periodic=True))) == 2 * 4 * 5;
+    edges = edge_array(random_regular(100, 3, seed=1));
+    assert (np.bincount(edges.ravel(), minlength=100) == 3).all();
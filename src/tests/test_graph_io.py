@@ -0,0 +1,53 @@
+import  numpy as np;
+import  pytest;
+from    model.GraphGenerators               import edge_array, gnm;
+from    model.GraphIO                       import convert_edge_list, csr_from_edges, load, read_graph, save, write_graph;
+from    model.primitives.datatypes.TGraph   import TGraph, TNode;
+
+
+def sorted_rows(indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray | None) -> list:
+    """
+    The (neighbor, weight) pairs of each row, sorted: `convert_edge_list` keeps the order of the text.
+    """
+    rows = [];
+    for i in range(len(indptr) - 1):
+        lo, hi = int(indptr[i]), int(indptr[i + 1]);
+        cols = np.asarray(indices[lo:hi]).tolist();
+        rows.append(sorted(zip(cols, [0.0] * len(cols) if weights is None else np.asarray(weights[lo:hi]).tolist())));
+    return rows;
+
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_convert_edge_list_matches_csr_from_edges(tmp_path, weighted, symmetric):
+    rng = np.random.default_rng(0);
+    edges = np.concatenate([edge_array(gnm(300, 2000, seed=1)), [[5, 5], [7, 7]], rng.integers(0, 300, (50, 2))]);
+    weights = np.round(rng.random(len(edges)), 3) if weighted else None;
+    source = tmp_path / "edges.txt";
+    with open(source, "w") as f:
+        f.write("# a comment line\n");
+        for i, (u, v) in enumerate(edges.tolist()):
+            f.write(f"{u} {v} {weights[i]}\n" if weighted else f"{u}\t{v}\n");
+
+    #   Small blocks, so the conversion goes through many chunks
+    graph = convert_edge_list(str(source), str(tmp_path / "edges.csr"), n=300, weighted=weighted,
+                              symmetric=symmetric, chunk_bytes=1 << 10);
+    indptr, indices, expected_weights = csr_from_edges(300, edges, weights, symmetric);
+    assert np.array_equal(graph.indptr, indptr);
+    assert sorted_rows(graph.indptr, graph.indices, graph.weights) == sorted_rows(indptr, indices, expected_weights);
+
+def test_save_and_load_round_trip(tmp_path):
+    edges = edge_array(gnm(100, 400, seed=2));
+    indptr, indices, _ = csr_from_edges(100, edges);
+    save(str(tmp_path / "g.csr"), indptr, indices, values=[f"v{i}" if i % 2 else i for i in range(100)]);
+    graph = load(str(tmp_path / "g.csr"));
+    assert np.array_equal(graph.indptr, indptr) and np.array_equal(graph.indices, indices);
+    assert graph.value(3) == "v3" and graph.value(4) == 4;
+    assert (graph.degrees() == np.diff(indptr)).all();
+
+def test_graph_round_trip(tmp_path):
+    nodes = [TNode("a", 0), TNode(1, 1), TNode("c", 2)];
+    graph = TGraph(nodes, [(nodes[0], nodes[1]), (nodes[1], nodes[2])]);
+    write_graph(str(tmp_path / "t.csr"), graph);
+    result = read_graph(str(tmp_path / "t.csr"));
+    assert sorted(map(str, (node.value for node in result.nodes))) == ["1", "a", "c"];
+    assert {frozenset((u.value, v.value)) for u, v in result.edges} == {frozenset(("a", 1)), frozenset((1, "c"))};
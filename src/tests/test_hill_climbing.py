@@ -0,0 +1,100 @@
+import  numpy as np;
+import  pytest;
+from    searching.SearchResult      import SearchStatus;
+from    searching.SearchStats       import SearchStats;
+from    searching.SudokuSearch      import hill_climbing;
+from    searching.sudoku            import Vectorized;
+from    searching.sudoku.Board      import SudokuBoard, b_1, solved_board;
+
+
+def pattern(n: int) -> np.ndarray:
+    """
+    A solved grid of box size `n`.
+    """
+    size = n * n;
+    return np.array([[(n * (r % n) + r // n + c) % size + 1 for c in range(size)] for r in range(size)], dtype=np.uint8);
+
+def cleared(grid: np.ndarray, count: int, seed: int) -> SudokuBoard:
+    grid = grid.copy();
+    grid.ravel()[np.random.default_rng(seed).choice(grid.size, count, replace=False)] = 0;
+    return SudokuBoard(grid, grid != 0);
+
+def rescore(grid: np.ndarray, n: int) -> int:
+    g = Vectorized.geometry(n);
+    return int(Vectorized.conflicts(grid, g.units[g.size:], n)[0]);
+
+
+@pytest.mark.parametrize("n, givens", [(2, 6), (3, 30), (3, 0)])
+def test_deltas_match_a_full_rescore(n, givens):
+    rng = np.random.default_rng(n + givens);
+    board = cleared(pattern(n), n ** 4 - givens, seed=givens);
+    scorer = Vectorized.RowSwapScorer(board.fixed);
+    scorer.reset(Vectorized.fill_rows(board.grid, board.fixed, rng)[0]);
+    assert scorer.score == rescore(scorer.grid, n);
+    for _ in range(200):
+        deltas = scorer.deltas();
+        before = scorer.grid.copy();
+        for move in rng.choice(len(deltas), 5):
+            a, b = scorer.swaps[move];
+            after = before.copy();
+            after[a], after[b] = before[b], before[a];
+            assert deltas[move] == rescore(after, n) - rescore(before, n);
+        move = int(rng.integers(len(deltas)));
+        assert scorer.apply(move) == deltas[move];
+        assert scorer.score == rescore(scorer.grid, n);
+
+def test_given_cells_never_move(monkeypatch):
+    board = SudokuBoard.from_string(b_1);
+    fixed = board.fixed.ravel();
+    moved = [];
+    original = Vectorized.RowSwapScorer.apply;
+
+    def apply(self, move):
+        moved.extend(self.swaps[move].tolist());
+        return original(self, move);
+
+    monkeypatch.setattr(Vectorized.RowSwapScorer, "apply", apply);
+    result = hill_climbing(board, niter=2000, restarts=3, rng=np.random.default_rng(0));
+    assert moved and not fixed[moved].any();
+    grid = result.state.board.grid;
+    assert (grid[board.fixed] == board.grid[board.fixed]).all();
+    assert all(sorted(row) == list(range(1, 10)) for row in grid.tolist());
+
+@pytest.mark.parametrize("max_sideways, restarts", [(0, 0), (5, 2), (20, 4)])
+def test_sideways_moves_and_restarts_respect_their_limits(monkeypatch, max_sideways, restarts):
+    board = SudokuBoard.from_string(b_1);
+    steps = [];
+    original_apply, original_reset = Vectorized.RowSwapScorer.apply, Vectorized.RowSwapScorer.reset;
+
+    def apply(self, move):
+        delta = original_apply(self, move);
+        steps.append(delta);
+        return delta;
+
+    def reset(self, grid):
+        steps.append(None);
+        original_reset(self, grid);
+
+    monkeypatch.setattr(Vectorized.RowSwapScorer, "apply", apply);
+    monkeypatch.setattr(Vectorized.RowSwapScorer, "reset", reset);
+    stats = SearchStats("hill_climbing");
+    result = hill_climbing(board, niter=100000, max_sideways=max_sideways, restarts=restarts,
+                           rng=np.random.default_rng(1), stats=stats);
+
+    #   b_1 is hard for hill climbing: the restarts run out long before the steps
+    assert result.status is SearchStatus.EXHAUSTED;
+    assert steps.count(None) == restarts + 1 == stats.counters.get("restarts", 0) + 1;
+    sideways = 0;
+    for delta in steps:
+        assert delta is None or delta <= 0;
+        sideways = sideways + 1 if delta == 0 else 0;
+        assert sideways <= max_sideways;
+    assert result.cost == rescore(result.state.board.grid.ravel(), 3) > 0;
+
+@pytest.mark.parametrize("first_improvement", [False, True])
+def test_a_solved_result_is_a_valid_grid(first_improvement):
+    board = cleared(SudokuBoard.from_string(solved_board).grid, 20, seed=2);
+    result = hill_climbing(board, first_improvement=first_improvement, rng=np.random.default_rng(2));
+    assert result.status is SearchStatus.SOLVED and result.cost == 0;
+    assert result.state.board.is_solved();
+    assert (result.state.board.grid[board.fixed] == board.grid[board.fixed]).all();
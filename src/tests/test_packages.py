@@ -0,0 +1,36 @@
+import  os;
+import  subprocess;
+import  sys;
+import  pytest;
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)));
+
+
+def loads_numpy(code: str) -> bool:
+    """
+    Whether running `code` in a fresh interpreter imports NumPy.
+    """
+    result = subprocess.run([sys.executable, "-c", f"{code}; import sys; print('numpy' in sys.modules)"],
+                            cwd=SRC, capture_output=True, text=True, check=True);
+    return result.stdout.strip() == "True";
+
+@pytest.mark.parametrize("code", [
+    "import searching, model",
+    "from searching import ida_star, SlidingPuzzle",
+    "from model import UAGraph, TGraph, TNode, EmptyGraph",
+])
+def test_imports_do_not_load_numpy(code):
+    assert not loads_numpy(code);
+
+def test_array_methods_load_numpy_on_use():
+    assert loads_numpy("from model import Kn; Kn(4).degrees()");
+
+def test_exports_and_submodules_are_consistent():
+    import searching, searching.puzzle, searching.sudoku;
+    from searching.puzzle.SlidingPuzzle import SlidingPuzzle;
+    assert searching.SlidingPuzzle is SlidingPuzzle;
+    assert searching.puzzle.SlidingPuzzle.SlidingPuzzle is SlidingPuzzle;
+    assert "SlidingPuzzle" in dir(searching.puzzle) and "Board" in dir(searching.sudoku);
+    assert set(searching.__all__) <= set(dir(searching));
+    with pytest.raises(AttributeError):
+        searching.missing;
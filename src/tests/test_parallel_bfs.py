@@ -0,0 +1,52 @@
+import  numpy as np;
+import  pytest;
+from    collections             import deque;
+from    concurrent.futures      import ProcessPoolExecutor;
+from    model.GraphGenerators   import edge_array, gnm, grid;
+from    model.GraphIO           import CSRGraph, csr_from_edges;
+from    model.ParallelBFS       import parallel_bfs;
+
+
+def plain_bfs(graph: CSRGraph, source: int) -> np.ndarray:
+    dist = np.full(len(graph.indptr) - 1, -1, dtype=np.int64);
+    dist[source] = 0;
+    queue = deque([source]);
+    while queue:
+        u = queue.popleft();
+        for v in graph.neighbors(u).tolist():
+            if dist[v] < 0:
+                dist[v] = dist[u] + 1;
+                queue.append(v);
+    return dist;
+
+def assert_bfs_tree(graph: CSRGraph, source: int, dist: np.ndarray, parent: np.ndarray) -> None:
+    assert np.array_equal(dist, plain_bfs(graph, source));
+    assert parent[source] == source and (parent[dist < 0] == -1).all();
+    for v in np.flatnonzero(dist > 0).tolist():
+        assert dist[parent[v]] == dist[v] - 1 and v in graph.neighbors(int(parent[v])).tolist();
+
+@pytest.fixture(scope="module")
+def graphs() -> list[CSRGraph]:
+    #   A sparse random graph with isolated vertices, a dense one that switches to bottom-up, and a grid
+    return [CSRGraph(*csr_from_edges(2000, edge_array(gnm(2000, 1500, seed=0)))),
+            CSRGraph(*csr_from_edges(2000, edge_array(gnm(2000, 40000, seed=1)))),
+            CSRGraph(*csr_from_edges(900, edge_array(grid((30, 30)))))];
+
+
+def test_sequential_levels_match_plain_bfs(graphs):
+    for graph in graphs:
+        for source in (0, 17):
+            assert_bfs_tree(graph, source, *parallel_bfs(graph, source));
+
+def test_parallel_levels_match_plain_bfs(graphs):
+    for graph in graphs:
+        assert_bfs_tree(graph, 3, *parallel_bfs(graph, 3, max_workers=2));
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for graph in graphs:
+            assert_bfs_tree(graph, 5, *parallel_bfs(graph, 5, max_workers=2, executor=executor));
+
+def test_invalid_arguments(graphs):
+    with pytest.raises(ValueError):
+        parallel_bfs(graphs[0], len(graphs[0]));
+    with pytest.raises(ValueError):
+        parallel_bfs(graphs[0], 0, max_workers=0);
@@ -0,0 +1,84 @@
+import  random;
+import  pytest;
+from    searching                   import Progress;
+from    searching.Progress          import ProgressReporter, as_progress;
+from    searching.SearchResult      import SearchResult, SearchStatus;
+from    searching.SearchStats       import SearchStats;
+from    searching.SudokuSearch      import random_walk;
+from    searching.sudoku.Board      import SudokuBoard, b_1;
+from    searching.sudoku.GameState  import GameState;
+
+
+class Clock:
+    """
+    A settable replacement for `time.monotonic`.
+    """
+    def __init__(self, now: float = 100.0):
+        self.now = now;
+
+    def __call__(self) -> float:
+        return self.now;
+
+
+def test_reports_are_throttled_to_the_interval(monkeypatch):
+    clock = Clock();
+    monkeypatch.setattr(Progress.time, "monotonic", clock);
+    calls = [];
+    reporter = ProgressReporter(calls.append, interval=1.0, every=10);
+
+    #   The first report goes through, then at most one per second
+    for now, iteration in [(100.0, 0), (100.5, 10), (100.99, 20), (101.0, 30), (101.2, 40), (103.0, 50)]:
+        clock.now = now;
+        reporter.report(iteration, frontier=iteration * 2);
+    assert [c["iteration"] for c in calls] == [0, 30, 50];
+    assert [c["elapsed"] for c in calls] == [0.0, 1.0, 3.0];
+    assert [c["frontier"] for c in calls] == [0, 60, 100];
+
+def test_zero_interval_reports_every_call(monkeypatch):
+    monkeypatch.setattr(Progress.time, "monotonic", Clock());
+    calls = [];
+    reporter = ProgressReporter(calls.append, interval=0, every=1);
+    for i in range(5):
+        reporter.report(i);
+    assert [c["iteration"] for c in calls] == list(range(5));
+
+def test_every_must_be_positive():
+    with pytest.raises(ValueError):
+        ProgressReporter(print, every=0);
+
+def test_as_progress_wraps_callables_and_passes_reporters_and_none():
+    assert as_progress(None) is None;
+    reporter = ProgressReporter(print, interval=0.5, every=3);
+    assert as_progress(reporter) is reporter;
+    calls = [];
+    wrapped = as_progress(calls.append);
+    assert isinstance(wrapped, ProgressReporter) and wrapped.callback == calls.append;
+    assert (wrapped.interval, wrapped.every) == (1.0, 100);
+    wrapped.report(7, frontier=1);
+    assert calls[0]["iteration"] == 7 and calls[0]["frontier"] == 1;
+
+def test_searches_report_through_a_plain_callable():
+    calls = [];
+    random_walk(SudokuBoard.from_string(b_1), niter=300, progress=calls.append, rng=random.Random(0));
+    #   The default reporter consults the clock every 100 iterations and reports once per second
+    assert calls[0]["iteration"] == 0 and all(c["iteration"] % 100 == 0 for c in calls);
+    assert set(calls[0]) == {"iteration", "elapsed", "frontier"};
+
+    calls = [];
+    result = random_walk(SudokuBoard.from_string(b_1), niter=300, progress=ProgressReporter(calls.append, 0, 50),
+                         rng=random.Random(0));
+    assert [c["iteration"] for c in calls] == list(range(0, result.iterations, 50));
+
+def test_random_walk_returns_a_search_result():
+    board = SudokuBoard.from_string(b_1);
+    stats = SearchStats("random_walk");
+    result = random_walk(board, niter=50, stats=stats, rng=random.Random(0));
+    assert isinstance(result, SearchResult) and not isinstance(result, tuple);
+    assert isinstance(result.state, GameState) and result.status is SearchStatus.ITERATION_LIMIT;
+    assert result.iterations == 50 and result.stats is stats and stats.expanded_nodes == 50;
+    assert not result and result.path is None and result.cost is None;
+    #   The best state reached is returned when the walk stops early
+    assert result.state.moves > 0 and (result.state.board.grid[board.fixed] == board.grid[board.fixed]).all();
+
+    solved = random_walk(board, niter=100000, rng=random.Random(0));
+    assert solved.status is SearchStatus.SOLVED and solved and solved.state.board.is_solved();
@@ -0,0 +1,74 @@
+import  numpy as np;
+import  pytest;
+from    searching.sudoku.Board          import SudokuBoard, b_1;
+from    searching.sudoku.Propagation    import candidate_masks, count_solutions, search, solve_boards;
+
+
+def reference_count(grid: list[int], n: int, limit: int) -> int:
+    """
+    Counts the solutions of a flattened grid up to `limit` by plain backtracking, without propagation.
+    """
+    size = n * n;
+    grid = list(grid);
+
+    def allowed(cell: int, value: int) -> bool:
+        row, col = divmod(cell, size);
+        box = (row // n * n, col // n * n);
+        for i in range(size):
+            if grid[row * size + i] == value or grid[i * size + col] == value:
+                return False;
+            if grid[(box[0] + i // n) * size + box[1] + i % n] == value:
+                return False;
+        return True;
+
+    def count() -> int:
+        if 0 not in grid:
+            return 1;
+        cell = grid.index(0);
+        found = 0;
+        for value in range(1, size + 1):
+            if allowed(cell, value):
+                grid[cell] = value;
+                found += count();
+                grid[cell] = 0;
+                if found >= limit:
+                    break;
+        return found;
+    return min(count(), limit);
+
+def punctured(solution: np.ndarray, holes: int, rng: np.random.Generator) -> np.ndarray:
+    grid = solution.copy();
+    grid[rng.choice(len(grid), size=holes, replace=False)] = 0;
+    return grid;
+
+
+def test_empty_4x4_board_has_288_solutions():
+    counts, _ = count_solutions(candidate_masks(np.zeros((1, 16), dtype=np.uint8), 2), 2, limit=1000);
+    assert counts.tolist() == [288];
+
+@pytest.mark.parametrize("n, holes, limit", [(2, 10, 1000), (3, 50, 20)])
+def test_counts_match_plain_backtracking(n, holes, limit):
+    rng = np.random.default_rng(n);
+    #   Random solutions: the first solution of each search, trying candidates in random order
+    empty = candidate_masks(np.zeros((1, n ** 4), dtype=np.uint8), n)[0];
+    grids = np.stack([punctured(search(empty, n, rng=rng)[0][0], holes, rng) for _ in range(12)]);
+    counts, _ = count_solutions(candidate_masks(grids, n), n, limit=limit);
+    assert counts.tolist() == [reference_count(grid.tolist(), n, limit) for grid in grids];
+
+def test_search_finds_distinct_solutions_matching_the_count():
+    rng = np.random.default_rng(3);
+    empty = candidate_masks(np.zeros((1, 81), dtype=np.uint8), 3)[0];
+    grid = punctured(search(empty, 3, rng=rng)[0][0], 55, rng);
+    masks = candidate_masks(grid[None], 3);
+    count = count_solutions(masks, 3, limit=50)[0][0];
+    found, _ = search(masks[0], 3, limit=50);
+    assert len({solution.tobytes() for solution in found}) == len(found) == count;
+    for solution in found:
+        assert (solution[grid != 0] == grid[grid != 0]).all();
+
+def test_b_1_is_unique_and_solved_by_propagation():
+    board = SudokuBoard.from_string(b_1);
+    counts, _ = count_solutions(candidate_masks(board.grid[None], 3), 3);
+    assert counts.tolist() == [1];
+    solution, = solve_boards([board]);
+    assert solution is not None and solution.is_solved();
@@ -0,0 +1,71 @@
+import  random;
+import  pytest;
+from    collections                     import deque;
+from    searching.PuzzleSearch          import ara_star, ida_star, rbfs, sma_star;
+from    searching.SearchResult          import SearchStatus;
+from    searching.TranspositionTable    import TranspositionTable;
+from    searching.puzzle.SlidingPuzzle  import SlidingPuzzle;
+
+GOAL : list[int] = [1, 2, 3, 4, 5, 6, 7, 8, 0];
+
+
+@pytest.fixture(scope="module")
+def distances() -> dict[int, int]:
+    """
+    The BFS distance to the goal of every state of the 8-puzzle: moves are reversible, so one BFS from
+    the goal covers all the instances.
+    """
+    puzzle = SlidingPuzzle(GOAL);
+    distance = {puzzle.goal: 0};
+    queue = deque([puzzle.goal]);
+    while queue:
+        state = queue.popleft();
+        for successor, _ in puzzle.successors(state):
+            if successor not in distance:
+                distance[successor] = distance[state] + 1;
+                queue.append(successor);
+    assert len(distance) == 181440;
+    return distance;
+
+def instances(count: int, seed: int) -> list[SlidingPuzzle]:
+    rng = random.Random(seed);
+    puzzles = [];
+    while len(puzzles) < count:
+        tiles = rng.sample(range(9), 9);
+        puzzle = SlidingPuzzle(tiles);
+        if puzzle.is_solvable():
+            puzzles.append(puzzle);
+    return puzzles;
+
+def assert_valid_path(puzzle: SlidingPuzzle, result) -> None:
+    path = result.path;
+    assert path[0] == puzzle.initial() and puzzle.is_goal(path[-1]);
+    for state, successor in zip(path, path[1:]):
+        assert successor in [s for s, _ in puzzle.successors(state)];
+    assert len(path) - 1 == result.cost;
+
+
+@pytest.mark.parametrize("search", [
+    ida_star,
+    lambda puzzle: ida_star(puzzle, table=TranspositionTable(1 << 12)),
+    rbfs,
+    sma_star,
+    lambda puzzle: sma_star(puzzle, max_nodes=300),
+], ids=["ida_star", "ida_star_table", "rbfs", "sma_star", "sma_star_bounded"])
+def test_optimal_searches_match_bfs(search, distances):
+    for puzzle in instances(5, seed=1):
+        result = search(puzzle);
+        assert result.status is SearchStatus.SOLVED;
+        assert result.cost == distances[puzzle.initial()];
+        assert_valid_path(puzzle, result);
+
+def test_ara_star_improves_down_to_the_optimal_cost(distances):
+    for puzzle in instances(5, seed=2):
+        results = list(ara_star(puzzle, epsilon=3.0, decrement=0.5));
+        costs = [result.cost for result in results];
+        assert all(result.status is SearchStatus.SOLVED for result in results);
+        assert costs == sorted(costs, reverse=True);
+        for result in results:
+            assert result.cost <= result.bound * distances[puzzle.initial()];
+            assert_valid_path(puzzle, result);
+        assert results[-1].bound == 1 and costs[-1] == distances[puzzle.initial()];
@@ -0,0 +1,32 @@
+import  csv;
+import  json;
+import  pytest;
+from    searching.SearchStats   import CSV_FIELDS, CSVSink, SearchStats;
+
+
+def test_csv_sink_keeps_counters_first_seen_in_later_records(tmp_path):
+    path = str(tmp_path / "stats.csv");
+    first = SearchStats("first", sinks=[CSVSink(path)]);
+    first.finish();
+    second = SearchStats("second", sinks=[CSVSink(path)]);
+    second.count("runs", 3);
+    second.finish();
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f));
+    assert list(rows[0]) == list(CSV_FIELDS);
+    assert [row["name"] for row in rows] == ["first", "second"];
+    assert json.loads(rows[0]["counters"]) == {};
+    assert json.loads(rows[1]["counters"]) == {"runs": 3};
+
+def test_csv_sink_refuses_a_file_with_other_columns(tmp_path):
+    path = tmp_path / "stats.csv";
+    path.write_text("name,expanded_nodes\nold,1\n");
+    with pytest.raises(ValueError):
+        CSVSink(str(path)).write(SearchStats("new").as_dict());
+
+def test_csv_line_matches_the_header():
+    stats = SearchStats("line");
+    stats.count("runs");
+    row = next(csv.reader([stats.csv_line()]));
+    assert len(row) == len(stats.csv_header().split(","));
+    assert json.loads(row[CSV_FIELDS.index("counters")]) == {"runs": 1};
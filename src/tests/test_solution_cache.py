@@ -0,0 +1,95 @@
+import  numpy as np;
+import  pytest;
+from    searching                       import SudokuSearch;
+from    searching.GeneticSearch         import genetic_algorithm;
+from    searching.SearchResult          import SearchStatus;
+from    searching.SearchStats           import SearchStats;
+from    searching.SolutionCache         import SolutionCache, canonical_form;
+from    searching.sudoku.Board          import SudokuBoard, b_1, solved_board;
+from    searching.sudoku.Propagation    import solve_boards;
+
+
+def _transform(grid: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Returns a random equivalent of a 9x9 grid: transposed or not, bands and stacks permuted, digits relabeled.
+    """
+    grid = grid.T if rng.random() < 0.5 else grid;
+    rows = np.concatenate([np.arange(3 * b, 3 * b + 3) for b in rng.permutation(3)]);
+    cols = np.concatenate([np.arange(3 * s, 3 * s + 3) for s in rng.permutation(3)]);
+    labels = np.concatenate([[0], rng.permutation(9) + 1]).astype(grid.dtype);
+    return labels[grid[rows][:, cols]];
+
+def _board(grid: np.ndarray) -> SudokuBoard:
+    return SudokuBoard(grid.copy(), grid != 0);
+
+
+def test_equivalent_grids_share_their_canonical_form():
+    rng = np.random.default_rng(0);
+    grid = SudokuBoard.from_string(b_1).grid;
+    canonical = canonical_form(grid)[0];
+    for _ in range(10):
+        assert canonical_form(_transform(grid, rng))[0] == canonical;
+
+def test_equivalent_board_is_answered_from_the_cache():
+    rng = np.random.default_rng(1);
+    board = SudokuBoard.from_string(b_1);
+    solution, = solve_boards([board]);
+    cache = SolutionCache();
+    cache.put_board(board, solution);
+    for _ in range(10):
+        equivalent = _board(_transform(board.grid, rng));
+        found = cache.get_board(equivalent);
+        assert found is not None and found.is_solved();
+        givens = equivalent.grid != 0;
+        assert (found.grid[givens] == equivalent.grid[givens]).all();
+    assert cache.hits == 10 and cache.misses == 0;
+
+def test_symmetry_lookup_can_be_disabled():
+    rng = np.random.default_rng(2);
+    board = SudokuBoard.from_string(b_1);
+    solution, = solve_boards([board]);
+    cache = SolutionCache(symmetry=False);
+    cache.put_board(board, solution);
+    assert cache.get_board(board) is not None;
+    assert cache.get_board(_board(_transform(board.grid, rng))) is None;
+
+def test_lru_evicts_and_sqlite_store_keeps_entries(tmp_path):
+    path = str(tmp_path / "solutions.db");
+    cache = SolutionCache(maxsize=2, path=path);
+    for i in range(3):
+        cache.put(bytes([i]), bytes([i, i]));
+    assert len(cache) == 2;
+    cache.close();
+    assert SolutionCache(path=path).get(bytes([0])) == bytes([0, 0]);
+
+@pytest.mark.parametrize("solver", [
+    SudokuSearch.random_walk, SudokuSearch.beam_search, SudokuSearch.stochastic_beam_search,
+    SudokuSearch.hill_climbing, genetic_algorithm,
+])
+def test_solvers_answer_from_the_cache_and_store_solutions(solver):
+    rng = np.random.default_rng(3);
+    #   A board these solvers solve quickly: the solved board with a few cells cleared
+    grid = SudokuBoard.from_string(solved_board).grid.copy();
+    grid.ravel()[rng.choice(81, 6, replace=False)] = 0;
+    board = _board(grid);
+
+    cache = SolutionCache();
+    solved = solver(board, cache=cache);
+    assert solved.status is SearchStatus.SOLVED and len(cache) > 0;
+
+    #   An equivalent board is answered without searching
+    equivalent = _board(_transform(grid, rng));
+    stats = SearchStats(solver.__name__);
+    result = solver(equivalent, cache=cache, stats=stats);
+    assert result.status is SearchStatus.SOLVED and result.iterations == 0 and stats.expanded_nodes == 0;
+    assert result.state.board.is_solved() and cache.hits == 1;
+    givens = equivalent.grid != 0;
+    assert (result.state.board.grid[givens] == equivalent.grid[givens]).all();
+
+def test_solve_boards_only_solves_the_misses():
+    board = SudokuBoard.from_string(b_1);
+    cache = SolutionCache();
+    first, unsolvable = solve_boards([board, _board(np.full((9, 9), 1, dtype=board.grid.dtype))], cache=cache);
+    assert first.is_solved() and unsolvable is None and cache.misses == 2;
+    again, = solve_boards([board], cache=cache);
+    assert cache.hits == 1 and (again.grid == first.grid).all();
@@ -0,0 +1,128 @@
+import  asyncio;
+import  threading;
+import  pytest;
+from    concurrent.futures          import ThreadPoolExecutor;
+from    searching.SearchResult      import SearchStatus;
+from    searching.SolutionCache     import SolutionCache;
+from    searching.SolveService      import SolveService, _solve_batch, solve_sudoku, sudoku_key;
+from    searching.sudoku.Board      import b_1;
+
+
+def square(x: int) -> int:
+    """
+    A picklable solver; negative puzzles are invalid.
+    """
+    if x < 0:
+        raise ValueError(f"invalid puzzle {x}");
+    return x * x;
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """
+    An in-process executor recording the batches it is given and the calls of the solver.
+    """
+    def __init__(self):
+        super().__init__(max_workers=1);
+        self.batches : list[list[int]] = [];
+        self.calls : list[int] = [];
+        self.lock = threading.Lock();
+
+    def submit(self, fn, *args, **kwargs):
+        assert fn is _solve_batch;
+        solver, puzzles = args;
+        self.batches.append(list(puzzles));
+        def counted(x):
+            with self.lock:
+                self.calls.append(x);
+            return solver(x);
+        return super().submit(fn, counted, puzzles);
+
+def run(service: SolveService, schedule) -> list:
+    """
+    Runs `schedule(service)` inside the service and returns its result, shutting the executor down after.
+    """
+    async def main():
+        async with service:
+            return await schedule(service);
+    try:
+        return asyncio.run(main());
+    finally:
+        if service._executor is not None:
+            service._executor.shutdown();
+
+
+def test_batches_are_cut_at_max_batch():
+    executor = RecordingExecutor();
+    service = SolveService(square, key=lambda x: x, batch_window=0.2, max_batch=3, max_workers=1, executor=executor);
+    results = run(service, lambda s: asyncio.gather(*(s.solve(x) for x in range(7))));
+    assert results == [x * x for x in range(7)];
+    assert executor.batches == [[0, 1, 2], [3, 4, 5], [6]];
+
+def test_batches_are_cut_at_the_window():
+    executor = RecordingExecutor();
+    service = SolveService(square, key=lambda x: x, batch_window=0.02, max_batch=64, max_workers=1, executor=executor);
+
+    async def schedule(s):
+        first = asyncio.gather(s.solve(1), s.solve(2));
+        await asyncio.sleep(0.2);
+        return await first + [await s.solve(3)];
+
+    assert run(service, schedule) == [1, 4, 9];
+    assert executor.batches == [[1, 2], [3]];
+
+def test_duplicates_in_flight_share_one_solver_call():
+    executor = RecordingExecutor();
+    service = SolveService(key=sudoku_key, batch_window=0.05, max_workers=1, executor=executor);
+    #   Differently formatted copies of one board share a key
+    copies = [b_1, " ".join(b_1.split()), "\n".join(b_1.split()), b_1];
+    results = run(service, lambda s: asyncio.gather(*(s.solve(p) for p in copies)));
+    assert len(executor.calls) == 1;
+    assert all(r == results[0] for r in results);
+    assert results[0] == solve_sudoku(b_1);
+
+def test_a_bad_puzzle_fails_alone():
+    executor = RecordingExecutor();
+    service = SolveService(square, key=lambda x: x, batch_window=0.05, max_workers=1, executor=executor);
+    results = run(service, lambda s: asyncio.gather(s.solve(2), s.solve(-1), s.solve(3), return_exceptions=True));
+    assert executor.batches == [[2, -1, 3]];
+    assert results[0] == 4 and results[2] == 9;
+    assert isinstance(results[1], ValueError);
+
+def test_close_shuts_down_the_private_pool():
+    service = SolveService(square, key=lambda x: x, max_workers=1);
+
+    async def main():
+        async with service:
+            assert await service.solve(4) == 16;
+            return service._executor;
+
+    executor = asyncio.run(main());
+    assert service._executor is None and service._batcher is None;
+    with pytest.raises(RuntimeError):
+        executor.submit(square, 1);
+
+def test_close_leaves_a_given_executor_running():
+    executor = RecordingExecutor();
+    service = SolveService(square, key=lambda x: x, max_workers=1, executor=executor);
+
+    async def main():
+        async with service:
+            await service.solve(5);
+        return executor.submit(_solve_batch, square, [6]).result();
+
+    try:
+        assert asyncio.run(main()) == [(True, 36)];
+    finally:
+        executor.shutdown();
+
+def test_cached_puzzles_do_not_reach_the_pool():
+    executor = RecordingExecutor();
+    service = SolveService(key=sudoku_key, batch_window=0.01, max_workers=1, executor=executor,
+                           cache=SolutionCache());
+
+    async def schedule(s):
+        first = await s.solve(b_1);
+        return first, await s.solve(" ".join(b_1.split()));
+
+    first, second = run(service, schedule);
+    assert first[0] == SearchStatus.SOLVED.value and second == first;
+    assert len(executor.calls) == 1 and service.cache.hits == 1;